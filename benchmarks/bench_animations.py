@@ -0,0 +1,72 @@
+"""Бенчмарк одновременных переворотов карточек.
+
+Переворачивает сразу все карточки сетки (16, 256 и 1024 карточки)
+через CardAnimator и считает, сколько кадров выполнил драйвер анимаций
+за время переворота, то есть достигнутую частоту кадров, на
+offscreen-платформе Qt.
+
+Запуск:
+    python -m benchmarks.bench_animations [карточек ...]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QIcon, QPixmap  # noqa: E402
+from PyQt5.QtWidgets import (  # noqa: E402
+    QApplication,
+    QGridLayout,
+    QPushButton,
+    QWidget,
+)
+
+from myself_moduls.card_animations import CardAnimator  # noqa: E402
+
+
+def measure(count, duration=200):
+    """Возвращает (кадров в секунду, мс на запуск всех переворотов)."""
+    board = QWidget()
+    board.resize(900, 900)
+    layout = QGridLayout(board)
+    side = int(count**0.5)
+    cards = []
+    for i in range(count):
+        card = QPushButton(board)
+        layout.addWidget(card, i // side, i % side)
+        cards.append(card)
+    board.show()
+    QApplication.processEvents()
+    pixmap = QPixmap(64, 64)
+    pixmap.fill()
+    icon = QIcon(pixmap)
+    animator = CardAnimator(board)
+
+    start = time.perf_counter()
+    for card in cards:
+        animator.flip(card, icon, duration)
+    start_ms = (time.perf_counter() - start) * 1000
+    ticks = animator.driver.ticks
+    start = time.perf_counter()
+    while len(animator.driver):
+        QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    board.deleteLater()
+    return (animator.driver.ticks - ticks) / elapsed, start_ms
+
+
+def main(counts=(16, 256, 1024)):
+    """Печатает частоту кадров при одновременном перевороте карточек."""
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    for count in counts:
+        fps, start_ms = measure(count)
+        print(
+            f"{count:5} карточек  запуск {start_ms:8.1f} мс  "
+            f"{fps:6.1f} кадров/с"
+        )
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (16, 256, 1024))
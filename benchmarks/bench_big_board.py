@@ -0,0 +1,63 @@
+"""Бенчмарк больших полей: открытие уровня и переворот карточек.
+
+Для полей от 4x4 до 32x32 замеряет время создания окна игры
+(построение сетки карточек и подготовка уровня) и среднее время
+обработки нажатия на карточку при открытии всех пар, кроме последней,
+на offscreen-платформе Qt.
+
+Запуск:
+    python -m benchmarks.bench_big_board [сторона ...]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from memory_game import MemoryGame  # noqa: E402
+from myself_moduls.level_manager import LevelManager  # noqa: E402
+
+
+def measure_board(side):
+    """Возвращает (время открытия мс, нажатий, среднее мс на нажатие)."""
+    start = time.perf_counter()
+    window = MemoryGame(level_manager=LevelManager(board_side=side))
+    window.show()
+    QApplication.processEvents()
+    open_ms = (time.perf_counter() - start) * 1000
+
+    pairs = {}
+    for index, image in enumerate(window.images[: len(window.cards)]):
+        pairs.setdefault(image, []).append(index)
+    order = [i for indices in pairs.values() for i in indices][:-2]
+
+    start = time.perf_counter()
+    for index in order:
+        window.press_card(index)
+    QApplication.processEvents()
+    press_ms = (time.perf_counter() - start) * 1000 / max(len(order), 1)
+
+    window.prefetcher.shutdown()
+    window.deleteLater()
+    QApplication.processEvents()
+    return open_ms, len(order), press_ms
+
+
+def main(sides=(4, 8, 16, 32)):
+    """Печатает время открытия и нажатий для каждого размера поля."""
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    for side in sides:
+        open_ms, presses, press_ms = measure_board(side)
+        print(
+            f"{side:2}x{side:<2} ({side * side:4} карточек)  "
+            f"открытие {open_ms:8.1f} мс  "
+            f"{presses:4} нажатий по {press_ms:6.3f} мс"
+        )
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (4, 8, 16, 32))
@@ -0,0 +1,77 @@
+"""Бенчмарк отрисовки теней карточек: эффект Qt против слоя теней.
+
+Для сетки из 16 и 256 карточек замеряет среднее время полной
+отрисовки виджета (QWidget.grab) с QGraphicsDropShadowEffect на каждой
+карточке и с одним CardShadowLayer (myself_moduls/card_shadow.py) на
+offscreen-платформе Qt.
+
+Запуск:
+    python -m benchmarks.bench_card_shadows [повторов]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QColor  # noqa: E402
+from PyQt5.QtWidgets import (  # noqa: E402
+    QApplication,
+    QGraphicsDropShadowEffect,
+    QGridLayout,
+    QPushButton,
+    QWidget,
+)
+
+from myself_moduls.card_shadow import CardShadowLayer  # noqa: E402
+
+
+def build_board(count, use_layer):
+    """Создаёт виджет с сеткой карточек и тенями выбранного вида."""
+    board = QWidget()
+    board.resize(800, 800)
+    layout = QGridLayout(board)
+    side = int(count**0.5)
+    cards = []
+    for i in range(count):
+        card = QPushButton(board)
+        layout.addWidget(card, i // side, i % side)
+        cards.append(card)
+    if use_layer:
+        CardShadowLayer(board).set_cards(cards)
+    else:
+        for card in cards:
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(30)
+            shadow.setOffset(10, 10)
+            shadow.setColor(QColor(120, 110, 140, 60))
+            card.setGraphicsEffect(shadow)
+    board.show()
+    QApplication.processEvents()
+    return board
+
+
+def measure(board, repeats):
+    """Возвращает среднее время полной отрисовки в миллисекундах."""
+    board.grab()  # прогрев: размытие тени слоя выполняется здесь
+    start = time.perf_counter()
+    for _ in range(repeats):
+        board.grab()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main(repeats=20):
+    """Печатает время отрисовки для 16 и 256 карточек."""
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    for count in (16, 256):
+        effect_ms = measure(build_board(count, use_layer=False), repeats)
+        layer_ms = measure(build_board(count, use_layer=True), repeats)
+        print(
+            f"{count:3} карточек  эффект {effect_ms:8.2f} мс  "
+            f"слой теней {layer_ms:8.2f} мс  (x{effect_ms / layer_ms:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,60 @@
+"""Бенчмарк игрового движка без Qt.
+
+Играет случайные партии на доске из 16 карточек и считает, сколько
+ходов (переворотов карточек) в секунду обрабатывает GameEngine.
+
+Запуск:
+    python -m benchmarks.bench_game_engine
+"""
+
+import random
+import time
+
+from myself_moduls.game_engine import GameEngine
+
+
+def simulate_games(games=5000, pairs=8, seed=0):
+    """Играет случайные партии до победы и считает перевороты карточек.
+
+    Args:
+        games: Количество партий.
+        pairs: Количество пар на доске.
+        seed: Зерно генератора случайных чисел.
+
+    Returns:
+        int: Общее количество перевернутых карточек.
+    """
+    rng = random.Random(seed)
+    images = list(range(pairs)) * 2
+    engine = GameEngine()
+    flips = 0
+    for _ in range(games):
+        rng.shuffle(images)
+        engine.new_board(images, moves=10**9)
+        closed = list(range(len(images)))
+        while not engine.is_won():
+            index_1, index_2 = rng.sample(closed, 2)
+            engine.turn(index_1)
+            engine.turn(index_2)
+            flips += 2
+            index_1, index_2, match = engine.check_match()
+            engine.apply_match(index_1, index_2, match)
+            if match:
+                closed.remove(index_1)
+                closed.remove(index_2)
+            else:
+                engine.hide_cards(index_1, index_2)
+    return flips
+
+
+def main():
+    """Запускает бенчмарк и печатает результат."""
+    start = time.perf_counter()
+    flips = simulate_games()
+    elapsed = time.perf_counter() - start
+    print(f"Переворотов: {flips}, время: {elapsed:.2f} с")
+    print(f"Скорость: {flips / elapsed:,.0f} переворотов/с")
+
+
+if __name__ == "__main__":
+    main()
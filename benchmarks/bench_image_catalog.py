@@ -0,0 +1,52 @@
+"""Бенчмарк каталога изображений: первое и повторное хеширование.
+
+Создаёт во временной папке N файлов по 16 КБ и замеряет время
+хеширования в одном процессе, в нескольких процессах и повторного
+обновления каталога, когда файлы не изменились.
+
+Запуск:
+    python -m benchmarks.bench_image_catalog [количество файлов]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from myself_moduls.image_catalog import ImageCatalog
+
+
+def timed(function):
+    """Возвращает (результат, время в миллисекундах)."""
+    start = time.perf_counter()
+    result = function()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(count=10000):
+    """Печатает время хеширования count файлов."""
+    with tempfile.TemporaryDirectory() as root:
+        paths = []
+        for i in range(count):
+            path = os.path.join(root, f"img_{i}.png")
+            with open(path, "wb") as f:
+                f.write(i.to_bytes(4, "little") * 4096)
+            paths.append(path)
+
+        serial = ImageCatalog(
+            os.path.join(root, "serial.json"), parallel_threshold=count + 1
+        )
+        parallel = ImageCatalog(os.path.join(root, "parallel.json"))
+        _, serial_ms = timed(lambda: serial.update(paths))
+        _, parallel_ms = timed(lambda: parallel.update(paths))
+        warm = ImageCatalog(parallel.path)
+        hashed, warm_ms = timed(lambda: warm.update(paths))
+
+        print(f"{count} файлов, {os.cpu_count()} ядер")
+        print(f"один процесс       {serial_ms:9.1f} мс")
+        print(f"несколько процессов {parallel_ms:8.1f} мс")
+        print(f"повторно           {warm_ms:9.1f} мс ({hashed} захешировано)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
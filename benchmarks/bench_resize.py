@@ -0,0 +1,52 @@
+"""Бенчмарк изменения размера окна игры.
+
+Имитирует перетаскивание угла окна: много изменений размера подряд
+с обработкой событий между ними. Печатает количество перестроек
+(квадратная форма и размер иконок), количество разных размеров иконок
+карточек и общее время на offscreen-платформе Qt.
+
+Запуск:
+    python -m benchmarks.bench_resize [шагов]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from memory_game import MemoryGame  # noqa: E402
+
+
+def main(steps=300):
+    """Печатает результаты перетаскивания угла окна на steps шагов."""
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    window = MemoryGame()
+    window.resize(500, 500)
+    window.show()
+    QApplication.processEvents()
+    relayouts = window.resizer.relayouts
+    icon_sizes = set()
+
+    start = time.perf_counter()
+    for step in range(steps):
+        side = 500 + step
+        window.resize(side + step % 7, side)
+        QApplication.processEvents()
+        icon_sizes.add(window.cards[0].iconSize().width())
+    deadline = time.perf_counter() + 0.2
+    while time.perf_counter() < deadline:
+        QApplication.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"{steps} изменений размера за {elapsed:.1f} мс")
+    print(f"перестроек: {window.resizer.relayouts - relayouts}")
+    print(f"размеров иконок: {len(icon_sizes)}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,74 @@
+"""Бенчмарк сканирования больших папок с изображениями.
+
+Для папок из 10 000 и 100 000 файлов замеряет время и пик памяти:
+полного сканирования с составлением списка (как раньше), первого
+сканирования (scan_images), выборки уровня list_files - первой (с
+хешированием всех файлов) и повторной (из кешей) - и потоковой
+резервуарной выборки 8 изображений (reservoir_sample по iter_images).
+
+Запуск:
+    python -m benchmarks.bench_scan_images [количество файлов ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from random import sample
+
+from myself_moduls.image_catalog import ImageCatalog
+from myself_moduls.make_list_images import (
+    iter_images,
+    list_files,
+    reservoir_sample,
+    scan_images,
+)
+
+
+def measure(function):
+    """Возвращает (время в мс, пик выделенной памяти в КБ)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024
+
+
+def main(counts=(10000, 100000)):
+    """Печатает время и память каждого способа для каждой папки."""
+    for count in counts:
+        with tempfile.TemporaryDirectory() as folder, \
+                tempfile.TemporaryDirectory() as cache:
+            for i in range(count):
+                # содержимое разное: одинаковые файлы считаются одним
+                with open(os.path.join(folder, f"img_{i}.png"), "w") as f:
+                    f.write(str(i))
+            catalog = ImageCatalog(os.path.join(cache, "catalog.json"))
+
+            def full_list():
+                return sample(list(iter_images(folder)), 8)
+
+            def level():
+                return list_files((folder,), 8, catalog)
+
+            def streaming():
+                return reservoir_sample(iter_images(folder), 8)
+
+            results = (
+                ("полный список", full_list),
+                ("первое сканирование", lambda: scan_images(folder)),
+                ("list_files первый", level),
+                ("list_files повторный", level),
+                ("потоковая выборка", streaming),
+            )
+            print(f"{count} файлов:")
+            for name, function in results:
+                elapsed, peak_kb = measure(function)
+                print(f"  {name:20} {elapsed:9.1f} мс  {peak_kb:9.0f} КБ")
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (10000, 100000))
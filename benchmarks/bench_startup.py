@@ -0,0 +1,67 @@
+"""Бенчмарк запуска игры: время до первой отрисовки окна.
+
+Каждый замер выполняется в отдельном процессе (импорты не кешированы
+в памяти) на offscreen-платформе Qt и печатает медиану по фазам
+шкалы запуска (myself_moduls/startup_timeline.py).
+
+Запуск:
+    python -m benchmarks.bench_startup [количество запусков]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import json, time
+from myself_moduls.startup_timeline import timeline
+timeline.track_imports()
+from PyQt5.QtWidgets import QApplication
+from memory_game import MemoryGame
+
+app = QApplication([])
+with timeline.phase("MemoryGame()"):
+    game = MemoryGame()
+game.show()
+deadline = time.perf_counter() + 10
+while timeline.get("first paint") is None and time.perf_counter() < deadline:
+    app.processEvents()
+print(json.dumps(timeline.events))
+"""
+
+
+def run_probe(root):
+    """Запускает игру в отдельном процессе и возвращает события шкалы."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(runs=5):
+    """Запускает игру runs раз и печатает медианы фаз запуска."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    durations = {}
+    for _ in range(runs):
+        for name, start, end in run_probe(root):
+            # у отметок длительность - время от старта процесса
+            value = end - start if end > start else end
+            durations.setdefault(name, []).append(value * 1000)
+    print(f"Медиана по {runs} запускам, мс:")
+    for name, values in sorted(
+        durations.items(), key=lambda item: -statistics.median(item[1])
+    ):
+        print(f"{statistics.median(values):9.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
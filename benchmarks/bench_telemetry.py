@@ -0,0 +1,44 @@
+"""Бенчмарк накладных расходов телеметрии на пути клика.
+
+Замеряет среднее время Telemetry.record (запись события в кольцевой
+буфер, включая периодический сброс пачки фоновому потоку) и для
+сравнения время хода GameEngine без телеметрии.
+
+Запуск:
+    python -m benchmarks.bench_telemetry [событий]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from myself_moduls import telemetry
+from myself_moduls.game_engine import GameEngine
+
+
+def main(count=200000):
+    """Печатает среднее время записи события в микросекундах."""
+    with tempfile.TemporaryDirectory() as folder:
+        log = telemetry.Telemetry(os.path.join(folder, "t.ndjson"))
+        start = time.perf_counter()
+        for i in range(count):
+            log.record(telemetry.PRESS, 1, i & 15, moves=30, latency=1e-4)
+        record_us = (time.perf_counter() - start) * 1e6 / count
+        log.close()
+
+        engine = GameEngine([i // 2 for i in range(16)], moves=count)
+        start = time.perf_counter()
+        for i in range(count // 2):
+            engine.turn(0)
+            engine.turn(2)
+            engine.apply_match(*engine.check_match())
+            engine.hide_cards(0, 2)
+        turn_us = (time.perf_counter() - start) * 1e6 / count
+
+        print(f"запись события     {record_us:6.2f} мкс")
+        print(f"ход движка (без)   {turn_us:6.2f} мкс")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,67 @@
+"""Бенчмарк загрузки интерфейса: uic.loadUi против скомпилированных форм.
+
+Для game.ui, game_result.ui и settings.ui замеряет среднее время
+построения виджета разбором XML (uic.loadUi) и из скомпилированной
+формы (myself_moduls/ui_compiler.py) на offscreen-платформе Qt.
+
+Запуск:
+    python -m benchmarks.bench_ui_loading [повторов]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import uic  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QDialog, QMainWindow  # noqa: E402
+
+from myself_moduls.get_absolute_path import get_path  # noqa: E402
+from myself_moduls.ui_compiler import setup_ui  # noqa: E402
+
+FORMS = (
+    ("game.ui", QMainWindow),
+    ("game_result.ui", QDialog),
+    ("settings.ui", QDialog),
+)
+
+
+def measure(build, repeats):
+    """Возвращает среднее время вызова build() в миллисекундах."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        widget = build()
+        widget.deleteLater()
+    QApplication.processEvents()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main(repeats=20):
+    """Печатает время загрузки каждой формы двумя способами."""
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    for name, widget_class in FORMS:
+        ui_path = get_path(name)
+        setup_ui(widget_class(), ui_path)  # прогрев: компиляция формы
+
+        def parse():
+            widget = widget_class()
+            uic.loadUi(ui_path, widget)
+            return widget
+
+        def compiled():
+            widget = widget_class()
+            setup_ui(widget, ui_path)
+            return widget
+
+        parse_ms = measure(parse, repeats)
+        compiled_ms = measure(compiled, repeats)
+        print(
+            f"{name:16} uic.loadUi {parse_ms:7.2f} мс  "
+            f"скомпилированная {compiled_ms:7.2f} мс  "
+            f"(x{parse_ms / compiled_ms:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,545 @@
+"""Набор бенчмарков горячих путей игры со сравнением с эталоном.
+
+Бенчмарки выполняются в одном процессе без внешних сервисов: поиск
+ресурсов (get_path), выборка изображений (list_files) в маленькой и
+огромной папке, параметры уровня, сохранение прогресса, создание окна
+MemoryGame, задержка от нажатия до отрисовки переворота и целый
+уровень (на движке и в окне). Бенчмарки с окном выполняются на
+offscreen-платформе Qt и пропускаются, если PyQt5 не установлен.
+
+Результаты (медиана и минимум времени одной операции) пишутся в
+.cache/bench/results.json и сравниваются с эталоном
+.cache/bench/baseline.json. Если какой-то бенчмарк медленнее эталона
+больше чем на --tolerance, выводится предупреждение и код выхода 1,
+поэтому набор можно запускать после каждого изменения. Бенчмарк,
+который выполняется дольше --timeout секунд (например, завис во
+вложенном цикле событий Qt), завершает процесс с кодом 1 и печатает
+стеки всех потоков.
+
+Запуск:
+    python -m benchmarks.suite [--quick] [--only ИМЯ,...] [--output ПУТЬ]
+        [--baseline ПУТЬ] [--save-baseline] [--tolerance 0.25]
+        [--timeout 120]
+"""
+
+import argparse
+import faulthandler
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from myself_moduls import get_absolute_path  # noqa: E402
+from myself_moduls.bots import MemoryBot, play_engine  # noqa: E402
+from myself_moduls.game_engine import GameEngine  # noqa: E402
+from myself_moduls.get_absolute_path import (  # noqa: E402
+    find_project_root,
+    get_path,
+    load_index,
+)
+from myself_moduls.image_catalog import ImageCatalog  # noqa: E402
+from myself_moduls.level_manager import LevelManager  # noqa: E402
+from myself_moduls.make_list_images import list_files  # noqa: E402
+from myself_moduls.records import Progress  # noqa: E402
+
+RESULTS_VERSION = 1
+BENCHMARKS = []
+
+
+def benchmark(name, qt=False):
+    """Регистрирует бенчмарк.
+
+    Функция бенчмарка принимает Context и возвращает список времён
+    одной операции в секундах.
+
+    Args:
+        name: Имя бенчмарка в результатах.
+        qt: True, если бенчмарку нужен PyQt5.
+    """
+
+    def register(function):
+        BENCHMARKS.append((name, function, qt))
+        return function
+
+    return register
+
+
+def measure(operation, repeat=7, min_time=0.02):
+    """Замеряет операцию сериями, как timeit.
+
+    Количество вызовов в серии подбирается так, чтобы серия шла не
+    меньше min_time секунд.
+
+    Args:
+        operation: Функция без аргументов.
+        repeat: Количество серий.
+        min_time: Минимальная длительность серии в секундах.
+
+    Returns:
+        list[float]: Время одного вызова в каждой серии, в секундах.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed * 10 < min_time else 1
+        number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+def has_qt():
+    """Возвращает True, если установлен PyQt5."""
+    try:
+        import PyQt5.QtWidgets  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class Context:
+    """Общие ресурсы бенчмарков: временная папка и окно игры.
+
+    Attributes:
+        folder (str): Временная папка.
+        quick (bool): Уменьшенные размеры для быстрого прогона.
+    """
+
+    def __init__(self, folder, quick=False):
+        self.folder = folder
+        self.quick = quick
+        self._app = None
+        self._game = None
+
+    def app(self):
+        """Возвращает QApplication (создаётся при первом вызове)."""
+        if self._app is None:
+            from PyQt5.QtWidgets import QApplication
+
+            self._app = QApplication.instance() or QApplication([])
+        return self._app
+
+    def make_game(self):
+        """Создаёт окно игры с прогрессом и записями во временной папке."""
+        from memory_game import MemoryGame
+        from myself_moduls.replay import ReplayLog
+        from myself_moduls.telemetry import Telemetry
+
+        self.app()
+        folder = tempfile.mkdtemp(dir=self.folder)
+        return MemoryGame(
+            progress=Progress(
+                file_name=os.path.join(folder, "progress.json"), delay=0
+            ),
+            replays=ReplayLog(os.path.join(folder, "replays.ndjson")),
+            telemetry=Telemetry(os.path.join(folder, "telemetry.ndjson")),
+        )
+
+    def game(self):
+        """Возвращает общее показанное окно игры."""
+        if self._game is None:
+            self._game = self.make_game()
+            self._game.show()
+            self.process_events(0.1)
+        return self._game
+
+    def process_events(self, seconds=0.0):
+        """Обрабатывает события Qt в течение seconds секунд."""
+        app = self.app()
+        deadline = time.perf_counter() + seconds
+        app.processEvents()
+        while time.perf_counter() < deadline:
+            app.processEvents()
+
+    def close(self):
+        """Закрывает окно игры."""
+        if self._game is not None:
+            self._game.close()
+            self._game = None
+
+
+def make_images(folder, count):
+    """Создаёт папку с count маленькими изображениями разного содержимого."""
+    os.makedirs(folder, exist_ok=True)
+    for i in range(count):
+        with open(os.path.join(folder, f"{i}.png"), "wb") as f:
+            f.write(i.to_bytes(4, "little"))
+    return folder
+
+
+@benchmark("get_path.warm")
+def bench_get_path_warm(ctx):
+    get_path("music.ogg")
+    return measure(lambda: get_path("music.ogg"))
+
+
+@benchmark("get_path.cold")
+def bench_get_path_cold(ctx):
+    def cold():
+        # индекс в памяти сброшен, манифест на диске (новый процесс)
+        get_absolute_path._index = None
+        get_path("music.ogg")
+
+    return measure(cold, repeat=5)
+
+
+@benchmark("get_path.scan")
+def bench_get_path_scan(ctx):
+    root = find_project_root()
+    runs = iter(range(10**6))
+
+    def scan():
+        # манифеста нет: полный обход дерева проекта
+        manifest = os.path.join(ctx.folder, "index", f"{next(runs)}.json")
+        load_index(root, manifest)
+
+    return measure(scan, repeat=5)
+
+
+@benchmark("list_files.small")
+def bench_list_files_small(ctx):
+    catalog = ImageCatalog(os.path.join(ctx.folder, "catalog_small.json"))
+    folders = (get_path("images_1"),)
+    list_files(folders, catalog=catalog)
+    return measure(lambda: list_files(folders, catalog=catalog))
+
+
+def _huge_folder(ctx):
+    """Возвращает огромную папку изображений и прогретый каталог."""
+    folder = os.path.join(ctx.folder, "huge")
+    if not os.path.isdir(folder):
+        make_images(folder, 2000 if ctx.quick else 20000)
+    catalog = ImageCatalog(os.path.join(ctx.folder, "catalog_huge.json"))
+    list_files((folder,), catalog=catalog)
+    return folder, catalog
+
+
+@benchmark("list_files.huge")
+def bench_list_files_huge(ctx):
+    folder, catalog = _huge_folder(ctx)
+    return measure(lambda: list_files((folder,), catalog=catalog), repeat=5)
+
+
+@benchmark("list_files.huge_stream")
+def bench_list_files_huge_stream(ctx):
+    folder, catalog = _huge_folder(ctx)
+    return measure(
+        lambda: list_files((folder,), catalog=catalog, stream=True), repeat=5
+    )
+
+
+@benchmark("LevelManager.get_level")
+def bench_get_level(ctx):
+    manager = LevelManager()
+    manager.load()
+    levels = iter(range(1, 10**9))
+    return measure(lambda: manager.get_level(next(levels)))
+
+
+@benchmark("Progress.save_progress")
+def bench_save_progress(ctx):
+    progress = Progress(
+        file_name=os.path.join(ctx.folder, "progress_save.json")
+    )
+    try:
+        return measure(progress.save_progress)
+    finally:
+        progress.close()
+
+
+@benchmark("Progress.flush")
+def bench_progress_flush(ctx):
+    progress = Progress(
+        file_name=os.path.join(ctx.folder, "progress_flush.json")
+    )
+
+    def flush():
+        # атомарная запись файла с fsync
+        progress._pending = True
+        progress.flush()
+
+    try:
+        return measure(flush, repeat=5)
+    finally:
+        progress.close()
+
+
+@benchmark("level.engine")
+def bench_level_engine(ctx):
+    rng = random.Random(0)
+    images = [i // 2 for i in range(16)]
+    engine = GameEngine()
+    bot = MemoryBot(rng=rng)
+
+    def level():
+        rng.shuffle(images)
+        engine.new_board(images, 30)
+        play_engine(engine, bot)
+
+    return measure(level)
+
+
+@benchmark("MemoryGame()", qt=True)
+def bench_memory_game(ctx):
+    samples = []
+    for _ in range(3 if ctx.quick else 10):
+        start = time.perf_counter()
+        game = ctx.make_game()
+        samples.append(time.perf_counter() - start)
+        game.close()
+        game.deleteLater()
+        ctx.process_events()
+    return samples
+
+
+@benchmark("flip_to_paint", qt=True)
+def bench_flip_to_paint(ctx):
+    from PyQt5.QtCore import QEvent, QObject
+
+    game = ctx.game()
+
+    class PaintProbe(QObject):
+        """Запоминает момент первой отрисовки после нажатия."""
+
+        painted_at = None
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and self.painted_at is None:
+                self.painted_at = time.perf_counter()
+            return False
+
+    probe = PaintProbe()
+    app = ctx.app()
+    app.installEventFilter(probe)
+    samples = []
+    try:
+        for sample in range(20 if ctx.quick else 100):
+            index_card = sample % len(game.cards)
+            ctx.process_events()
+            probe.painted_at = None
+            pressed_at = time.perf_counter()
+            game.press_card(index_card)
+            deadline = pressed_at + 1.0
+            while probe.painted_at is None:
+                if time.perf_counter() > deadline:
+                    break
+                app.processEvents()
+            if probe.painted_at is not None:
+                samples.append(probe.painted_at - pressed_at)
+            game.animator.finish_all()
+            game.engine.hide_cards(index_card, index_card)
+    finally:
+        app.removeEventFilter(probe)
+    return samples
+
+
+@benchmark("level.gui", qt=True)
+def bench_level_gui(ctx):
+    from myself_moduls.autoplay import AutoPlayer
+    from myself_moduls.bots import make_bot
+
+    game = ctx.game()
+    games = 3 if ctx.quick else 10
+    done = []
+    player = AutoPlayer(
+        game,
+        make_bot("perfect", random.Random(0)),
+        games=games,
+        hide_delay=0,
+        on_finished=lambda: done.append(time.perf_counter()),
+    )
+    start = time.perf_counter()
+    player.start()
+    deadline = start + 60
+    while not done and time.perf_counter() < deadline:
+        ctx.app().processEvents()
+    player.stop()
+    if not done:
+        return []
+    return [(done[0] - start) / player.played]
+
+
+def run(names=None, quick=False, timeout=120):
+    """Выполняет бенчмарки.
+
+    Args:
+        names: Имена бенчмарков (None - все).
+        quick: Уменьшенные размеры для быстрого прогона.
+        timeout: Предел времени одного бенчмарка в секундах; при
+            превышении процесс завершается со стеками потоков (0 - без
+            предела).
+
+    Returns:
+        dict: {имя: {median_us, min_us, runs}} или {имя: {skipped: причина}}.
+    """
+    qt = has_qt()
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        ctx = Context(folder, quick)
+        try:
+            for name, function, needs_qt in BENCHMARKS:
+                if names and name not in names:
+                    continue
+                if needs_qt and not qt:
+                    results[name] = {"skipped": "нет PyQt5"}
+                    continue
+                if timeout:
+                    faulthandler.dump_traceback_later(timeout, exit=True)
+                try:
+                    samples = function(ctx)
+                except Exception as e:
+                    results[name] = {"skipped": f"ошибка: {e}"}
+                    continue
+                finally:
+                    faulthandler.cancel_dump_traceback_later()
+                if not samples:
+                    results[name] = {"skipped": "нет замеров"}
+                    continue
+                results[name] = {
+                    "median_us": statistics.median(samples) * 1e6,
+                    "min_us": min(samples) * 1e6,
+                    "runs": len(samples),
+                }
+        finally:
+            ctx.close()
+    return results
+
+
+def compare(results, baseline, tolerance=0.25, min_delta_us=1.0):
+    """Сравнивает результаты с эталоном.
+
+    Бенчмарк считается регрессией, если его медиана больше эталонной
+    больше чем на tolerance и больше чем на min_delta_us микросекунд
+    (шум очень быстрых операций не считается).
+
+    Args:
+        results: Результаты run().
+        baseline: Результаты эталонного прогона.
+        tolerance: Допустимое относительное замедление.
+        min_delta_us: Минимальное абсолютное замедление в мкс.
+
+    Returns:
+        list: Кортежи (имя, медиана, эталон или None, изменение или
+        None, регрессия) по бенчмаркам с замерами.
+    """
+    rows = []
+    for name, result in results.items():
+        if "median_us" not in result:
+            continue
+        current = result["median_us"]
+        base = baseline.get(name, {}).get("median_us")
+        if not base:
+            rows.append((name, current, None, None, False))
+            continue
+        change = current / base - 1
+        regressed = change > tolerance and current - base > min_delta_us
+        rows.append((name, current, base, change, regressed))
+    return rows
+
+
+def default_bench_dir():
+    """Возвращает папку результатов (.cache/bench в корне проекта)."""
+    return os.path.join(find_project_root(), ".cache", "bench")
+
+
+def load_results(path):
+    """Читает результаты из файла (пустой словарь, если файла нет)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("results", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def save_results(path, results):
+    """Атомарно записывает результаты в файл JSON."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": RESULTS_VERSION,
+                "time": time.time(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            f,
+            ensure_ascii=False,
+            indent=1,
+        )
+    os.replace(tmp_path, path)
+
+
+def format_us(value):
+    """Форматирует время в микросекундах с подходящей единицей."""
+    if value >= 1e6:
+        return f"{value / 1e6:.2f} с"
+    if value >= 1e3:
+        return f"{value / 1e3:.2f} мс"
+    return f"{value:.2f} мкс"
+
+
+def main(argv):
+    """Запускает набор, сохраняет результаты и сравнивает с эталоном."""
+    parser = argparse.ArgumentParser(description="Бенчмарки Memory Game")
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--only", default="")
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args(argv)
+    bench_dir = default_bench_dir()
+    output = args.output or os.path.join(bench_dir, "results.json")
+    baseline_path = args.baseline or os.path.join(bench_dir, "baseline.json")
+
+    names = {name for name in args.only.split(",") if name}
+    results = run(names, args.quick, args.timeout)
+    save_results(output, results)
+    baseline = load_results(baseline_path)
+
+    regressions = 0
+    print(f"{'бенчмарк':<26}{'медиана':>12}{'эталон':>12}{'изменение':>11}")
+    for name, current, base, change, regressed in compare(
+        results, baseline, args.tolerance
+    ):
+        regressions += regressed
+        print(
+            f"{name:<26}{format_us(current):>12}"
+            f"{format_us(base) if base else '-':>12}"
+            f"{f'{change:+.0%}' if change is not None else '-':>11}"
+            f"{'  РЕГРЕССИЯ' if regressed else ''}"
+        )
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<26}пропущен: {result['skipped']}")
+    print(f"Результаты: {output}")
+
+    if args.save_baseline:
+        save_results(baseline_path, results)
+        print(f"Эталон сохранён: {baseline_path}")
+    elif not baseline:
+        print("Эталона нет: сохраните его флагом --save-baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -5,6 +5,7 @@
 
 Запуск:
     python main.py  # стандартные ресурсы
+    python main.py --timeline  # печать шкалы запуска после первой отрисовки
 
 Для использования пользовательских ресурсов (пример кода):
     custom_paths = {
@@ -22,19 +23,28 @@
     game = MemoryGame(custom_paths=custom_paths)
 """
 
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from memory_game import MemoryGame
+
+from myself_moduls.startup_timeline import timeline
 
 
 def main():
     """Основная функция запуска приложения."""
     try:
         custom_paths = {}
+        if "--timeline" in sys.argv or os.environ.get("MEMORY_GAME_TIMELINE"):
+            timeline.enabled = True
+            timeline.track_imports()
+
+        from PyQt5.QtWidgets import QApplication
+        from memory_game import MemoryGame
 
         app = QApplication(sys.argv)
-        game = MemoryGame(custom_paths=custom_paths)
+        with timeline.phase("MemoryGame()"):
+            game = MemoryGame(custom_paths=custom_paths)
         game.show()
+        timeline.mark("show")
         app.exec_()
 
     except Exception as e:
@@ -6,28 +6,108 @@
 """
 
 import sys
+import time
 
-from PyQt5 import uic
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import QEvent, QObject, QTimer
 from PyQt5.QtWidgets import (
+    QApplication,
     QMainWindow,
-    QLabel,
     QPushButton,
-    QGraphicsDropShadowEffect,
+    QButtonGroup,
+    QSizePolicy,
 )
-from PyQt5.QtGui import QIcon, QColor
+from PyQt5.QtGui import QIcon
 
-import tempfile
 import os
-from random import shuffle
+import random
 
 from myself_moduls.square_window import make_window_square
-from myself_moduls.make_list_images import list_files
-from myself_moduls.dialogs import GameResultDialog, SettingsDialog
 from myself_moduls.records import Progress
 from myself_moduls.music_and_sounds_manager import MusicManager, SoundManager
 from myself_moduls.level_manager import LevelManager
 from myself_moduls.get_absolute_path import get_path
+from myself_moduls.game_engine import GameEngine
+from myself_moduls.card_face_cache import CardFaceCache
+from myself_moduls.card_shadow import CardShadowLayer
+from myself_moduls.card_animations import CardAnimator
+from myself_moduls.level_prefetcher import LevelPrefetcher, new_seed
+from myself_moduls.startup_timeline import timeline
+from myself_moduls import telemetry
+from myself_moduls.replay import Replay, ReplayLog, arrange_board
+from myself_moduls.ui_compiler import setup_ui
+
+# Стиль создаваемых программно карточек (как у карточек в game.ui)
+CARD_STYLE = """
+QPushButton[card="true"] {
+    border-radius: 15px;
+    border: 2px solid gray;
+    background: qlineargradient(
+        x1: 0, y1: 0, x2: 1, y2: 1,
+        stop: 0 #B3FFBA,
+        stop: 0.5 #BAE1FF,
+        stop: 1 #D7BAFF);
+}"""
+
+
+class PressPaintProbe(QObject):
+    """Измеряет задержку нажатий на карточки до первой отрисовки.
+
+    Фильтр событий приложения установлен, только пока есть нажатия без
+    отрисовки; задержка записывается в событие телеметрии нажатия.
+    """
+
+    def __init__(self, log, parent=None):
+        """Создаёт пробу.
+
+        Args:
+            log: Телеметрия (Telemetry), в которую пишутся задержки.
+            parent: Родительский объект Qt.
+        """
+        super().__init__(parent)
+        self.log = log
+        self._waiting = []
+        self._flush = False
+
+    def __len__(self):
+        """Возвращает количество нажатий, ожидающих отрисовки."""
+        return len(self._waiting)
+
+    def add(self, number, pressed_at):
+        """Ждёт отрисовку для события нажатия.
+
+        Args:
+            number: Номер события (результат Telemetry.record).
+            pressed_at: Момент нажатия (time.perf_counter()).
+        """
+        if not self._waiting:
+            QApplication.instance().installEventFilter(self)
+        self._waiting.append((number, pressed_at))
+
+    def flush(self):
+        """Сбрасывает телеметрию в журнал, как только у ожидающих
+        нажатий будет измерена задержка (сразу, если ожидающих нет)."""
+        if self._waiting:
+            self._flush = True
+        else:
+            self.log.flush()
+
+    def stop(self):
+        """Перестаёт ждать отрисовку (задержки остаются не измерены)."""
+        self._flush = False
+        if self._waiting:
+            QApplication.instance().removeEventFilter(self)
+            self._waiting.clear()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self._waiting:
+            painted_at = time.perf_counter()
+            for number, pressed_at in self._waiting:
+                self.log.set_latency(number, painted_at - pressed_at)
+            flush = self._flush
+            self.stop()
+            if flush:
+                self.log.flush()
+        return False
 
 
 class MemoryGame(QMainWindow):
@@ -40,31 +120,72 @@ class MemoryGame(QMainWindow):
         progress (Progress): Управляет прогрессом игрока.
         current_lvl (int): Текущий уровень игры.
         record (int): Рекорд игрока.
-        moves_count (int): Оставшееся количество ходов.
+        moves_count (int): Количество ходов на уровень.
         time_show (int): Время показа карточек в миллисекундах.
         images (list): Список путей к изображениям для карточек.
+        seed (int): Зерно раскладки текущей доски.
+        board_size (tuple): Размер поля текущего уровня (rows, cols).
         cards (list): Список кнопок-карточек.
-        card_states (dict): Состояние каждой карточки.
-        turned_cards (list): Индексы перевернутых карточек.
-        is_checking (bool): Флаг, ведется ли проверка совпадения карточек.
+        card_group (QButtonGroup): Группа карточек с одним обработчиком
+            клика на всё поле.
+        shadow_layer (CardShadowLayer): Слой с тенями карточек.
+        resizer (SquareResizer): Обработчик изменения размера окна.
+        engine (GameEngine): Правила и состояние доски текущего уровня.
+        face_cache (CardFaceCache): Кеш готовых изображений карточек.
+        prefetcher (LevelPrefetcher): Фоновая подготовка следующих уровней.
+        replays (ReplayLog): Журнал записей партий.
+        replay (Replay): Запись текущей партии.
+        telemetry (Telemetry): Телеметрия ходов.
     """
 
-    def __init__(self, custom_paths=None):
-        """Инициализирует главное окно игры."""
+    def __init__(
+        self,
+        custom_paths=None,
+        use_atlas=False,
+        level_manager=None,
+        progress=None,
+        replays=None,
+        telemetry=None,
+    ):
+        """Инициализирует главное окно игры.
+
+        Args:
+            custom_paths: Пользовательские пути к ресурсам.
+            use_atlas: True, чтобы брать изображения карточек из атласов
+                (см. myself_moduls/sprite_atlas.py).
+            level_manager: Менеджер уровней (например, с растущим полем);
+                по умолчанию LevelManager с полем 4x4.
+            progress: Прогресс игрока (Progress); по умолчанию
+                прогресс из progress.json.
+            replays: Журнал записей партий (ReplayLog); по умолчанию
+                .cache/replays.ndjson.
+            telemetry: Телеметрия ходов (Telemetry); по умолчанию
+                журнал .cache/telemetry.ndjson."""
         super().__init__()
         self.custom_paths = custom_paths if custom_paths else {}
+        self.use_atlas = use_atlas
+        self.level_manager = level_manager
+        self.progress = progress
+        self.replays = replays
+        self.telemetry = telemetry
+        self.replay = None
+        self.cards = []
+        self.card_group = None
+        self.shadow_layer = None
+        self._result_dialog = self._settings_dialog = None
         self._load_ui()
         self._init_all_game()
 
-        self.turned_cards = []
-        self.is_checking = False
-
     def _load_ui(self):
-        """Загружает интерфейс из файла .ui."""
+        """Загружает интерфейс из файла .ui.
+
+        Стандартный game.ui берётся из скомпилированной формы,
+        пользовательский файл из custom_paths разбирается через uic."""
         try:
-            ui_name = "game.ui"
-            ui_path = self.custom_paths.get("ui") or get_path(ui_name)
-            uic.loadUi(ui_path, self)
+            custom_ui = self.custom_paths.get("ui")
+            ui_path = custom_ui or get_path("game.ui")
+            with timeline.phase("UI load"):
+                setup_ui(self, ui_path, compiled=not custom_ui)
         except Exception as e:
             print(f"Ошибка загрузки UI: {e}")
             sys.exit(1)
@@ -76,10 +197,35 @@ class MemoryGame(QMainWindow):
         self._init_cards()
         self._set_card_states()
         self._interfaces_buttons_clicked()
+        # обработчик изменения размера устанавливается один раз, список
+        # карточек изменяется на месте при смене размера поля
+        self.resizer = make_window_square(self, cards=self.cards)
+        self._prefetch_next_levels()
 
     def _init_managers(self):
         """Инициализирует менеджеры звука, музыки и уровней."""
-        self.level_manager = LevelManager(custom_paths=self.custom_paths)
+        if self.level_manager is None:
+            self.level_manager = LevelManager(custom_paths=self.custom_paths)
+        # прогресс читается с диска один раз за сессию
+        if self.progress is None:
+            self.progress = Progress()
+        if self.telemetry is None:
+            self.telemetry = telemetry.Telemetry()
+        self.press_probe = PressPaintProbe(self.telemetry, self)
+        if self.replays is None:
+            self.replays = ReplayLog()
+        self.animator = CardAnimator(self.centralwidget)
+        atlases = None
+        if self.use_atlas:
+            from myself_moduls.sprite_atlas import AtlasRegistry
+
+            atlases = AtlasRegistry()
+        self.face_cache = CardFaceCache(atlases=atlases)
+        # пользовательские библиотеки изображений могут быть большими
+        self.prefetcher = LevelPrefetcher(
+            self.level_manager, stream="images" in self.custom_paths
+        )
+        self._prefetch_face_key = None
         try:
             self.sounds = SoundManager(custom_paths=self.custom_paths)
         except Exception as e:
@@ -88,21 +234,36 @@ class MemoryGame(QMainWindow):
 
         try:
             self.music = MusicManager(custom_paths=self.custom_paths)
+            # музыка загружается после показа окна, в цикле событий
+            QTimer.singleShot(0, self._start_music)
+        except Exception as e:
+            print(f"Музыка не загружена: {e}")
+            self.music = None
+
+    def _start_music(self):
+        """Загружает и включает фоновую музыку."""
+        try:
             if self.music.load("music.ogg"):
                 self.music.play()
         except Exception as e:
             print(f"Музыка не загружена: {e}")
-            self.music = None
 
-    def _init_level(self):
-        """Инициализирует текущий уровень игры."""
+    def _init_level(self, lvl_num=None, seed=None):
+        """Инициализирует текущий уровень игры.
+
+        Args:
+            lvl_num: Номер уровня (по умолчанию из прогресса).
+            seed: Зерно раскладки (по умолчанию случайное)."""
         try:
-            self.progress = Progress()
-            self.current_lvl = self.progress.get_level()
+            self.current_lvl = lvl_num or self.progress.get_level()
             self.record = self.progress.get_record()
-            lvl_info = self.level_manager.get_level(self.current_lvl)
-            self.moves_count, dir_paths, self.time_show, lvl_type = lvl_info
-            self.images = list_files(dir_paths)
+            level = self.prefetcher.take(self.current_lvl, seed)
+            self.moves_count, self.time_show = level.moves, level.time
+            self.board_size = level.board_size
+            self.images = level.images
+            self.image_keys = dict(zip(level.images, level.keys))
+            self.seed = level.seed
+            self._adopt_prefetched_faces(level.faces)
         except Exception as e:
             print(
                 f"Ошибка инициализации уровня, используем тестовые данные: {e}"
@@ -110,6 +271,34 @@ class MemoryGame(QMainWindow):
             self._use_test_data()
         self._set_ui_levels()
 
+    def _prefetch_next_levels(self):
+        """Запускает фоновую подготовку уровней для обоих исходов игры:
+        следующего (победа) и первого (поражение или перезапуск)."""
+        try:
+            size = self.cards[0].iconSize()
+            dpr = self.devicePixelRatioF()
+            self._prefetch_face_key = (size, dpr)
+
+            def decode(path):
+                """Декодирует изображение карточки в фоновом потоке."""
+                return self.face_cache.load_image(path, size, dpr)
+
+            self.prefetcher.prefetch((self.current_lvl + 1, 1), decode)
+        except Exception as e:
+            print(f"Ошибка фоновой подготовки уровня: {e}")
+
+    def _adopt_prefetched_faces(self, faces):
+        """Переносит декодированные в фоне изображения в кеш карточек.
+
+        Args:
+            faces: Словарь {путь: QImage} из подготовленного уровня."""
+        if not faces or self._prefetch_face_key is None:
+            return
+        size, dpr = self._prefetch_face_key
+        for path, image in faces.items():
+            if not image.isNull():
+                self.face_cache.put_image(path, size, dpr, image)
+
     def _use_test_data(self):
         """Использует тестовые данные при ошибке.
 
@@ -119,8 +308,13 @@ class MemoryGame(QMainWindow):
 
         self.record = self.current_lvl = 1
         self.moves_count, self.time_show = 30, 1000
+        self.seed = new_seed()
+        self.board_size = (4, 4)
+        self.image_keys = {}
         test_images = []
 
+        import tempfile
+
         # Создание временных тестовых PNG файлов
         with tempfile.TemporaryDirectory() as tmpdir:
             for i in range(8):
@@ -137,7 +331,7 @@ class MemoryGame(QMainWindow):
 
         # Создание пар карточек
         test_pairs = test_images * 2
-        shuffle(test_pairs)
+        random.Random(self.seed).shuffle(test_pairs)
         self.images = test_pairs
         # КОНЕЦ ЗАИМСТВОВАННОГО КОДА
 
@@ -152,65 +346,144 @@ class MemoryGame(QMainWindow):
             print(f"Не найден нужный QLabel в UI: {e}")
 
     def _init_cards(self):
-        """Инициализирует карточки игры.
-        Находит все кнопки карточек, настраивает их внешний вид
-        и подключает обработчики кликов.
+        """Инициализирует карточки игры под размер поля self.board_size.
+
+        Для поля 4x4 используются карточки из game.ui (card_1_1 ...
+        card_4_4), для остальных размеров карточки создаются программно
+        в gridLayout. Клики всех карточек обрабатываются одной группой
+        кнопок (QButtonGroup), тени рисует слой CardShadowLayer.
+
         Raises:
             ValueError: Если не найдены карточки в интерфейсе.
             SystemExit: При критической ошибке инициализации.
 
         Attributes:
-            self.cards (list[QPushButton]): Список объектов карточек,
-                отсортированный по именам (card_0, card_1, ..., card_15)."""
+            self.cards (list[QPushButton]): Список объектов карточек
+                по строкам поля слева направо."""
         try:
-            self.cards = sorted(
-                [
-                    btn
-                    for btn in self.findChildren(QPushButton)
-                    if "card_" in btn.objectName()
-                ],
-                key=lambda btn: btn.objectName(),
-            )
+            rows, cols = self.board_size
+            cards = []
             if not self.cards:
+                cards = sorted(
+                    [
+                        btn
+                        for btn in self.findChildren(QPushButton)
+                        if "card_" in btn.objectName()
+                    ],
+                    key=lambda btn: btn.objectName(),
+                )
+            if len(cards) != rows * cols:
+                self._remove_cards(cards or self.cards)
+                cards = self._create_cards(rows, cols)
+            if not cards:
                 raise ValueError("Карточки не найдены")
 
-            def create_click_handler_for_card(idx):
-                """Создаёт новый обработчик клика для каждой карточки"""
-                return lambda: self.press_card(idx)
-
+            # список изменяется на месте: на него ссылается обработчик
+            # изменения размера окна
+            self.cards[:] = cards
+            if self.card_group is not None:
+                self.card_group.deleteLater()
+            self.card_group = QButtonGroup(self)
+            self.card_group.setExclusive(False)
             for i, card in enumerate(self.cards):
-                card.clicked.connect(create_click_handler_for_card(i))
-
-                shadow = QGraphicsDropShadowEffect()
-                shadow.setBlurRadius(30)
-                shadow.setXOffset(10)
-                shadow.setYOffset(10)
-                shadow.setColor(QColor(120, 110, 140, 60))
-                card.setGraphicsEffect(shadow)
+                self.card_group.addButton(card, i)
+            self.card_group.idClicked.connect(self.press_card)
+
+            # тени рисует один слой под карточками, размер тени
+            # уменьшается вместе с карточками на больших полях
+            if self.shadow_layer is None:
+                self.shadow_layer = CardShadowLayer(self.centralwidget)
+            scale = 4 / max(rows, cols)
+            self.shadow_layer.set_shadow(
+                blur=max(4, round(30 * scale)),
+                offset=max(2, round(10 * scale)),
+            )
+            self.shadow_layer.set_cards(self.cards)
         except Exception as e:
             print(f"Критическая ошибка: {e}! Не могу создать карточки")
             sys.exit(1)
 
+    def _remove_cards(self, cards):
+        """Убирает карточки с поля и удаляет их.
+
+        Args:
+            cards: Список карточек (QPushButton)."""
+        for card in cards:
+            self.gridLayout.removeWidget(card)
+            card.hide()
+            card.deleteLater()
+
+    def _create_cards(self, rows, cols):
+        """Создаёт карточки поля rows x cols в gridLayout.
+
+        Стиль задаётся один раз на центральном виджете (CARD_STYLE),
+        а не отдельной таблицей стилей у каждой карточки. Отступы
+        уменьшаются пропорционально числу столбцов.
+
+        Args:
+            rows: Количество строк.
+            cols: Количество столбцов.
+
+        Returns:
+            list[QPushButton]: Карточки по строкам слева направо."""
+        parent = self.centralwidget
+        if CARD_STYLE not in parent.styleSheet():
+            parent.setStyleSheet(parent.styleSheet() + CARD_STYLE)
+        self.gridLayout.setSpacing(max(2, 100 // cols))
+        min_side = max(8, 320 // max(rows, cols))
+        cards = []
+        self.setUpdatesEnabled(False)
+        try:
+            for row in range(rows):
+                for col in range(cols):
+                    card = QPushButton(parent)
+                    card.setObjectName(f"card_{row + 1}_{col + 1}")
+                    card.setProperty("card", True)
+                    card.setSizePolicy(
+                        QSizePolicy.Expanding, QSizePolicy.Expanding
+                    )
+                    card.setMinimumSize(min_side, min_side)
+                    card.setMaximumSize(200, 200)
+                    self.gridLayout.addWidget(card, row, col)
+                    cards.append(card)
+        finally:
+            self.setUpdatesEnabled(True)
+        return cards
+
     def _set_card_states(self):
-        """Устанавливает начальные состояния для всех карточек.
-
-        Создает словарь, где каждый ключ - индекс карточки (0-15),
-        а значение - словарь с информацией о состоянии карточки.
-
-        Структура состояния для каждой карточки:
-            - 'img': str - путь к изображению под карточкой
-            - 'turned_over': bool - флаг перевернутости карточки
-            - 'found_pair': bool - флаг найденной пары
-
-        Объекты карточек хранятся отдельно в self.cards."""
-        self.card_states = {
-            i: {
-                "img": self.images[i],
-                "turned_over": False,
-                "found_pair": False,
-            }
-            for i in range(len(self.cards))
-        }
+        """Раскладывает доску текущего уровня в игровом движке.
+
+        Состояние карточек (перевернута, найдена пара) хранится в
+        self.engine, изображения - в self.images по индексу карточки.
+        Объекты карточек хранятся отдельно в self.cards. Пары
+        сравниваются по идентификаторам содержимого изображений, так что
+        одинаковые файлы из разных папок тоже образуют пару.
+        Идентификаторы вычисляются при подготовке уровня в фоновом
+        потоке (PreparedLevel.keys), а не здесь."""
+        images = self.images[: len(self.cards)]
+        keys = [self.image_keys.get(path, path) for path in images]
+        self.engine = GameEngine(keys, self.moves_count)
+        rows, cols = self.board_size
+        self.telemetry.record(
+            telemetry.LEVEL, self.current_lvl, rows, cols, self.moves_count
+        )
+        self._save_replay()
+        self.replay = Replay(
+            self.seed,
+            self.current_lvl,
+            self.moves_count,
+            self.time_show,
+            self.engine.image_ids,
+        )
+
+    def _save_replay(self):
+        """Передаёт запись партии в журнал (если были ходы)."""
+        try:
+            if self.replay is not None and len(self.replay):
+                self.replays.append(self.replay)
+        except Exception as e:
+            print(f"Ошибка сохранения записи партии: {e}")
+        self.replay = None
 
     def _interfaces_buttons_clicked(self):
         """Подключает обработчики кликов к кнопкам интерфейса."""
@@ -234,29 +507,33 @@ class MemoryGame(QMainWindow):
         except AttributeError as e:
             print(f"Кнопка не найдена в UI: {e}")
 
-    def resizeEvent(self, event):
-        """Обработчик изменения размера окна.
-        Обеспечивает квадратную форму окна и обновляет размер иконок карточек.
-        """
-        try:
-            super().resizeEvent(event)
-            make_window_square(self, cards=self.cards)
-        except Exception as e:
-            print(f"Ошибка при изменении размера окна: {e}")
-
     def press_card(self, index_card):
         """Обрабатывает нажатие на карточку.
 
         Args:
             index_card: Индекс нажатой карточки."""
         try:
-            if self.can_turn(index_card):
-                self.flip_card(index_card, self.card_states[index_card]["img"])
-                self.turned_cards.append(index_card)
+            pressed_at = time.perf_counter()
+            if self.engine.turn(index_card):
+                if self.replay is not None:
+                    self.replay.press(index_card)
+                self.flip_card(index_card, self.images[index_card])
+                # задержка - до первой отрисовки после нажатия
+                self.press_probe.add(
+                    self.telemetry.record(
+                        telemetry.PRESS,
+                        self.current_lvl,
+                        index_card,
+                        moves=self.engine.moves_count,
+                    ),
+                    pressed_at,
+                )
                 if (
-                    len(self.turned_cards) == 2
+                    len(self.engine.turned_cards) == 2
                 ):  # Если перевернуто 2 карточки, проверяем совпадение
                     self.check_match()
+        except IndexError:
+            print(f"Несуществующий индекс карточки: {index_card}")
         except Exception as e:
             print(f" Ошибка при нажатии на карточку: {e}")
 
@@ -269,19 +546,8 @@ class MemoryGame(QMainWindow):
         Returns:
             bool: True если карточку можно перевернуть."""
         try:
-            card_state = self.card_states[index_card]
-            # Нельзя перевернуть если:
-            # 1. Карточка уже найдена в паре
-            # 2. Карточка уже перевернута
-            # 3. Уже перевернуто 2 карточки для проверки
-            # 4. Идёт проверка совпадения
-            return (
-                not card_state["found_pair"]
-                and not card_state["turned_over"]
-                and len(self.turned_cards) < 2
-                and not self.is_checking
-            )
-        except KeyError:
+            return self.engine.can_turn(index_card)
+        except IndexError:
             print(f"Несуществующий индекс карточки: {index_card}")
             return False
         except Exception as e:
@@ -291,20 +557,14 @@ class MemoryGame(QMainWindow):
     def check_match(self):
         """Проверяет совпадение перевернутых карточек."""
         try:
-            self.is_checking = True
-            index_1, index_2 = self.turned_cards
-            # результат проверки на совпадение
-            bool_match_pair = (
-                self.card_states[index_1]["img"]
-                == self.card_states[index_2]["img"]
-            )
+            index_1, index_2, bool_match_pair = self.engine.check_match()
             self.process_match(
                 index_1, index_2, match=bool_match_pair, time=self.time_show
             )
         except Exception as e:
             print(f"Ошибка проверки совпадения: {e}")
-            self.turned_cards.clear()
-            self.is_checking = False
+            self.engine.turned_cards.clear()
+            self.engine.is_checking = False
 
     def process_match(self, index_1, index_2, match, time=1000):
         """Обрабатывает результат проверки совпадения карточек.
@@ -315,25 +575,32 @@ class MemoryGame(QMainWindow):
             match: результат проверки на совпадение, True если совпадают.
             time: Время задержки перед скрытием карточек."""
         try:
+            self.engine.apply_match(index_1, index_2, match)
+            self.telemetry.record(
+                telemetry.MATCH if match else telemetry.MISMATCH,
+                self.current_lvl,
+                index_1,
+                index_2,
+                self.engine.moves_count,
+            )
             if not match:
-                self.moves_count -= 1  # Не совпали, тратим ход
-                self.moves_label.setText(f"ХОДЫ\t{self.moves_count}")
+                # Не совпали, ход потрачен
+                self.moves_label.setText(f"ХОДЫ\t{self.engine.moves_count}")
+                engine = self.engine
                 QTimer.singleShot(
-                    time, lambda: self.hide_cards(index_1, index_2)
+                    time,
+                    lambda: self.hide_cards(index_1, index_2, engine),
                 )
             else:
                 if self.sounds:
                     self.sounds.play_param("match")
                 for i in (index_1, index_2):
                     self._effect_for_matched_cards(i)
-                    self.card_states[i]["found_pair"] = True
-                self.turned_cards.clear()
-                self.is_checking = False
             self.check_game_completion()  # Проверяем завершение игры
         except Exception as e:
             print(f"Ошибка обработки совпадения: {e}")
-            self.turned_cards.clear()
-            self.is_checking = False
+            self.engine.turned_cards.clear()
+            self.engine.is_checking = False
 
     def _effect_for_matched_cards(self, index_card):
         """Добавляет визуальный эффект для найденной пары.
@@ -341,56 +608,48 @@ class MemoryGame(QMainWindow):
         Args:
             index_card: Индекс карточки."""
         try:
-            card = self.cards[index_card]
-            checkmark = QLabel("✓︎", card)
-            checkmark.setStyleSheet(
-                """
-                QLabel {
-                    color: #32CD32;
-                    font-size: 64px;
-                    font-weight: bold;
-                    background: transparent;}"""
-            )
-            checkmark.setAlignment(Qt.AlignCenter)
-            checkmark.setGeometry(0, 0, card.width(), card.height())
-            checkmark.show()
-            QTimer.singleShot(1000, checkmark.deleteLater)
+            self.animator.checkmark(self.cards[index_card])
         except Exception as e:
             print(f"Ошибка создания визуального эффекта: {e}")
 
-    def flip_card(self, index_card, img=""):
-        """Переворачивает карточку.
+    def flip_card(self, index_card, img="", duration=200):
+        """Переворачивает карточку с анимацией.
 
         Args:
             index_card: Индекс карточки.
             img: Путь к изображению для показа (пустая строка, если скрыть).
+            duration: Длительность анимации в миллисекундах.
         """
         try:
             if self.sounds:
                 self.sounds.play_param("flip")
             card = self.cards[index_card]
-
-            card.hide()
-            QTimer.singleShot(200, card.show)
-
-            card.setIcon(QIcon(img))
-            self.card_states[index_card]["turned_over"] = bool(img)
+            if img:
+                icon = self.face_cache.get_icon(
+                    img, card.iconSize(), card.devicePixelRatioF()
+                )
+            else:
+                icon = QIcon()
+            self.animator.flip(card, icon, duration)
         except Exception as e:
             print(f"Ошибка переворота карточки: {e}")
 
-    def hide_cards(self, index_1, index_2):
+    def hide_cards(self, index_1, index_2, engine=None):
         """Скрывает несовпавшие карточки.
 
         Args:
             index_1: Индекс первой карточки.
-            index_2: Индекс второй карточки."""
+            index_2: Индекс второй карточки.
+            engine: Движок, в котором открыты карточки; если уровень
+                уже перезапущен, отложенное скрытие пропускается."""
+        if engine is not None and engine is not self.engine:
+            return
         try:
             for i in (index_1, index_2):
                 self._hide_single_card_with_visual(i)
         except Exception as e:
             print(f"Ошибка скрытия карточек: {e}")
-        self.turned_cards.clear()
-        self.is_checking = False
+        self.engine.hide_cards(index_1, index_2)
 
     def _hide_single_card_with_visual(self, index_card):
         """Скрывает одну карточку с анимацией.
@@ -398,10 +657,7 @@ class MemoryGame(QMainWindow):
         Args:
             index_card: Индекс карточки."""
         try:
-            card = self.cards[index_card]
-            self.flip_card(index_card)
-            card.hide()
-            QTimer.singleShot(150, card.show)
+            self.flip_card(index_card, duration=150)
         except Exception as e:
             print(f"Ошибка скрытия карточки: {e}")
 
@@ -409,12 +665,18 @@ class MemoryGame(QMainWindow):
         """Проверяет условия завершения игры после каждого хода.
         Вызывается после обработки пары (совпадения или нет)"""
         try:
-            # Проверяем победу (все пары найдены)
-            if all(state["found_pair"] for state in self.card_states.values()):
-                self.game_completion(win=True)
-            # Проверяем поражение (закончились ходы)
-            elif self.moves_count <= 0:
-                self.game_completion(win=False)
+            status = self.engine.status()
+            if status is not None:
+                self.telemetry.record(
+                    telemetry.WIN if status == "win" else telemetry.LOSE,
+                    self.current_lvl,
+                    moves=self.engine.moves_count,
+                )
+                # последнее нажатие уровня ещё ждёт отрисовки
+                self.press_probe.flush()
+                self.replay.result = status
+                self._save_replay()
+                self.game_completion(win=status == "win")
         except Exception as e:
             print(f"Ошибка проверки завершения игры: {e}")
 
@@ -448,18 +710,34 @@ class MemoryGame(QMainWindow):
         except Exception as e:
             print(f"Ошибка начала игры: {e}")
 
-    def reset_level(self):
+    def reset_level(self, replay=None):
         """Начальное состояние карточек и интерфейса для нового уровня.
-        (следующего или начального)"""
+        (следующего или начального)
+
+        Args:
+            replay: Запись партии (Replay), доска которой раскладывается
+                вместо уровня из прогресса (воспроизведение партии)."""
         try:
-            self._init_level()
+            if replay is None:
+                self._init_level()
+            else:
+                self._init_level(replay.level, replay.seed)
+                self.images = arrange_board(self.images, replay.board)
+                self.moves_count, self.time_show = replay.moves, replay.time
+                self._set_ui_levels()
+            if len(self.cards) != self.board_size[0] * self.board_size[1]:
+                self.animator.finish_all()
+                self._init_cards()
+                self.resizer.schedule()
             self._set_card_states()
             self._reset_ui_cards()
+            self._prefetch_next_levels()
         except Exception as e:
             print(f"Ошибка сброса уровня: {e}")
 
     def _reset_ui_cards(self):
-        """Сбрасывает иконки всех карточек."""
+        """Завершает анимации и сбрасывает иконки всех карточек."""
+        self.animator.finish_all()
         for card in self.cards:
             try:
                 card.setIcon(QIcon())
@@ -472,19 +750,47 @@ class MemoryGame(QMainWindow):
         Args:
             win: True если игрок победил."""
         try:
-            dialog = GameResultDialog(win=win, sounds=self.sounds, parent=self)
-            dialog.exec_()
+            if self._result_dialog is None:
+                # диалоги не нужны для первой отрисовки окна
+                from myself_moduls.dialogs import GameResultDialog
+
+                self._result_dialog = GameResultDialog(
+                    win=win, sounds=self.sounds, parent=self
+                )
+            self._result_dialog.show_result(win)
         except Exception as e:
             print(f"Ошибка показа диалога результата: {e}")
 
     def show_settings(self):
         """Показывает диалог настроек."""
         try:
-            dialog = SettingsDialog(
-                music_manager=self.music,
-                sound_manager=self.sounds,
-                parent=self,
-            )
-            dialog.exec_()
+            if self._settings_dialog is None:
+                from myself_moduls.dialogs import SettingsDialog
+
+                self._settings_dialog = SettingsDialog(
+                    music_manager=self.music,
+                    sound_manager=self.sounds,
+                    parent=self,
+                )
+            self._settings_dialog.show_settings()
         except Exception as e:
             print(f"Ошибка показа диалога настроек: {e}")
+
+    def paintEvent(self, event):
+        """Отмечает первую отрисовку окна на шкале запуска."""
+        super().paintEvent(event)
+        if timeline.get("first paint") is None:
+            timeline.mark("first paint")
+            if timeline.enabled:
+                print(timeline.report())
+
+    def closeEvent(self, event):
+        """Останавливает фоновые задачи и сохраняет прогресс
+        при закрытии окна."""
+        self.prefetcher.shutdown()
+        self.progress.close()
+        self.press_probe.stop()
+        self.telemetry.close()
+        self._save_replay()
+        self.replays.close()
+        super().closeEvent(event)
@@ -0,0 +1,136 @@
+import time
+
+
+class Animation:
+    """Одна выполняющаяся анимация.
+
+    Attributes:
+        key: Ключ анимации (например, карточка); у ключа не больше одной
+            анимации.
+        started (float): Момент начала по часам драйвера.
+        duration (float): Длительность в секундах.
+        step (callable): Функция step(progress), progress от 0 до 1.
+        done (callable | None): Функция, вызываемая по завершении.
+    """
+
+    __slots__ = ("key", "started", "duration", "step", "done")
+
+    def __init__(self, key, started, duration, step, done):
+        self.key = key
+        self.started = started
+        self.duration = duration
+        self.step = step
+        self.done = done
+
+
+class AnimationDriver:
+    """Выполняет все анимации игры от одного таймера.
+
+    Вместо отдельного QTimer на каждую карточку драйвер раз в кадр
+    вызывает шаг всех активных анимаций. Таймер работает только пока
+    есть активные анимации.
+
+    Attributes:
+        interval (int): Интервал таймера в миллисекундах (кадр).
+        ticks (int): Количество выполненных кадров.
+    """
+
+    def __init__(self, interval=16, clock=time.perf_counter, timer=None):
+        """Создаёт драйвер; QTimer создаётся при первой анимации.
+
+        Args:
+            interval: Интервал таймера в миллисекундах.
+            clock: Функция текущего времени в секундах.
+            timer: Таймер с методами start, stop, isActive и сигналом
+                timeout (по умолчанию QTimer).
+        """
+        self.interval = interval
+        self.ticks = 0
+        self._clock = clock
+        self._timer = None
+        self._animations = {}
+        if timer is not None:
+            self._connect(timer)
+
+    def __len__(self):
+        """Возвращает количество активных анимаций."""
+        return len(self._animations)
+
+    def _connect(self, timer):
+        """Подключает таймер к шагу анимаций."""
+        timer.setInterval(self.interval)
+        timer.timeout.connect(self.tick)
+        self._timer = timer
+
+    def _ensure_timer(self):
+        """Создаёт таймер при первой анимации."""
+        if self._timer is None:
+            from PyQt5.QtCore import QTimer
+
+            self._connect(QTimer())
+        return self._timer
+
+    def start(self, key, duration, step, done=None):
+        """Запускает анимацию, завершая предыдущую анимацию ключа.
+
+        Args:
+            key: Ключ анимации.
+            duration: Длительность в миллисекундах.
+            step: Функция step(progress), progress от 0 до 1.
+            done: Функция, вызываемая по завершении (необязательно).
+        """
+        self.finish(key)
+        self._animations[key] = Animation(
+            key, self._clock(), max(duration, 1) / 1000, step, done
+        )
+        self._call(step, 0.0)
+        timer = self._ensure_timer()
+        if not timer.isActive():
+            timer.start()
+
+    def is_running(self, key):
+        """Возвращает True, если у ключа есть активная анимация."""
+        return key in self._animations
+
+    def finish(self, key):
+        """Сразу завершает анимацию ключа (последний шаг и done)."""
+        animation = self._animations.pop(key, None)
+        if animation is not None:
+            self._complete(animation)
+
+    def finish_all(self):
+        """Сразу завершает все активные анимации."""
+        for key in list(self._animations):
+            self.finish(key)
+
+    def tick(self):
+        """Выполняет один кадр всех активных анимаций."""
+        self.ticks += 1
+        now = self._clock()
+        finished = []
+        for animation in list(self._animations.values()):
+            progress = (now - animation.started) / animation.duration
+            if progress >= 1.0:
+                finished.append(animation)
+            else:
+                self._call(animation.step, progress)
+        for animation in finished:
+            if self._animations.get(animation.key) is animation:
+                del self._animations[animation.key]
+                self._complete(animation)
+        if not self._animations and self._timer is not None:
+            self._timer.stop()
+
+    def _complete(self, animation):
+        """Выполняет последний шаг анимации и функцию завершения."""
+        self._call(animation.step, 1.0)
+        if animation.done is not None:
+            self._call(animation.done)
+
+    @staticmethod
+    def _call(function, *args):
+        """Вызывает функцию анимации, не прерывая остальные при ошибке."""
+        try:
+            function(*args)
+        except Exception as e:
+            print(f"Ошибка анимации: {e}")
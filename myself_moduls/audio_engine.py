@@ -0,0 +1,203 @@
+import threading
+import time
+from collections import deque
+
+from myself_moduls.startup_timeline import timeline
+
+
+class AudioEngine:
+    """Единый аудиодвижок игры поверх pygame.mixer.
+
+    Владеет инициализацией микшера (частота и размер буфера задаются
+    один раз для всей игры), резервирует под каждый тип эффекта свой
+    пул каналов и при нехватке свободных каналов «крадёт» самый старый
+    голос этого типа. Быстрые клики по карточкам не занимают каналы
+    других эффектов и не ждут освобождения канала.
+
+    Для каждого проигранного эффекта измеряется задержка от запроса
+    (клика) до передачи звука в канал плюс длительность буфера микшера.
+
+    Attributes:
+        DEFAULT_CHANNELS (dict): Количество каналов на тип эффекта.
+        frequency (int): Частота дискретизации микшера.
+        buffer (int): Размер буфера микшера в сэмплах.
+        channels_per_effect (dict): Количество каналов на тип эффекта.
+        stolen (int): Сколько раз голос был украден.
+    """
+
+    DEFAULT_CHANNELS = {"flip": 3, "match": 2, "win": 1, "lose": 1}
+
+    def __init__(
+        self,
+        frequency=44100,
+        buffer=512,
+        channels=None,
+        history=256,
+        backend=None,
+    ):
+        """Создаёт движок; микшер инициализируется при первом обращении.
+
+        Args:
+            frequency: Частота дискретизации.
+            buffer: Размер буфера в сэмплах (меньше - ниже задержка).
+            channels: Словарь {тип эффекта: количество каналов}.
+            history: Сколько последних замеров задержки хранить.
+            backend: Модуль pygame или совместимая заглушка (например,
+                null_audio.NullPygame); по умолчанию импортируется pygame.
+        """
+        self.backend = backend
+        self.frequency = frequency
+        self.buffer = buffer
+        self.channels_per_effect = dict(channels or self.DEFAULT_CHANNELS)
+        self.stolen = 0
+        self._pygame = None
+        self._pools = {}
+        self._started = {}
+        self._latencies = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def configure(self, frequency=None, buffer=None, channels=None):
+        """Меняет настройки микшера до его инициализации.
+
+        Args:
+            frequency: Частота дискретизации.
+            buffer: Размер буфера в сэмплах.
+            channels: Словарь {тип эффекта: количество каналов}.
+
+        Raises:
+            RuntimeError: Если микшер уже инициализирован.
+        """
+        if self._pygame is not None:
+            raise RuntimeError("Микшер уже инициализирован")
+        if frequency:
+            self.frequency = frequency
+        if buffer:
+            self.buffer = buffer
+        if channels:
+            self.channels_per_effect = dict(channels)
+
+    @property
+    def buffer_latency(self):
+        """Задержка, вносимая буфером микшера, в секундах."""
+        return self.buffer / self.frequency
+
+    def mixer(self):
+        """Возвращает pygame.mixer, инициализируя его при первом обращении.
+
+        pygame импортируется лениво. Инициализация потокобезопасна:
+        звуки грузятся в фоновом потоке.
+
+        Returns:
+            module: pygame.mixer.
+        """
+        with self._lock:
+            if self._pygame is None:
+                pygame = self.backend
+                if pygame is None:
+                    with timeline.import_phase("pygame"):
+                        import pygame
+                with timeline.phase("mixer init"):
+                    pygame.mixer.pre_init(
+                        self.frequency, -16, 2, self.buffer
+                    )
+                    pygame.mixer.init()
+                    self._reserve_channels(pygame.mixer)
+                self._pygame = pygame
+        return self._pygame.mixer
+
+    def _reserve_channels(self, mixer):
+        """Резервирует каналы под эффекты и раскладывает их по пулам."""
+        reserved = sum(self.channels_per_effect.values())
+        mixer.set_num_channels(max(mixer.get_num_channels(), reserved + 2))
+        mixer.set_reserved(reserved)
+        index = 0
+        for kind, count in self.channels_per_effect.items():
+            self._pools[kind] = [
+                mixer.Channel(i) for i in range(index, index + count)
+            ]
+            index += count
+
+    def play_effect(self, kind, sound, requested_at=None):
+        """Проигрывает эффект в пуле каналов его типа.
+
+        Если все каналы пула заняты, останавливается самый давно
+        запущенный голос этого типа.
+
+        Args:
+            kind: Тип эффекта ('flip', 'match', 'win', 'lose').
+            sound: pygame.mixer.Sound.
+            requested_at: Момент запроса звука (time.perf_counter());
+                по умолчанию - текущий момент.
+
+        Returns:
+            float: Измеренная задержка в секундах.
+        """
+        requested_at = requested_at or time.perf_counter()
+        self.mixer()
+        # эффекты запускаются и из GUI-потока, и из потока загрузки
+        # звуков: выбор канала и учёт голосов - под общей блокировкой
+        with self._lock:
+            pool = self._pools.get(kind)
+            if not pool:
+                sound.play()
+            else:
+                channel = next((c for c in pool if not c.get_busy()), None)
+                if channel is None:
+                    channel = min(
+                        pool, key=lambda c: self._started.get(id(c), 0.0)
+                    )
+                    self.stolen += 1
+                channel.play(sound)
+                self._started[id(channel)] = time.perf_counter()
+            latency = (
+                time.perf_counter() - requested_at + self.buffer_latency
+            )
+            self._latencies.append(latency)
+        return latency
+
+    def latency_stats(self):
+        """Возвращает статистику задержки «клик - звук» в миллисекундах.
+
+        Returns:
+            dict: count, mean_ms, p50_ms, p95_ms, max_ms, buffer_ms
+            (для пустой истории - только count и buffer_ms).
+        """
+        with self._lock:
+            values = sorted(value * 1000 for value in self._latencies)
+        stats = {"count": len(values), "buffer_ms": self.buffer_latency * 1000}
+        if values:
+            last = len(values) - 1
+            stats.update(
+                mean_ms=sum(values) / len(values),
+                p50_ms=values[last // 2],
+                p95_ms=values[last * 95 // 100],
+                max_ms=values[-1],
+            )
+        return stats
+
+
+_engine = None
+
+
+def get_engine():
+    """Возвращает общий для игры аудиодвижок (создаётся при первом вызове)."""
+    global _engine
+    if _engine is None:
+        _engine = AudioEngine()
+    return _engine
+
+
+def set_engine(engine):
+    """Заменяет общий аудиодвижок (например, беззвучным).
+
+    Действует на менеджеры звука и музыки, созданные после вызова.
+
+    Args:
+        engine: Новый аудиодвижок (None - создать заново при get_engine).
+
+    Returns:
+        AudioEngine | None: Прежний аудиодвижок.
+    """
+    global _engine
+    previous, _engine = _engine, engine
+    return previous
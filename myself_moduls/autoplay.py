@@ -0,0 +1,324 @@
+"""
+Автоигра: бот играет в живом окне MemoryGame.
+
+Бот нажимает карточки через MemoryGame.press_card, а диалог результата
+закрывается кнопкой «играть» (как это сделал бы игрок), поэтому
+выполняется тот же код интерфейса, таймеров и анимаций, что и в
+обычной игре. На offscreen-платформе Qt автоигра проходит тысячи
+уровней без участия человека: так проверяются гонки таймеров
+(скрытие карточек и перезапуск), рост памяти и скорость.
+
+Запуск (прогресс и записи партий пишутся во временную папку):
+    python -m myself_moduls.autoplay [--bot perfect|random|memory:N]
+        [--games N] [--seed N] [--hide-delay МС]
+
+ReplayPlayer так же воспроизводит в окне записанную партию
+(myself_moduls/replay.py) в реальном времени.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+from myself_moduls.bots import make_bot
+
+
+def peak_memory_kb():
+    """Возвращает пик памяти процесса в КБ (0, если не определить)."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class AutoPlayer(QObject):
+    """Управляет окном игры от имени бота.
+
+    Каждый шаг таймера бот либо закрывает диалог результата, либо
+    нажимает одну карточку, если игра ждёт хода. Нажатие откладывается
+    отдельным таймером: последний ход партии открывает модальный диалог
+    результата (exec_()), и шаги, закрывающие его, должны продолжать
+    выполняться во вложенном цикле событий.
+
+    Attributes:
+        game (MemoryGame): Окно игры.
+        bot (Bot): Стратегия бота.
+        games (int | None): Сколько партий сыграть (None - бесконечно).
+        hide_delay (int | None): Время показа несовпавших карточек
+            в мс вместо времени уровня (None - как в уровне).
+        played (int): Сыграно партий.
+        wins (int): Побед.
+        presses (int): Нажатий на карточки.
+    """
+
+    def __init__(
+        self,
+        game,
+        bot,
+        games=None,
+        interval=0,
+        hide_delay=None,
+        on_finished=None,
+    ):
+        """Создаёт автоигрока (запуск - start()).
+
+        Args:
+            game: Окно MemoryGame.
+            bot: Бот (myself_moduls/bots.py).
+            games: Сколько партий сыграть.
+            interval: Интервал шагов в миллисекундах.
+            hide_delay: Время показа несовпавших карточек в мс.
+            on_finished: Функция, вызываемая после последней партии.
+        """
+        super().__init__(game)
+        self.game = game
+        self.bot = bot
+        self.games = games
+        self.hide_delay = hide_delay
+        self.on_finished = on_finished
+        self.played = self.wins = self.presses = 0
+        self.started_at = None
+        self._engine = None
+        self._pressing = False
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.step)
+
+    def start(self):
+        """Начинает автоигру."""
+        self.started_at = time.perf_counter()
+        self._timer.start()
+
+    def stop(self):
+        """Останавливает автоигру."""
+        self._timer.stop()
+
+    def step(self):
+        """Выполняет один шаг автоигры."""
+        try:
+            dialog = self.game._result_dialog
+            if dialog is not None and dialog.isVisible():
+                self._finish_game(dialog)
+                return
+            engine = self.game.engine
+            if engine is not self._engine:
+                # новая доска: бот забывает старую
+                self._engine = engine
+                self.bot.reset()
+                if self.hide_delay is not None:
+                    self.game.time_show = self.hide_delay
+            if (
+                self._pressing
+                or engine.is_checking
+                or len(engine.turned_cards) >= 2
+            ):
+                return
+            index_card = self.bot.pick(engine)
+            self._pressing = True
+            QTimer.singleShot(0, lambda: self._press(engine, index_card))
+        except Exception as e:
+            print(f"Ошибка автоигры: {e}")
+            self.stop()
+
+    def _press(self, engine, index_card):
+        """Нажимает карточку (может не вернуться до закрытия диалога)."""
+        self._pressing = False
+        if engine is not self.game.engine:
+            return
+        try:
+            self.presses += 1
+            self.bot.observe(index_card, engine.image_ids[index_card])
+            self.game.press_card(index_card)
+        except Exception as e:
+            print(f"Ошибка автоигры: {e}")
+            self.stop()
+
+    def _finish_game(self, dialog):
+        """Засчитывает партию и закрывает диалог результата."""
+        self.played += 1
+        self.wins += bool(dialog.win)
+        if self.games is not None and self.played >= self.games:
+            self.stop()
+            dialog.accept()
+            if self.on_finished:
+                self.on_finished()
+            return
+        dialog.btn_play.click()
+
+    def stats(self):
+        """Возвращает статистику автоигры.
+
+        Returns:
+            dict: played, wins, presses, level, seconds, games_per_s,
+            peak_memory_kb.
+        """
+        now = time.perf_counter()
+        seconds = now - (self.started_at or now)
+        return {
+            "played": self.played,
+            "wins": self.wins,
+            "presses": self.presses,
+            "level": self.game.current_lvl,
+            "seconds": seconds,
+            "games_per_s": self.played / seconds if seconds else 0.0,
+            "peak_memory_kb": peak_memory_kb(),
+        }
+
+
+class ReplayPlayer(QObject):
+    """Воспроизводит записанную партию в окне игры.
+
+    Карточки нажимаются через MemoryGame.press_card с теми же
+    интервалами, что в записи (делёнными на speed). Если в момент
+    нажатия ещё показываются несовпавшие карточки, нажатие ждёт.
+
+    Attributes:
+        game (MemoryGame): Окно игры.
+        replay (Replay): Запись партии.
+        speed (float): Множитель скорости воспроизведения.
+        pressed (int): Сколько переворотов воспроизведено.
+    """
+
+    RETRY_MS = 10
+
+    def __init__(self, game, replay, speed=1.0, on_finished=None):
+        """Создаёт проигрыватель (запуск - start()).
+
+        Args:
+            game: Окно MemoryGame.
+            replay: Запись партии (Replay).
+            speed: Множитель скорости.
+            on_finished: Функция, вызываемая после последнего нажатия.
+        """
+        super().__init__(game)
+        self.game = game
+        self.replay = replay
+        self.speed = speed
+        self.on_finished = on_finished
+        self.pressed = 0
+        self._started = 0.0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.step)
+
+    def start(self):
+        """Раскладывает доску записи и начинает воспроизведение."""
+        self.game.reset_level(replay=self.replay)
+        self.pressed = 0
+        self._started = time.perf_counter()
+        self._schedule()
+
+    def _schedule(self):
+        """Ставит таймер на следующее нажатие из записи."""
+        if self.pressed >= len(self.replay):
+            if self.on_finished:
+                self.on_finished()
+            return
+        due = self.replay.times[self.pressed] / self.speed
+        elapsed = (time.perf_counter() - self._started) * 1000
+        self._timer.start(max(0, int(due - elapsed)))
+
+    def step(self):
+        """Нажимает следующую карточку из записи."""
+        try:
+            engine = self.game.engine
+            if engine.is_checking or len(engine.turned_cards) >= 2:
+                self._timer.start(self.RETRY_MS)
+                return
+            index_card = self.replay.cards[self.pressed]
+            self.pressed += 1
+            self.game.press_card(index_card)
+            self._schedule()
+        except Exception as e:
+            print(f"Ошибка воспроизведения партии: {e}")
+
+
+def _make_game(folder):
+    """Создаёт окно игры с прогрессом и записями во временной папке."""
+    from memory_game import MemoryGame
+    from myself_moduls.records import Progress
+    from myself_moduls.replay import ReplayLog
+    from myself_moduls.telemetry import Telemetry
+
+    return MemoryGame(
+        progress=Progress(file_name=os.path.join(folder, "progress.json")),
+        replays=ReplayLog(os.path.join(folder, "replays.ndjson")),
+        telemetry=Telemetry(os.path.join(folder, "telemetry.ndjson")),
+    )
+
+
+def play_replay(replay, speed=1.0):
+    """Показывает записанную партию в окне игры.
+
+    Args:
+        replay: Запись партии (Replay).
+        speed: Множитель скорости.
+
+    Returns:
+        int: Код выхода (0).
+    """
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as folder:
+        game = _make_game(folder)
+        game.show()
+
+        def finished():
+            print(
+                f"Воспроизведено переворотов: {len(replay)}, "
+                f"итог: {game.engine.status()} (записано {replay.result})"
+            )
+
+        player = ReplayPlayer(game, replay, speed, on_finished=finished)
+        QTimer.singleShot(0, player.start)
+        app.exec_()
+        game.close()
+    return 0
+
+
+def main(argv):
+    """Запускает автоигру в offscreen-режиме и печатает статистику."""
+    parser = argparse.ArgumentParser(description="Автоигра Memory Game")
+    parser.add_argument("--bot", default="perfect")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--hide-delay", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as folder:
+        game = _make_game(folder)
+        game.show()
+        player = AutoPlayer(
+            game,
+            make_bot(args.bot, random.Random(args.seed)),
+            games=args.games,
+            hide_delay=args.hide_delay,
+            on_finished=app.quit,
+        )
+        player.start()
+        app.exec_()
+        stats = player.stats()
+        game.close()
+    print(
+        f"{args.bot}: партий {stats['played']}, побед {stats['wins']}, "
+        f"нажатий {stats['presses']}, уровень {stats['level']}, "
+        f"{stats['games_per_s']:.1f} партий/с, "
+        f"пик памяти {stats['peak_memory_kb']} КБ"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
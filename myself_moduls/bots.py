@@ -0,0 +1,170 @@
+"""
+Боты-игроки для GameEngine.
+
+Бот выбирает, какую карточку перевернуть, и видит изображение карточки
+только после её переворота (observe), как живой игрок. Стратегии:
+    RandomBot - случайные карточки без памяти;
+    MemoryBot(capacity=None) - идеальная память;
+    MemoryBot(capacity=N) - помнит только N последних увиденных карточек.
+
+Боты используются для автоигры в живом интерфейсе
+(myself_moduls/autoplay.py) и для прогона партий без Qt (play_engine).
+"""
+
+import random
+from collections import OrderedDict
+
+
+class Bot:
+    """Базовый класс стратегии бота.
+
+    Attributes:
+        rng (random.Random): Источник случайных чисел.
+    """
+
+    name = "bot"
+
+    def __init__(self, rng=None):
+        """Создаёт бота.
+
+        Args:
+            rng: random.Random (по умолчанию новый без зерна).
+        """
+        self.rng = rng or random.Random()
+
+    def reset(self):
+        """Забывает всё перед новой доской."""
+
+    def observe(self, index_card, image_id):
+        """Запоминает увиденное изображение карточки.
+
+        Args:
+            index_card: Индекс перевернутой карточки.
+            image_id: Идентификатор изображения.
+        """
+
+    def pick(self, engine):
+        """Выбирает карточку для переворота.
+
+        Args:
+            engine: GameEngine с текущей доской.
+
+        Returns:
+            int: Индекс карточки, которую можно перевернуть.
+        """
+        return self.rng.choice(self.candidates(engine))
+
+    @staticmethod
+    def candidates(engine):
+        """Возвращает индексы карточек, которые можно перевернуть."""
+        return [
+            i
+            for i in range(len(engine))
+            if not engine.found[i] and not engine.turned[i]
+        ]
+
+
+class RandomBot(Bot):
+    """Переворачивает случайные карточки, ничего не запоминая."""
+
+    name = "random"
+
+
+class MemoryBot(Bot):
+    """Бот с памятью на capacity последних увиденных карточек.
+
+    Если в памяти есть пара - открывает её. Иначе открывает карточку,
+    которой нет в памяти, а второй картой - пару к первой, если помнит
+    её, или снова незнакомую карточку.
+
+    Attributes:
+        capacity (int | None): Размер памяти (None - без ограничения).
+    """
+
+    def __init__(self, capacity=None, rng=None):
+        """Создаёт бота.
+
+        Args:
+            capacity: Сколько карточек бот помнит (None - все).
+            rng: random.Random.
+        """
+        super().__init__(rng)
+        self.capacity = capacity
+        self.name = "perfect" if capacity is None else f"memory:{capacity}"
+        self._memory = OrderedDict()
+
+    def reset(self):
+        """Забывает все карточки."""
+        self._memory.clear()
+
+    def observe(self, index_card, image_id):
+        """Запоминает карточку, вытесняя самую давнюю при переполнении."""
+        self._memory[index_card] = image_id
+        self._memory.move_to_end(index_card)
+        if self.capacity is not None:
+            while len(self._memory) > self.capacity:
+                self._memory.popitem(last=False)
+
+    def pick(self, engine):
+        """Выбирает карточку по памяти, иначе незнакомую."""
+        for index_card in [i for i in self._memory if engine.found[i]]:
+            del self._memory[index_card]
+        candidates = self.candidates(engine)
+        if engine.turned_cards:
+            wanted = engine.image_ids[engine.turned_cards[0]]
+            for index_card, image_id in self._memory.items():
+                if image_id == wanted and not engine.turned[index_card]:
+                    return index_card
+        else:
+            seen = {}
+            for index_card, image_id in self._memory.items():
+                if image_id in seen:
+                    return seen[image_id]
+                seen[image_id] = index_card
+        unknown = [i for i in candidates if i not in self._memory]
+        return self.rng.choice(unknown or candidates)
+
+
+def make_bot(spec, rng=None):
+    """Создаёт бота по описанию.
+
+    Args:
+        spec: 'random', 'perfect' или 'memory:N'.
+        rng: random.Random.
+
+    Returns:
+        Bot: Бот.
+
+    Raises:
+        ValueError: Если описание не распознано.
+    """
+    if spec == "random":
+        return RandomBot(rng)
+    if spec == "perfect":
+        return MemoryBot(None, rng)
+    if spec.startswith("memory:"):
+        return MemoryBot(int(spec.split(":", 1)[1]), rng)
+    raise ValueError(f"Неизвестный бот: {spec}")
+
+
+def play_engine(engine, bot):
+    """Доигрывает партию ботом без интерфейса.
+
+    Args:
+        engine: GameEngine с разложенной доской.
+        bot: Бот.
+
+    Returns:
+        str: 'win' или 'lose'.
+    """
+    bot.reset()
+    while engine.status() is None:
+        index_card = bot.pick(engine)
+        engine.turn(index_card)
+        bot.observe(index_card, engine.image_ids[index_card])
+        if len(engine.turned_cards) == 2:
+            index_1, index_2, match = engine.check_match()
+            engine.apply_match(index_1, index_2, match)
+            if not match:
+                engine.hide_cards(index_1, index_2)
+    return engine.status()
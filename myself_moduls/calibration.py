@@ -0,0 +1,416 @@
+"""
+Калибровка сложности уровней методом Монте-Карло.
+
+Для каждого размера поля разыгрывается много партий сразу: доски,
+найденные карточки и память игрока хранятся массивами NumPy формы
+(партии, карточки), и один шаг цикла делает ход во всех партиях.
+Игрок моделируется стратегиями ботов (myself_moduls/bots.py):
+'random', 'perfect' и 'memory:N'. Время показа карточек не
+моделируется.
+
+Партия играется до победы (или до предела промахов), и считается
+распределение количества промахов. Ходы тратятся только на промахи,
+поэтому партия с k промахами выигрывается при бюджете больше k, и
+одного распределения хватает для вероятности победы при любом
+бюджете ходов и для подбора бюджета под целевую вероятность.
+
+Требуется NumPy (в игру не входит):
+    python -m myself_moduls.calibration [--levels N] [--bot СТРАТЕГИЯ]
+        [--games N] [--workers N] [--target НАЧАЛО:КОНЕЦ] [--seed N]
+        [--board-side N] [--grow-every N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from myself_moduls.bots import RandomBot, make_bot
+from myself_moduls.level_manager import LevelManager
+
+# Партий в одном блоке: блок обрабатывается одним процессом, а его
+# массивы (партии x карточки) помещаются в кеш процессора
+CHUNK_GAMES = 1 << 15
+
+
+def strategy_capacity(spec):
+    """Возвращает размер памяти игрока для стратегии бота.
+
+    Args:
+        spec: 'random', 'perfect' или 'memory:N'.
+
+    Returns:
+        int | None: 0 - без памяти, None - идеальная память.
+
+    Raises:
+        ValueError: Если стратегия не распознана.
+    """
+    bot = make_bot(spec)
+    return 0 if isinstance(bot, RandomBot) else bot.capacity
+
+
+def _observe(seen_at, cards, clock, capacity):
+    """Запоминает перевернутые карточки, вытесняя самые давние.
+
+    Как у MemoryBot: в памяти не больше capacity карточек, а
+    вытесненная карточка забывается до следующего переворота.
+
+    Args:
+        seen_at: Моменты переворота (0 - карточки нет в памяти).
+        cards: Плоские индексы перевернутых карточек (по одной в партии).
+        clock: Текущий момент.
+        capacity: Размер памяти.
+    """
+    seen_at.ravel()[cards] = clock
+    full = np.flatnonzero(np.count_nonzero(seen_at, axis=1) > capacity)
+    if full.size:
+        stamps = seen_at[full]
+        stamps[stamps == 0] = clock + 1
+        seen_at[full, stamps.argmin(axis=1)] = 0
+
+
+def _pick(rng, preferred, allowed):
+    """Выбирает в каждой партии случайную карточку.
+
+    Выбор идёт среди preferred, а если в партии таких нет - среди
+    allowed (preferred входит в allowed, в каждой партии allowed не
+    пуст). Ключ карточки: случайное число из [0, 1) плюс 1 за allowed
+    и ещё 1 за preferred, а у запрещённых карточек ключ 0.
+    """
+    score = rng.random(allowed.shape, dtype=np.float32)
+    score += allowed
+    score += preferred
+    score *= allowed
+    return score.argmax(axis=1)
+
+
+def simulate_chunk(pairs, capacity, games, max_misses, seed):
+    """Разыгрывает блок партий на поле из pairs пар.
+
+    Args:
+        pairs: Количество пар на поле.
+        capacity: Память игрока (см. strategy_capacity).
+        games: Количество партий.
+        max_misses: Предел промахов: партия, дошедшая до него,
+            останавливается.
+        seed: Зерно (int или numpy.random.SeedSequence).
+
+    Returns:
+        numpy.ndarray: counts длины max_misses + 1; counts[k] -
+        количество партий, выигранных с k промахами, counts[max_misses] -
+        партий, не выигранных до предела.
+    """
+    rng = np.random.default_rng(seed)
+    size = 2 * pairs
+    index_type = np.int16 if size < 2**15 else np.intp
+    rows = np.arange(games)[:, None]
+    # перестановка: карточки perm[2i] и perm[2i + 1] - пара
+    perm = rng.random((games, size), dtype=np.float32).argsort(axis=1)
+    partner = np.empty((games, size), dtype=index_type)
+    partner[rows, perm[:, 0::2]] = perm[:, 1::2]
+    partner[rows, perm[:, 1::2]] = perm[:, 0::2]
+    del perm
+    found = np.zeros((games, size), dtype=bool)
+    # идеальная память - маска увиденных карточек, ограниченная -
+    # моменты последнего переворота (вытесняются самые давние)
+    if capacity is not None and capacity >= size:
+        capacity = None
+    stamped = bool(capacity)
+    if stamped:
+        seen_at = np.zeros((games, size), dtype=np.int32)
+    elif capacity is None:
+        seen = np.zeros((games, size), dtype=bool)
+    misses = np.zeros(games, dtype=np.int64)
+    pairs_left = np.full(games, pairs, dtype=np.int64)
+    counts = np.zeros(max_misses + 1, dtype=np.int64)
+    clock = 0
+    compact = True
+    while misses.size:
+        if compact:
+            # плоские индексы: карточка i партии g - элемент g * size + i
+            offsets = np.arange(misses.size) * size
+            partner_flat = (partner + offsets[:, None]).ravel()
+            compact = False
+        closed = ~found
+        if capacity == 0:
+            first = offsets + _pick(rng, closed, closed)
+        else:
+            if stamped:
+                # найденные пары бот удаляет из памяти перед выбором
+                seen_at *= closed
+                known = seen_at > 0
+            else:
+                known = seen & closed
+            pair = known & known.ravel()[partner_flat].reshape(known.shape)
+            pair_at = pair.argmax(axis=1)
+            first = offsets + np.where(
+                pair.ravel()[offsets + pair_at],
+                pair_at,
+                _pick(rng, closed & ~known, closed),
+            )
+            if stamped:
+                clock += 1
+                _observe(seen_at, first, clock, capacity)
+            else:
+                seen.ravel()[first] = True
+        wanted = partner_flat[first]
+        allowed = closed
+        allowed.ravel()[first] = False
+        if capacity == 0:
+            second = offsets + _pick(rng, allowed, allowed)
+        else:
+            if stamped:
+                known = seen_at > 0
+                wanted_known = known.ravel()[wanted]
+            else:
+                wanted_known = seen.ravel()[wanted]
+            second = np.where(
+                wanted_known,
+                wanted,
+                offsets + _pick(rng, allowed & ~known, allowed),
+            )
+            if stamped:
+                clock += 1
+                _observe(seen_at, second, clock, capacity)
+            else:
+                seen.ravel()[second] = True
+        match = second == wanted
+        found.ravel()[first[match]] = True
+        found.ravel()[second[match]] = True
+        pairs_left -= match
+        misses += ~match
+        done = (pairs_left == 0) | (misses >= max_misses)
+        if done.any():
+            counts += np.bincount(misses[done], minlength=max_misses + 1)
+            keep = ~done
+            partner, found = partner[keep], found[keep]
+            misses, pairs_left = misses[keep], pairs_left[keep]
+            if stamped:
+                seen_at = seen_at[keep]
+            elif capacity is None:
+                seen = seen[keep]
+            compact = True
+    return counts
+
+
+def _run_chunk(task):
+    """Распаковывает аргументы simulate_chunk (для пула процессов)."""
+    return simulate_chunk(*task)
+
+
+def simulate(
+    pairs,
+    strategy="perfect",
+    games=100_000,
+    max_misses=64,
+    seed=None,
+    workers=None,
+):
+    """Разыгрывает партии блоками, при workers > 1 - в нескольких процессах.
+
+    Результат при заданном seed не зависит от количества процессов.
+
+    Args:
+        pairs: Количество пар на поле.
+        strategy: Стратегия игрока ('random', 'perfect', 'memory:N').
+        games: Количество партий.
+        max_misses: Предел промахов (см. simulate_chunk).
+        seed: Зерно генератора случайных чисел.
+        workers: Количество процессов (None - по числу ядер).
+
+    Returns:
+        numpy.ndarray: Распределение промахов (см. simulate_chunk).
+    """
+    capacity = strategy_capacity(strategy)
+    sizes = [CHUNK_GAMES] * (games // CHUNK_GAMES)
+    if games % CHUNK_GAMES:
+        sizes.append(games % CHUNK_GAMES)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [
+        (pairs, capacity, size, max_misses, chunk_seed)
+        for size, chunk_seed in zip(sizes, seeds)
+    ]
+    counts = np.zeros(max_misses + 1, dtype=np.int64)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        try:
+            with ProcessPoolExecutor(workers) as pool:
+                for chunk in pool.map(_run_chunk, tasks):
+                    counts += chunk
+            return counts
+        except Exception as e:
+            print(f"Параллельная симуляция недоступна: {e}")
+            counts[:] = 0
+    for task in tasks:
+        counts += _run_chunk(task)
+    return counts
+
+
+def win_probability(counts, moves):
+    """Возвращает вероятность победы при бюджете moves ходов.
+
+    Args:
+        counts: Распределение промахов (simulate).
+        moves: Количество ходов уровня.
+    """
+    return float(counts[: max(moves, 0)].sum() / counts.sum())
+
+
+def suggest_moves(counts, target):
+    """Подбирает наименьший бюджет ходов с вероятностью победы >= target.
+
+    Args:
+        counts: Распределение промахов (simulate).
+        target: Целевая вероятность победы (от 0 до 1).
+
+    Returns:
+        int | None: Количество ходов или None, если цель не достигается
+        в пределах симуляции.
+    """
+    cdf = np.cumsum(counts[:-1]) / counts.sum()
+    moves = int(np.searchsorted(cdf, target - 1e-12)) + 1
+    return moves if moves <= len(cdf) else None
+
+
+def target_curve(levels, start=0.95, end=0.5):
+    """Возвращает целевые вероятности победы, линейно от start до end.
+
+    Args:
+        levels: Номера уровней по порядку.
+        start: Вероятность победы на первом уровне из levels.
+        end: Вероятность победы на последнем уровне из levels.
+    """
+    levels = list(levels)
+    if len(levels) < 2:
+        return {lvl: start for lvl in levels}
+    step = (end - start) / (len(levels) - 1)
+    return {lvl: start + step * i for i, lvl in enumerate(levels)}
+
+
+def calibrate(
+    level_manager,
+    levels,
+    strategy="perfect",
+    games=100_000,
+    target=(0.95, 0.5),
+    seed=None,
+    workers=None,
+):
+    """Оценивает вероятность победы на уровнях и подбирает бюджеты ходов.
+
+    Для каждого размера поля партии разыгрываются один раз.
+
+    Args:
+        level_manager: LevelManager с правилами уровней.
+        levels: Номера уровней.
+        strategy: Стратегия игрока.
+        games: Количество партий на каждый размер поля.
+        target: (начало, конец) целевой кривой вероятности победы.
+        seed: Зерно генератора случайных чисел.
+        workers: Количество процессов (None - по числу ядер).
+
+    Returns:
+        list: Словари {level, board, lvl_type, moves, win_prob, target,
+        suggested} по уровням.
+    """
+    levels = list(levels)
+    targets = target_curve(levels, *target)
+    rules = {}
+    by_pairs = {}
+    for lvl in levels:
+        moves, _, lvl_type = level_manager.get_rules(lvl)
+        rows, cols = level_manager.get_board_size(lvl)
+        rules[lvl] = (moves, lvl_type, rows, cols)
+        by_pairs.setdefault(rows * cols // 2, []).append(moves)
+    distributions = {
+        pairs: simulate(
+            pairs,
+            strategy,
+            games,
+            # запас, чтобы подобрать бюджет больше текущего
+            max(2 * max(budgets), 4 * pairs),
+            seed,
+            workers,
+        )
+        for pairs, budgets in by_pairs.items()
+    }
+    report = []
+    for lvl in levels:
+        moves, lvl_type, rows, cols = rules[lvl]
+        counts = distributions[rows * cols // 2]
+        report.append(
+            {
+                "level": lvl,
+                "board": f"{rows}x{cols}",
+                "lvl_type": lvl_type,
+                "moves": moves,
+                "win_prob": win_probability(counts, moves),
+                "target": targets[lvl],
+                "suggested": suggest_moves(counts, targets[lvl]),
+            }
+        )
+    return report
+
+
+def parse_target(text):
+    """Разбирает целевую кривую 'НАЧАЛО:КОНЕЦ' (например, '0.95:0.5')."""
+    start, _, end = text.partition(":")
+    return float(start), float(end or start)
+
+
+def main(argv):
+    """Печатает вероятности победы и предлагаемые бюджеты ходов."""
+    parser = argparse.ArgumentParser(
+        description="Калибровка сложности уровней Memory Game"
+    )
+    parser.add_argument("--levels", type=int, default=14)
+    parser.add_argument("--bot", default="perfect")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    # по умолчанию - все ядра (os.cpu_count())
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--target", type=parse_target, default="0.95:0.5")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--board-side", type=int, default=4)
+    parser.add_argument("--grow-every", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        manager = LevelManager(
+            board_side=args.board_side, grow_every=args.grow_every
+        )
+        start = time.perf_counter()
+        report = calibrate(
+            manager,
+            range(1, args.levels + 1),
+            args.bot,
+            args.games,
+            args.target,
+            args.seed,
+            args.workers,
+        )
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        print(f"Ошибка калибровки: {e}")
+        return 1
+    print(f"Стратегия {args.bot}, {args.games:,} партий на размер поля")
+    print("уровень  поле    тип        ходы  победа  цель   предложено")
+    for row in report:
+        suggested = row["suggested"] or "-"
+        print(
+            f"{row['level']:>7}  {row['board']:<6}  {row['lvl_type']:<9}"
+            f"  {row['moves']:>4}  {row['win_prob']:>6.1%}"
+            f"  {row['target']:>5.0%}  {suggested:>10}"
+        )
+    boards = len({row["board"] for row in report})
+    print(
+        f"Время: {elapsed:.2f} с, "
+        f"{args.games * boards / elapsed:,.0f} партий/с"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
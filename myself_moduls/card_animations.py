@@ -0,0 +1,217 @@
+"""
+Анимации карточек: переворот и галочка найденной пары.
+
+Все анимации выполняет один AnimationDriver (один таймер на кадр),
+а рисуют их виджеты-наложения из пула: наложение ставится поверх
+карточки на время анимации и затем возвращается в пул, поэтому при
+каждом перевороте или совпадении не создаются новые виджеты и не
+разбираются таблицы стилей.
+"""
+
+import math
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QColor, QFont, QPainter
+from PyQt5.QtWidgets import QGraphicsOpacityEffect, QWidget
+
+from myself_moduls.animation_driver import AnimationDriver
+
+
+class FlipOverlay(QWidget):
+    """Наложение, рисующее переворот карточки.
+
+    Первая половина анимации сжимает по ширине снимок карточки до
+    переворота, вторая - разжимает снимок после переворота.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._before = self._after = None
+        self._progress = 0.0
+
+    def set_pixmaps(self, before, after):
+        """Задаёт снимки карточки до и после переворота."""
+        self._before, self._after = before, after
+
+    def set_progress(self, progress):
+        """Задаёт этап анимации (от 0 до 1) и запрашивает перерисовку."""
+        self._progress = progress
+        self.update()
+
+    def paintEvent(self, event):
+        """Рисует снимок карточки, сжатый по ширине."""
+        pixmap = self._before if self._progress < 0.5 else self._after
+        if pixmap is None:
+            return
+        scale = abs(math.cos(math.pi * self._progress))
+        width = self.width() * scale
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawPixmap(
+            QRectF((self.width() - width) / 2, 0, width, self.height()),
+            pixmap,
+            QRectF(pixmap.rect()),
+        )
+        painter.end()
+
+
+class CheckmarkOverlay(QWidget):
+    """Наложение с галочкой найденной пары.
+
+    Галочка появляется с увеличением, держится и плавно исчезает.
+    Шрифт и цвет задаются один раз при создании наложения.
+    """
+
+    COLOR = QColor(50, 205, 50)
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._font = QFont(self.font())
+        self._font.setBold(True)
+        self._progress = 0.0
+
+    def set_progress(self, progress):
+        """Задаёт этап анимации (от 0 до 1) и запрашивает перерисовку."""
+        self._progress = progress
+        self.update()
+
+    def paintEvent(self, event):
+        """Рисует галочку с масштабом и прозрачностью по этапу."""
+        progress = self._progress
+        scale = min(1.0, progress / 0.15)
+        opacity = 1.0 if progress < 0.7 else (1.0 - progress) / 0.3
+        if scale <= 0 or opacity <= 0:
+            return
+        self._font.setPixelSize(
+            max(1, int(min(self.width(), self.height()) * 0.6 * scale))
+        )
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setOpacity(opacity)
+        painter.setFont(self._font)
+        painter.setPen(self.COLOR)
+        painter.drawText(self.rect(), Qt.AlignCenter, "✓︎")
+        painter.end()
+
+
+class OverlayPool:
+    """Пул виджетов-наложений одного типа.
+
+    Attributes:
+        created (int): Сколько наложений создано за всё время.
+    """
+
+    def __init__(self, factory, parent):
+        """Создаёт пустой пул.
+
+        Args:
+            factory: Класс наложения (вызывается как factory(parent)).
+            parent: Родитель наложений (виджет с карточками).
+        """
+        self._factory = factory
+        self._parent = parent
+        self._free = []
+        self.created = 0
+
+    def acquire(self, geometry):
+        """Возвращает наложение, поставленное поверх указанной области.
+
+        Args:
+            geometry: Прямоугольник наложения (QRect) в координатах
+                родителя.
+        """
+        if self._free:
+            overlay = self._free.pop()
+        else:
+            overlay = self._factory(self._parent)
+            self.created += 1
+        overlay.setGeometry(geometry)
+        overlay.raise_()
+        overlay.show()
+        return overlay
+
+    def release(self, overlay):
+        """Прячет наложение и возвращает его в пул."""
+        overlay.hide()
+        self._free.append(overlay)
+
+
+class CardAnimator:
+    """Анимации карточек на одном драйвере и пулах наложений.
+
+    Attributes:
+        driver (AnimationDriver): Общий драйвер анимаций.
+    """
+
+    def __init__(self, parent, driver=None):
+        """Создаёт пулы наложений.
+
+        Args:
+            parent: Виджет, в котором лежат карточки.
+            driver: Драйвер анимаций (по умолчанию новый).
+        """
+        self.driver = driver or AnimationDriver()
+        self._flips = OverlayPool(FlipOverlay, parent)
+        self._checkmarks = OverlayPool(CheckmarkOverlay, parent)
+
+    def flip(self, card, icon, duration=200):
+        """Меняет иконку карточки с анимацией переворота.
+
+        Иконка меняется сразу, а на время анимации карточка становится
+        прозрачной (QGraphicsOpacityEffect с нулевой непрозрачностью)
+        под наложением. Карточка остаётся видимой: её тень не пропадает,
+        а клики по ней не теряются (наложение прозрачно для мыши).
+
+        Args:
+            card: Карточка (QPushButton).
+            icon: Новая иконка (QIcon; пустая - рубашка).
+            duration: Длительность в миллисекундах.
+        """
+        key = ("flip", card)
+        self.driver.finish(key)
+        if not card.isVisible():
+            card.setIcon(icon)
+            return
+        before = card.grab()
+        card.setIcon(icon)
+        after = card.grab()
+        # эффект создаётся один раз на карточку и включается на время
+        # переворота; полностью прозрачный эффект ничего не рисует
+        effect = card.graphicsEffect()
+        if not isinstance(effect, QGraphicsOpacityEffect):
+            effect = QGraphicsOpacityEffect(card)
+            effect.setOpacity(0.0)
+            card.setGraphicsEffect(effect)
+        effect.setEnabled(True)
+        overlay = self._flips.acquire(card.geometry())
+        overlay.set_pixmaps(before, after)
+
+        def done():
+            effect.setEnabled(False)
+            overlay.set_pixmaps(None, None)
+            self._flips.release(overlay)
+
+        self.driver.start(key, duration, overlay.set_progress, done)
+
+    def checkmark(self, card, duration=1000):
+        """Показывает над карточкой галочку найденной пары.
+
+        Args:
+            card: Карточка (QPushButton).
+            duration: Длительность в миллисекундах.
+        """
+        key = ("checkmark", card)
+        self.driver.finish(key)
+        overlay = self._checkmarks.acquire(card.geometry())
+        self.driver.start(
+            key,
+            duration,
+            overlay.set_progress,
+            lambda: self._checkmarks.release(overlay),
+        )
+
+    def finish_all(self):
+        """Завершает все анимации (например, перед новым уровнем)."""
+        self.driver.finish_all()
@@ -0,0 +1,121 @@
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QIcon, QImage, QPixmap
+
+from myself_moduls.lru_cache import SizedLruCache
+
+
+class CardFaceCache:
+    """Кеш готовых к отрисовке лицевых сторон карточек.
+
+    Изображение читается с диска и декодируется один раз для каждого
+    сочетания (путь, размер иконки, device pixel ratio), сразу
+    масштабируется под размер иконки и хранится как QIcon с одним
+    QPixmap нужного размера. Повторный переворот карточки не обращается
+    к диску и не масштабирует PNG заново.
+
+    Если передан реестр атласов, изображения вырезаются из атласа папки
+    вместо чтения отдельных файлов.
+
+    Attributes:
+        DEFAULT_MAX_BYTES (int): Ограничение памяти по умолчанию (64 МБ).
+        cache (SizedLruCache): LRU-кеш иконок, стоимость - байты пикселей.
+        atlases (AtlasRegistry | None): Атласы папок изображений.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, atlases=None):
+        """Создаёт кеш.
+
+        Args:
+            max_bytes: Максимальный объём памяти под пиксели в байтах.
+            atlases: Реестр атласов (AtlasRegistry) или None.
+        """
+        self.cache = SizedLruCache(max_bytes)
+        self.atlases = atlases
+
+    @staticmethod
+    def make_key(path, size, dpr):
+        """Возвращает ключ кеша для изображения.
+
+        Args:
+            path: Путь к изображению.
+            size: Размер иконки (QSize) в логических пикселях.
+            dpr: Device pixel ratio экрана.
+        """
+        return path, size.width(), size.height(), round(dpr, 2)
+
+    def load_image(self, path, size, dpr=1.0):
+        """Читает изображение и масштабирует его под размер иконки.
+
+        Работает с QImage, поэтому может вызываться не из GUI-потока.
+
+        Args:
+            path: Путь к изображению.
+            size: Размер иконки (QSize) в логических пикселях.
+            dpr: Device pixel ratio экрана.
+
+        Returns:
+            QImage: Масштабированное изображение (пустое при ошибке чтения).
+        """
+        image = self.atlases.sprite(path) if self.atlases else None
+        if image is None:
+            image = QImage(path)
+        if image.isNull():
+            return image
+        target = QSize(int(size.width() * dpr), int(size.height() * dpr))
+        if target.isEmpty():
+            return image
+        image = image.scaled(
+            target, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+        image.setDevicePixelRatio(dpr)
+        return image
+
+    def put_image(self, path, size, dpr, image):
+        """Кладёт в кеш заранее подготовленное изображение.
+
+        Вызывается только из GUI-потока: QPixmap создаётся здесь.
+        Пустое изображение (ошибка чтения) в кеш не попадает, чтобы
+        следующий переворот попробовал прочитать файл снова.
+
+        Args:
+            path: Путь к изображению.
+            size: Размер иконки (QSize).
+            dpr: Device pixel ratio экрана.
+            image: QImage, полученный из load_image.
+
+        Returns:
+            QIcon: Готовая иконка (пустая при ошибке чтения).
+        """
+        if image.isNull():
+            print(f"Ошибка чтения изображения карточки: {path}")
+            return QIcon()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        icon = QIcon(pixmap)
+        cost = max(image.bytesPerLine() * image.height(), 1)
+        self.cache.put(self.make_key(path, size, dpr), icon, cost)
+        return icon
+
+    def get_icon(self, path, size, dpr=1.0):
+        """Возвращает иконку карточки из кеша, загружая её при промахе.
+
+        Args:
+            path: Путь к изображению.
+            size: Размер иконки (QSize).
+            dpr: Device pixel ratio экрана.
+
+        Returns:
+            QIcon: Иконка, готовая к отрисовке в размере size.
+        """
+        icon = self.cache.get(self.make_key(path, size, dpr))
+        if icon is None:
+            icon = self.put_image(
+                path, size, dpr, self.load_image(path, size, dpr)
+            )
+        return icon
+
+    def clear(self):
+        """Очищает кеш."""
+        self.cache.clear()
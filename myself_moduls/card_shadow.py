@@ -0,0 +1,240 @@
+"""
+Тени карточек без QGraphicsDropShadowEffect.
+
+QGraphicsDropShadowEffect на каждой карточке рисует карточку во
+внеэкранный буфер и размывает его при каждой перерисовке (переворот,
+наведение, изменение размера окна). Здесь тень размывается один раз:
+ShadowRenderer готовит размытое изображение прямоугольника со
+скруглёнными углами и рисует его как nine-slice (углы как есть,
+стороны и середина растягиваются), поэтому одно изображение подходит
+для карточек любого размера. CardShadowLayer - прозрачный виджет под
+карточками, который рисует тени всех карточек за один проход.
+"""
+
+from PyQt5.QtCore import QEvent, QPoint, QRect, QRectF, Qt
+from PyQt5.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt5.QtWidgets import (
+    QGraphicsBlurEffect,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
+    QWidget,
+)
+
+
+def render_shadow(width, height, blur, radius, color, dpr=1.0):
+    """Рисует размытую тень прямоугольника со скруглёнными углами.
+
+    Args:
+        width: Ширина прямоугольника.
+        height: Высота прямоугольника.
+        blur: Радиус размытия (тень выходит за прямоугольник на blur).
+        radius: Радиус скругления углов.
+        color: Цвет тени (QColor).
+        dpr: Отношение физических пикселей к логическим.
+
+    Returns:
+        QPixmap: Тень размером (width + 2 * blur, height + 2 * blur).
+    """
+    full_w = round((width + 2 * blur) * dpr)
+    full_h = round((height + 2 * blur) * dpr)
+    source = QImage(full_w, full_h, QImage.Format_ARGB32_Premultiplied)
+    source.fill(Qt.transparent)
+    painter = QPainter(source)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(color)
+    painter.drawRoundedRect(
+        QRectF(blur * dpr, blur * dpr, width * dpr, height * dpr),
+        radius * dpr,
+        radius * dpr,
+    )
+    painter.end()
+
+    # размытие через сцену: тот же алгоритм, что у эффектов Qt
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(source))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur * dpr)
+    effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+    scene.setSceneRect(0, 0, full_w, full_h)
+    result = QImage(full_w, full_h, QImage.Format_ARGB32_Premultiplied)
+    result.fill(Qt.transparent)
+    painter = QPainter(result)
+    scene.render(painter)
+    painter.end()
+
+    pixmap = QPixmap.fromImage(result)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+class ShadowRenderer:
+    """Готовит и рисует тени карточек.
+
+    Для каждого dpr тень размывается один раз и рисуется как nine-slice.
+    Карточки меньше углов nine-slice получают тень своего размера
+    (тоже размывается один раз на размер).
+
+    Attributes:
+        blur (int): Радиус размытия.
+        radius (int): Радиус скругления карточки.
+        color (QColor): Цвет тени.
+        renders (int): Сколько раз выполнялось размытие.
+    """
+
+    def __init__(self, blur=30, radius=15, color=None):
+        """Создаёт пустой кеш теней.
+
+        Args:
+            blur: Радиус размытия.
+            radius: Радиус скругления карточки.
+            color: Цвет тени (по умолчанию как у прежнего эффекта).
+        """
+        self.blur = blur
+        self.radius = radius
+        self.color = color or QColor(120, 110, 140, 60)
+        self.renders = 0
+        self._cache = {}
+
+    @property
+    def margin(self):
+        """Ширина неоднородной полосы тени (углы nine-slice)."""
+        return 2 * self.blur + self.radius
+
+    def _pixmap(self, width, height, dpr):
+        """Возвращает тень прямоугольника заданного размера из кеша."""
+        key = (width, height, dpr)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = render_shadow(
+                width, height, self.blur, self.radius, self.color, dpr
+            )
+            self._cache[key] = pixmap
+            self.renders += 1
+        return pixmap
+
+    def draw(self, painter, rect, dpr=1.0):
+        """Рисует тень под прямоугольником карточки.
+
+        Args:
+            painter: QPainter.
+            rect: Прямоугольник карточки (QRect), уже со смещением тени.
+            dpr: Отношение физических пикселей к логическим.
+        """
+        blur, margin = self.blur, self.margin
+        target = rect.adjusted(-blur, -blur, blur, blur)
+        w, h = target.width(), target.height()
+        if w < 2 * margin + 1 or h < 2 * margin + 1:
+            pixmap = self._pixmap(rect.width(), rect.height(), dpr)
+            painter.drawPixmap(target.topLeft(), pixmap)
+            return
+        # базовая тень: углы и по одному пикселю стороны и середины
+        core = 2 * (margin - blur) + 1
+        source = self._pixmap(core, core, dpr)
+        x, y = target.x(), target.y()
+        xs = (0, margin, w - margin, w)
+        ys = (0, margin, h - margin, h)
+        src = (0, margin, margin + 1, 2 * margin + 1)
+        for row in range(3):
+            for col in range(3):
+                painter.drawPixmap(
+                    QRect(
+                        x + xs[col],
+                        y + ys[row],
+                        xs[col + 1] - xs[col],
+                        ys[row + 1] - ys[row],
+                    ),
+                    source,
+                    QRectF(
+                        src[col] * dpr,
+                        src[row] * dpr,
+                        (src[col + 1] - src[col]) * dpr,
+                        (src[row + 1] - src[row]) * dpr,
+                    ).toRect(),
+                )
+
+
+class CardShadowLayer(QWidget):
+    """Прозрачный слой под карточками, рисующий их тени.
+
+    Слой занимает весь родительский виджет, находится под остальными
+    дочерними виджетами и не принимает события мыши. Перерисовывается,
+    когда карточки перемещаются, меняют размер, скрываются или
+    показываются.
+
+    Attributes:
+        renderer (ShadowRenderer): Источник теней.
+        offset (int): Смещение тени вправо и вниз.
+    """
+
+    def __init__(self, parent, renderer=None, offset=10):
+        """Создаёт слой на родительском виджете карточек.
+
+        Args:
+            parent: Виджет, в котором лежат карточки.
+            renderer: ShadowRenderer (по умолчанию с параметрами
+                прежнего эффекта).
+            offset: Смещение тени вправо и вниз.
+        """
+        super().__init__(parent)
+        self.renderer = renderer or ShadowRenderer()
+        self.offset = offset
+        self._cards = []
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setGeometry(parent.rect())
+        parent.installEventFilter(self)
+        self.lower()
+        self.show()
+
+    def set_cards(self, cards):
+        """Задаёт карточки, под которыми рисуются тени.
+
+        Args:
+            cards: Список карточек (QPushButton) того же родителя.
+        """
+        for card in self._cards:
+            card.removeEventFilter(self)
+        self._cards = list(cards)
+        for card in self._cards:
+            card.installEventFilter(self)
+        self.update()
+
+    def set_shadow(self, blur, offset, radius=15):
+        """Меняет размер тени (например, для полей с мелкими карточками).
+
+        Args:
+            blur: Радиус размытия.
+            offset: Смещение тени.
+            radius: Радиус скругления карточки.
+        """
+        if (blur, radius) != (self.renderer.blur, self.renderer.radius):
+            self.renderer = ShadowRenderer(blur, radius, self.renderer.color)
+        self.offset = offset
+        self.update()
+
+    def eventFilter(self, obj, event):
+        """Следит за размером родителя и геометрией карточек."""
+        kind = event.type()
+        if obj is self.parent():
+            if kind == QEvent.Resize:
+                self.setGeometry(obj.rect())
+        elif kind in (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide):
+            self.update()
+        return False
+
+    def paintEvent(self, event):
+        """Рисует тени видимых карточек."""
+        painter = QPainter(self)
+        dpr = self.devicePixelRatioF()
+        clip = event.rect()
+        shift = QPoint(self.offset, self.offset)
+        for card in self._cards:
+            if card.isHidden():
+                continue
+            rect = card.geometry().translated(shift)
+            blur = self.renderer.blur
+            if clip.intersects(rect.adjusted(-blur, -blur, blur, blur)):
+                self.renderer.draw(painter, rect, dpr)
+        painter.end()
@@ -1,9 +1,9 @@
 from PyQt5.QtWidgets import QDialog
-from PyQt5 import uic
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 
 from myself_moduls.get_absolute_path import get_path
+from myself_moduls.ui_compiler import setup_ui
 
 
 def set_center_geometry(window, parent):
@@ -17,7 +17,15 @@ def set_center_geometry(window, parent):
 
 
 class GameResultDialog(QDialog):
-    """Диалоговое окно с результатом игры"""
+    """Диалоговое окно с результатом игры.
+
+    Создаётся один раз и переиспользуется: show_result настраивает
+    его под очередной результат и показывает модально.
+
+    Attributes:
+        win (bool): Результат, под который настроен диалог.
+        sounds: Менеджер звуков для воспроизведения.
+    """
 
     def __init__(self, win=True, sounds=None, parent=None):
         """Инициализирует диалог результата игры.
@@ -28,50 +36,77 @@ class GameResultDialog(QDialog):
             parent: Родительское окно.
         """
         super().__init__(parent, Qt.WindowType(Qt.FramelessWindowHint))
+        self.win = win
+        self.sounds = sounds
+        self._shown_result = None
         try:
-            uic.loadUi(get_path("game_result.ui"), self)
-            sounds.play_param("win" if win else "lose")
-            if parent:
-                set_center_geometry(self, parent)
+            setup_ui(self, get_path("game_result.ui"))
             self._init_result_config()
             self.result_ui(win)
             if parent:
-                self.btn_play.clicked.connect(lambda: self.close_window(win))
+                set_center_geometry(self, parent)
+                self.btn_play.clicked.connect(
+                    lambda: self.close_window(self.win)
+                )
         except FileNotFoundError as e:
             print(f"Файл интерфейса не найден: {e}")
         except Exception as e:
             print(f"Ошибка создания диалога: {e}")
 
     def _init_result_config(self):
-        """Создает конфигурацию для разных результатов."""
+        """Создает конфигурацию для разных результатов.
+
+        Иконки загружаются один раз при создании диалога."""
         self.configs = {
             "win": {
-                "icon": get_path("win.png"),
+                "icon": QIcon(get_path("win.png")).pixmap(100, 100),
                 "title": "ПОБЕДА",
                 "message": "Хотите продолжить игру?",
-                "button": get_path("next_lvl.png"),
+                "button": QIcon(get_path("next_lvl.png")),
             },
             "lose": {
-                "icon": get_path("lose.png"),
+                "icon": QIcon(get_path("lose.png")).pixmap(100, 100),
                 "title": "ПОРАЖЕНИЕ",
                 "message": "Ходы закончились!",
-                "button": get_path("restart.png"),
+                "button": QIcon(get_path("restart.png")),
             },
         }
 
+    def show_result(self, win):
+        """Настраивает диалог под результат и показывает его модально.
+
+        Args:
+            win: True для победы, False для поражения.
+
+        Returns:
+            int: Результат exec_().
+        """
+        self.win = win
+        if self.sounds:
+            self.sounds.play_param("win" if win else "lose")
+        if self.parent():
+            set_center_geometry(self, self.parent())
+        self.result_ui(win)
+        return self.exec_()
+
     def result_ui(self, win):
         """Настраивает интерфейс в зависимости от результата.
 
+        Повторная настройка под тот же результат пропускается.
+
         Args:
             win: True для победы, False для поражения.
         """
+        if self._shown_result == win:
+            return
         try:
             cfg = self.configs["win" if win else "lose"]
-            self.icon_label.setPixmap(QIcon(cfg["icon"]).pixmap(100, 100))
+            self.icon_label.setPixmap(cfg["icon"])
             self.title_label.setText(cfg["title"])
             self.message_label.setText(cfg["message"])
-            self.btn_play.setIcon(QIcon(cfg["button"]))
+            self.btn_play.setIcon(cfg["button"])
             self.btn_play.setIconSize(self.btn_play.size() * 0.8)
+            self._shown_result = win
         except Exception as e:
             print(f"Ошибка настройки интерфейса: {e}")
 
@@ -91,7 +126,11 @@ class GameResultDialog(QDialog):
 
 
 class SettingsDialog(QDialog):
-    """Диалоговое окно настроек (звук, музыка)."""
+    """Диалоговое окно настроек (звук, музыка).
+
+    Создаётся один раз и переиспользуется: show_settings обновляет
+    флажки по текущему состоянию менеджеров и показывает диалог.
+    """
 
     def __init__(self, music_manager=None, sound_manager=None, parent=None):
         """Инициализирует диалог настроек.
@@ -103,14 +142,13 @@ class SettingsDialog(QDialog):
         """
         super().__init__(parent, Qt.WindowType(Qt.FramelessWindowHint))
         try:
-            uic.loadUi(get_path("settings.ui"), self)
+            setup_ui(self, get_path("settings.ui"))
             if parent:
                 set_center_geometry(self, parent)
             self.music = music_manager
             self.sound = sound_manager
 
-            self.chck_music.setChecked(self.music.playing)
-            self.chck_sounds.setChecked(self.sound.playing)
+            self.sync_state()
 
             self.chck_music.toggled.connect(self.music_changed)
             self.chck_sounds.toggled.connect(self.sounds_changed)
@@ -120,6 +158,28 @@ class SettingsDialog(QDialog):
         except Exception as e:
             print(f"Ошибка создания диалога настроек: {e}")
 
+    def sync_state(self):
+        """Выставляет флажки по состоянию менеджеров без вызова
+        обработчиков изменения."""
+        for checkbox, manager in (
+            (self.chck_music, self.music),
+            (self.chck_sounds, self.sound),
+        ):
+            checkbox.blockSignals(True)
+            checkbox.setChecked(bool(manager and manager.playing))
+            checkbox.blockSignals(False)
+
+    def show_settings(self):
+        """Обновляет флажки и показывает диалог модально.
+
+        Returns:
+            int: Результат exec_().
+        """
+        self.sync_state()
+        if self.parent():
+            set_center_geometry(self, self.parent())
+        return self.exec_()
+
     def music_changed(self, is_on):
         """Обрабатывает изменение состояния музыки.
 
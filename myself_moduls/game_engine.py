@@ -0,0 +1,182 @@
+from array import array
+
+
+class GameEngine:
+    """Правила игры на память без зависимости от Qt.
+
+    Доска хранится в компактном виде: изображения карточек заменены
+    целочисленными идентификаторами, флаги перевернутости и найденной
+    пары лежат в bytearray, а количество оставшихся пар ведётся счётчиком,
+    поэтому проверка победы выполняется за O(1). Атрибуты объявлены в
+    __slots__: доска на сервере (game_server.py) занимает сотни байт.
+
+    Attributes:
+        image_ids (array): Идентификатор изображения для каждой карточки.
+        turned (bytearray): 1, если карточка перевернута.
+        found (bytearray): 1, если для карточки найдена пара.
+        pairs_left (int): Количество ещё не найденных пар.
+        moves_count (int): Оставшееся количество ходов.
+        turned_cards (list): Индексы перевернутых карточек (не больше 2).
+        is_checking (bool): Флаг, ведется ли проверка совпадения карточек.
+    """
+
+    __slots__ = (
+        "image_ids",
+        "turned",
+        "found",
+        "pairs_left",
+        "moves_count",
+        "turned_cards",
+        "is_checking",
+    )
+
+    def __init__(self, images=(), moves=30):
+        """Создаёт движок и раскладывает доску.
+
+        Args:
+            images: Последовательность изображений карточек (пути или любые
+                хешируемые ключи). Одинаковые ключи образуют пару.
+            moves: Количество ходов на уровень.
+        """
+        self.new_board(images, moves)
+
+    def new_board(self, images, moves):
+        """Раскладывает новую доску.
+
+        Args:
+            images: Последовательность изображений карточек.
+            moves: Количество ходов на уровень.
+
+        Raises:
+            ValueError: Если какое-то изображение встречается
+                нечётное количество раз.
+        """
+        ids = {}
+        self.image_ids = array(
+            "l", (ids.setdefault(img, len(ids)) for img in images)
+        )
+        counts = [0] * len(ids)
+        for image_id in self.image_ids:
+            counts[image_id] += 1
+        if any(count % 2 for count in counts):
+            raise ValueError("Каждое изображение должно встречаться парами")
+
+        size = len(self.image_ids)
+        self.turned = bytearray(size)
+        self.found = bytearray(size)
+        self.pairs_left = size // 2
+        self.moves_count = moves
+        self.turned_cards = []
+        self.is_checking = False
+
+    def __len__(self):
+        """Возвращает количество карточек на доске."""
+        return len(self.image_ids)
+
+    def can_turn(self, index_card):
+        """Проверяет можно ли перевернуть карточку.
+
+        Args:
+            index_card: Индекс карточки.
+
+        Returns:
+            bool: True если карточку можно перевернуть.
+
+        Raises:
+            IndexError: Если индекс карточки вне доски.
+        """
+        if not 0 <= index_card < len(self.image_ids):
+            raise IndexError(f"Несуществующий индекс карточки: {index_card}")
+        # Нельзя перевернуть если:
+        # 1. Карточка уже найдена в паре
+        # 2. Карточка уже перевернута
+        # 3. Уже перевернуто 2 карточки для проверки
+        # 4. Идёт проверка совпадения
+        return not (
+            self.found[index_card]
+            or self.turned[index_card]
+            or len(self.turned_cards) >= 2
+            or self.is_checking
+        )
+
+    def turn(self, index_card):
+        """Переворачивает карточку, если это разрешено правилами.
+
+        Args:
+            index_card: Индекс карточки.
+
+        Returns:
+            bool: True если карточка перевернута.
+        """
+        if not self.can_turn(index_card):
+            return False
+        self.turned[index_card] = 1
+        self.turned_cards.append(index_card)
+        return True
+
+    def check_match(self):
+        """Проверяет совпадение двух перевернутых карточек.
+
+        Устанавливает флаг is_checking до вызова hide_cards/apply_match.
+
+        Returns:
+            tuple: (index_1, index_2, match), где match - True если
+            изображения совпадают.
+
+        Raises:
+            ValueError: Если перевернуто не 2 карточки.
+        """
+        index_1, index_2 = self.turned_cards
+        self.is_checking = True
+        match = self.image_ids[index_1] == self.image_ids[index_2]
+        return index_1, index_2, match
+
+    def apply_match(self, index_1, index_2, match):
+        """Применяет результат проверки совпадения.
+
+        При совпадении отмечает пару найденной и освобождает ход,
+        иначе тратит ход; скрыть карточки нужно вызовом hide_cards.
+
+        Args:
+            index_1: Индекс первой карточки.
+            index_2: Индекс второй карточки.
+            match: Результат проверки на совпадение.
+        """
+        if not match:
+            self.moves_count -= 1
+            return
+        self.found[index_1] = self.found[index_2] = 1
+        self.pairs_left -= 1
+        self.turned_cards.clear()
+        self.is_checking = False
+
+    def hide_cards(self, index_1, index_2):
+        """Переворачивает обратно несовпавшие карточки.
+
+        Args:
+            index_1: Индекс первой карточки.
+            index_2: Индекс второй карточки.
+        """
+        self.turned[index_1] = self.turned[index_2] = 0
+        self.turned_cards.clear()
+        self.is_checking = False
+
+    def is_won(self):
+        """Возвращает True, если все пары найдены."""
+        return self.pairs_left == 0
+
+    def is_lost(self):
+        """Возвращает True, если ходы закончились, а пары остались."""
+        return self.pairs_left > 0 and self.moves_count <= 0
+
+    def status(self):
+        """Возвращает состояние партии.
+
+        Returns:
+            str | None: 'win', 'lose' или None, если игра продолжается.
+        """
+        if self.is_won():
+            return "win"
+        if self.moves_count <= 0:
+            return "lose"
+        return None
@@ -0,0 +1,508 @@
+"""
+Игровой сервер: тысячи партий Memory Game в одном процессе asyncio.
+
+Партии идут по тем же правилам (GameEngine), уровни готовятся тем же
+кодом, что и в окне игры (LevelManager, list_files через
+LevelPrefetcher.prepare_level), но без Qt: состояние партии - это
+компактные Session (__slots__) с движком на bytearray, поэтому десятки
+тысяч ожидающих партий занимают единицы мегабайт. Несовпавшие карточки
+скрываются через колесо таймеров (TimerWheel): одна задача asyncio на
+весь сервер вместо задачи на каждую пару, и ни одной, пока скрывать
+нечего. Доска уровня готовится (обход папок, идентификаторы
+содержимого из каталога изображений) в отдельном потоке, чтобы не
+останавливать цикл событий; движок партии получает целочисленные
+идентификаторы содержимого, а не пути к файлам.
+
+Протокол - NDJSON поверх TCP: один JSON-объект в строке. Запросы
+клиента (поле id, если есть, возвращается в ответе):
+    {"op": "new", "level": 1, "seed": 5}  новая партия (seed - необяз.);
+        с "s" - новая раскладка в существующей партии
+    {"op": "turn", "s": 1, "card": 3}     перевернуть карточку
+    {"op": "close", "s": 1}               закончить партию
+    {"op": "stats"}                       состояние сервера
+Ответы и события сервера:
+    {"ev": "new", "s": 1, "level": 1, "rows": 4, "cols": 4, "moves": 30,
+     "time": 1000, "type": "normal", "seed": 5, "images": [...]}
+    {"ev": "turn", "s": 1, "card": 3, "image": 2}  image - индекс в images
+        второй карточки: ещё "match": true/false, "moves": 29 и, если
+        партия закончена, "result": "win"/"lose";
+        нельзя перевернуть: {"ev": "turn", "s": 1, "card": 3, "ok": false}
+    {"ev": "hide", "s": 1, "cards": [3, 7]}  через time мс после промаха
+    {"ev": "error", "error": "..."}
+
+Сессии принадлежат соединению и закрываются вместе с ним. Нагрузку
+создаёт myself_moduls/load_client.py.
+
+Запуск:
+    python -m myself_moduls.game_server [--host 127.0.0.1] [--port 8765]
+        [--time-show МС]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from myself_moduls.game_engine import GameEngine
+from myself_moduls.level_manager import LevelManager
+from myself_moduls.level_prefetcher import LevelPrefetcher
+
+DEFAULT_PORT = 8765
+# Ожидать отправки клиенту, если в буфере соединения больше байт
+WRITE_HIGH_WATER = 1 << 16
+
+
+class TimerWheel:
+    """Колесо таймеров с шагом tick секунд.
+
+    Вызов планируется в ячейку колеса по номеру такта; вызовы дальше
+    одного оборота колеса ждут в своей ячейке нужного оборота. Все
+    таймеры обслуживает одна задача run(), которая спит, пока колесо
+    пусто.
+
+    Attributes:
+        tick (float): Шаг колеса в секундах.
+        size (int): Количество ячеек.
+    """
+
+    def __init__(self, tick=0.01, size=512, clock=time.monotonic):
+        """Создаёт пустое колесо.
+
+        Args:
+            tick: Шаг колеса в секундах (точность таймеров).
+            size: Количество ячеек (оборот - tick * size секунд).
+            clock: Часы в секундах (как loop.time()).
+        """
+        self.tick = tick
+        self.size = size
+        self._clock = clock
+        self._origin = clock()
+        self._buckets = [[] for _ in range(size)]
+        self._tick = 0
+        self._count = 0
+        self._wakeup = None
+
+    def __len__(self):
+        """Возвращает количество запланированных вызовов."""
+        return self._count
+
+    def _now(self):
+        """Возвращает номер текущего такта по часам."""
+        return int((self._clock() - self._origin) / self.tick)
+
+    def schedule(self, delay, callback, *args):
+        """Планирует вызов callback(*args) через delay секунд.
+
+        Вызов выполняется не раньше delay и не позже delay + tick
+        (при работающем run()).
+        """
+        if not self._count:
+            # колесо стояло: пустые такты пропускаются сразу
+            self._tick = max(self._tick, self._now())
+        target = self._now() + max(1, math.ceil(delay / self.tick))
+        self._buckets[target % self.size].append((target, callback, args))
+        self._count += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def advance(self):
+        """Выполняет вызовы всех прошедших тактов.
+
+        Returns:
+            int: Количество выполненных вызовов.
+        """
+        now = self._now()
+        fired = 0
+        while self._tick < now and self._count:
+            self._tick += 1
+            bucket = self._buckets[self._tick % self.size]
+            if not bucket:
+                continue
+            due = [entry for entry in bucket if entry[0] <= self._tick]
+            if not due:
+                continue
+            bucket[:] = [entry for entry in bucket if entry[0] > self._tick]
+            self._count -= len(due)
+            for _, callback, args in due:
+                fired += 1
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"Ошибка таймера: {e}")
+        if not self._count:
+            self._tick = max(self._tick, now)
+        return fired
+
+    async def run(self):
+        """Обслуживает колесо, пока задачу не отменят."""
+        self._wakeup = asyncio.Event()
+        while True:
+            if not self._count:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            await asyncio.sleep(self.tick)
+            self.advance()
+
+
+class Session:
+    """Партия одного игрока.
+
+    Attributes:
+        sid (int): Номер партии.
+        level (int): Номер уровня.
+        seed (int): Зерно раскладки.
+        time (int): Время показа несовпавших карточек в мс.
+        engine (GameEngine): Доска и правила.
+    """
+
+    __slots__ = ("sid", "level", "seed", "time", "engine")
+
+    def __init__(self, sid, level, seed, time_show, engine):
+        self.sid = sid
+        self.level = level
+        self.seed = seed
+        self.time = time_show
+        self.engine = engine
+
+
+class Connection:
+    """Соединение клиента и его партии.
+
+    Attributes:
+        writer (asyncio.StreamWriter | None): Поток записи (None - без
+            сети, ответы копятся в outbox).
+        sessions (dict): Партии соединения {sid: Session}.
+        closed (bool): Соединение закрыто.
+        outbox (list): Сообщения соединения без сети.
+    """
+
+    __slots__ = ("writer", "sessions", "closed", "outbox")
+
+    def __init__(self, writer=None):
+        self.writer = writer
+        self.sessions = {}
+        self.closed = False
+        self.outbox = []
+
+    def send(self, message):
+        """Отправляет сообщение клиенту строкой NDJSON."""
+        if self.closed:
+            return
+        if self.writer is None:
+            self.outbox.append(message)
+            return
+        self.writer.write(
+            json.dumps(message, separators=(",", ":")).encode() + b"\n"
+        )
+
+
+class GameServer:
+    """Сервер партий: протокол, партии и таймеры скрытия.
+
+    Attributes:
+        level_manager (LevelManager): Параметры уровней.
+        prefetcher (LevelPrefetcher): Подготовка досок уровней.
+        wheel (TimerWheel): Таймеры скрытия несовпавших карточек.
+        time_show (int | None): Время показа несовпавших карточек в мс
+            вместо времени уровня (None - как в уровне).
+        max_sessions (int): Предел одновременных партий.
+        active (int): Количество открытых партий.
+        moves (int): Количество выполненных переворотов.
+    """
+
+    def __init__(
+        self,
+        level_manager=None,
+        time_show=None,
+        max_sessions=100_000,
+        tick=0.01,
+    ):
+        """Создаёт сервер (сеть запускается в start).
+
+        Args:
+            level_manager: Менеджер уровней (по умолчанию LevelManager).
+            time_show: Время показа несовпавших карточек в мс для всех
+                уровней (например, 0 для нагрузочных тестов).
+            max_sessions: Предел одновременных партий.
+            tick: Шаг колеса таймеров в секундах.
+        """
+        self.level_manager = level_manager or LevelManager()
+        self.prefetcher = LevelPrefetcher(self.level_manager)
+        self.wheel = TimerWheel(tick)
+        self.time_show = time_show
+        self.max_sessions = max_sessions
+        self.active = 0
+        self.moves = 0
+        self._next_sid = 1
+        self._server = None
+        self._wheel_task = None
+        # подготовка досок читает диск и каталог изображений
+        self._dealer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="deal"
+        )
+
+    async def prepare(self, level, seed=None):
+        """Готовит доску уровня в потоке, не блокируя цикл событий.
+
+        Returns:
+            PreparedLevel: Подготовленный уровень.
+
+        Raises:
+            ValueError: Если level < 1.
+            FileNotFoundError: Если не найдены изображения уровня.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._dealer, self.prefetcher.prepare_level, level, None, seed
+        )
+
+    def deal(self, session, prepared):
+        """Раскладывает в партии подготовленную доску уровня.
+
+        Args:
+            session: Партия (Session).
+            prepared: Подготовленный уровень (PreparedLevel).
+
+        Returns:
+            dict: Событие 'new' для клиента.
+        """
+        keys = prepared.keys
+        if session.engine is None:
+            session.engine = GameEngine(keys, prepared.moves)
+        else:
+            session.engine.new_board(keys, prepared.moves)
+        level = prepared.lvl_num
+        # первый путь для каждого содержимого, в порядке идентификаторов
+        paths = {}
+        for key, path in zip(keys, prepared.images):
+            paths.setdefault(key, path)
+        session.level = level
+        session.seed = prepared.seed
+        session.time = (
+            prepared.time if self.time_show is None else self.time_show
+        )
+        rows, cols = prepared.board_size
+        return {
+            "ev": "new",
+            "s": session.sid,
+            "level": level,
+            "rows": rows,
+            "cols": cols,
+            "moves": prepared.moves,
+            "time": session.time,
+            "type": prepared.lvl_type,
+            "seed": prepared.seed,
+            # порядок совпадает с идентификаторами изображений движка
+            "images": [os.path.basename(p) for p in paths.values()],
+        }
+
+    def _session(self, conn, request):
+        """Возвращает партию соединения из запроса.
+
+        Raises:
+            ValueError: Если партии нет.
+        """
+        session = conn.sessions.get(request.get("s"))
+        if session is None:
+            raise ValueError(f"Нет партии {request.get('s')}")
+        return session
+
+    async def handle(self, conn, request):
+        """Выполняет запрос клиента.
+
+        Args:
+            conn: Соединение (Connection).
+            request: Разобранный JSON-объект запроса.
+
+        Returns:
+            dict: Ответ клиенту.
+
+        Raises:
+            ValueError, TypeError, IndexError, FileNotFoundError: Если
+                запрос некорректен (ответ - событие 'error').
+        """
+        op = request.get("op")
+        if op == "turn":
+            return self._turn(conn, self._session(conn, request), request)
+        if op == "new":
+            session = self._session(conn, request) if "s" in request else None
+            if session is None and self.active >= self.max_sessions:
+                raise ValueError("Сервер заполнен")
+            prepared = await self.prepare(
+                int(request.get("level", 1)), request.get("seed")
+            )
+            if session is None:
+                # номер выдаётся после подготовки: пока доска готовилась,
+                # другие соединения тоже могли открыть партии
+                session = Session(self._next_sid, 0, 0, 0, None)
+                self._next_sid += 1
+                conn.sessions[session.sid] = session
+                self.active += 1
+            return self.deal(session, prepared)
+        if op == "close":
+            session = self._session(conn, request)
+            del conn.sessions[session.sid]
+            self.active -= 1
+            return {"ev": "close", "s": session.sid}
+        if op == "stats":
+            return {
+                "ev": "stats",
+                "sessions": self.active,
+                "moves": self.moves,
+                "timers": len(self.wheel),
+            }
+        raise ValueError(f"Неизвестная операция: {op}")
+
+    def _turn(self, conn, session, request):
+        """Переворачивает карточку и проверяет пару."""
+        engine = session.engine
+        card = request["card"]
+        if not isinstance(card, int) or not engine.turn(card):
+            return {"ev": "turn", "s": session.sid, "card": card, "ok": False}
+        self.moves += 1
+        reply = {
+            "ev": "turn",
+            "s": session.sid,
+            "card": card,
+            "image": engine.image_ids[card],
+        }
+        if len(engine.turned_cards) == 2:
+            index_1, index_2, match = engine.check_match()
+            engine.apply_match(index_1, index_2, match)
+            reply["match"] = match
+            reply["moves"] = engine.moves_count
+            if not match:
+                self.wheel.schedule(
+                    session.time / 1000,
+                    self._hide,
+                    conn,
+                    session,
+                    engine.image_ids,
+                    index_1,
+                    index_2,
+                )
+            status = engine.status()
+            if status is not None:
+                reply["result"] = status
+        return reply
+
+    @staticmethod
+    def _hide(conn, session, board, index_1, index_2):
+        """Скрывает несовпавшие карточки (вызов колеса таймеров).
+
+        Если доска уже переразложена, скрытие пропускается."""
+        if conn.closed or session.engine.image_ids is not board:
+            return
+        session.engine.hide_cards(index_1, index_2)
+        conn.send(
+            {"ev": "hide", "s": session.sid, "cards": [index_1, index_2]}
+        )
+
+    async def handle_line(self, conn, line):
+        """Разбирает строку запроса, выполняет его и отправляет ответ."""
+        request = None
+        try:
+            request = json.loads(line)
+            reply = await self.handle(conn, request)
+        except (
+            ValueError,
+            TypeError,
+            KeyError,
+            IndexError,
+            AttributeError,
+            FileNotFoundError,
+        ) as e:
+            reply = {"ev": "error", "error": str(e)}
+        if isinstance(request, dict) and "id" in request:
+            reply["id"] = request["id"]
+        conn.send(reply)
+
+    async def _serve_client(self, reader, writer):
+        """Обслуживает одно соединение до его закрытия."""
+        conn = Connection(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                await self.handle_line(conn, line)
+                buffered = writer.transport.get_write_buffer_size()
+                if buffered > WRITE_HIGH_WATER:
+                    await writer.drain()
+        except ConnectionError:
+            # клиент отключился, не дочитав ответы
+            pass
+        except (asyncio.LimitOverrunError, ValueError) as e:
+            print(f"Соединение закрыто с ошибкой: {e}")
+        finally:
+            conn.closed = True
+            self.active -= len(conn.sessions)
+            conn.sessions.clear()
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """Запускает сервер и колесо таймеров.
+
+        Args:
+            host: Адрес.
+            port: Порт (0 - свободный).
+
+        Returns:
+            int: Порт, на котором слушает сервер.
+        """
+        # папки уровней проверяются один раз до первого клиента
+        self.level_manager.load()
+        self._wheel_task = asyncio.create_task(self.wheel.run())
+        self._server = await asyncio.start_server(
+            self._serve_client, host, port
+        )
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Останавливает сервер и колесо таймеров."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._wheel_task is not None:
+            self._wheel_task.cancel()
+            try:
+                await self._wheel_task
+            except asyncio.CancelledError:
+                pass
+            self._wheel_task = None
+        self._dealer.shutdown()
+        self.prefetcher.shutdown()
+
+
+async def serve(host, port, time_show=None):
+    """Запускает сервер до прерывания."""
+    server = GameServer(time_show=time_show)
+    port = await server.start(host, port)
+    print(f"Сервер Memory Game слушает {host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(argv):
+    """Запускает игровой сервер (см. описание модуля)."""
+    parser = argparse.ArgumentParser(description="Сервер Memory Game")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--time-show", type=int, default=None)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.time_show))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,6 +1,14 @@
+import json
 import os
 
-_cache = {}
+# Имена папок, которые не индексируются (сравниваются целиком)
+IGNORED_DIRS = frozenset(
+    (".git", ".venv", "__pycache__", ".pytest_cache", ".cache")
+)
+MANIFEST_VERSION = 1
+
+_index = None
+_reported_ambiguous = set()
 _project_root = None
 
 
@@ -40,13 +48,141 @@ def find_project_root(marker="README.md"):
     # КОНЕЦ ЗАИМСТВОВАННОГО КОДА
 
 
+def default_manifest_path():
+    """Возвращает путь к файлу-манифесту индекса ресурсов.
+
+    Манифест лежит в __pycache__ рядом с модулем: эта папка не
+    индексируется, поэтому запись манифеста не меняет время изменения
+    отслеживаемых директорий.
+    """
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "__pycache__",
+        "asset_index.json",
+    )
+
+
+def scan_assets(base_dir):
+    """Обходит дерево проекта один раз и строит индекс имён.
+
+    Папки из IGNORED_DIRS (и их содержимое) пропускаются.
+
+    Args:
+        base_dir (str): Корень обхода.
+
+    Returns:
+        tuple: (names, dirs), где names - словарь {имя: [относительные
+        пути]}, dirs - словарь {относительный путь папки: st_mtime_ns}.
+    """
+    names, dirs_mtime = {}, {}
+    for root, dirs, files in os.walk(base_dir):
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+        rel_root = os.path.relpath(root, base_dir)
+        dirs_mtime[rel_root] = os.stat(root).st_mtime_ns
+        for name in dirs + files:
+            names.setdefault(name, []).append(
+                os.path.normpath(os.path.join(rel_root, name))
+            )
+    return names, dirs_mtime
+
+
+def is_manifest_fresh(base_dir, dirs_mtime):
+    """Проверяет, что ни одна проиндексированная папка не изменилась.
+
+    Добавление, удаление или переименование файла меняет время
+    изменения содержащей его папки, поэтому достаточно сравнить
+    st_mtime_ns каждой папки без повторного чтения их содержимого.
+
+    Args:
+        base_dir (str): Корень проекта.
+        dirs_mtime (dict): {относительный путь папки: st_mtime_ns}.
+    """
+    try:
+        return all(
+            os.stat(os.path.join(base_dir, rel)).st_mtime_ns == mtime
+            for rel, mtime in dirs_mtime.items()
+        )
+    except OSError:
+        return False
+
+
+def load_index(base_dir=None, manifest_path=None):
+    """Загружает индекс ресурсов из манифеста или строит его заново.
+
+    Манифест используется, если он создан для того же корня и ни одна
+    папка не изменилась. Иначе дерево обходится один раз, а манифест
+    перезаписывается. Неоднозначные имена (найдены в нескольких
+    местах) сообщаются один раз за время работы программы.
+
+    Args:
+        base_dir (str): Корень проекта (по умолчанию find_project_root()).
+        manifest_path (str): Путь к манифесту
+            (по умолчанию default_manifest_path()).
+
+    Returns:
+        dict: Индекс {имя: [абсолютные пути]}.
+    """
+    base_dir = base_dir or find_project_root()
+    manifest_path = manifest_path or default_manifest_path()
+    names = None
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if (
+            data.get("version") == MANIFEST_VERSION
+            and data.get("root") == base_dir
+            and is_manifest_fresh(base_dir, data["dirs"])
+        ):
+            names = data["names"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    if names is None:
+        # создаём папку манифеста до обхода, чтобы не изменить mtime родителя
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        names, dirs_mtime = scan_assets(base_dir)
+        try:
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": MANIFEST_VERSION,
+                        "root": base_dir,
+                        "dirs": dirs_mtime,
+                        "names": names,
+                    },
+                    f,
+                    ensure_ascii=False,
+                )
+        except OSError as e:
+            print(f"Не удалось сохранить индекс ресурсов: {e}")
+
+    # служебные файлы (.gitignore и т.п.) ресурсами не являются и
+    # ожидаемо встречаются в нескольких папках
+    ambiguous = sorted(
+        name
+        for name, paths in names.items()
+        if len(paths) > 1
+        and not name.startswith(".")
+        and name not in _reported_ambiguous
+    )
+    if ambiguous:
+        _reported_ambiguous.update(ambiguous)
+        print(f"Имена найдены в нескольких местах: {', '.join(ambiguous)}")
+    return {
+        name: [os.path.join(base_dir, path) for path in paths]
+        for name, paths in names.items()
+    }
+
+
 def get_path(name):
     """
     Находит путь к файлу или папке в проекте.
 
     Алгоритм поиска:
-    1. Проверяем кеш (_cache)
-    2. Ищет от корня программы
+    1. При первом вызове загружает индекс ресурсов (load_index):
+       из манифеста на диске или одним обходом от корня программы
+    2. Ищет имя в индексе за O(1)
+    3. Если имя не найдено, а дерево изменилось - перестраивает индекс
 
     Args:
         name (str): Имя файла или папки для поиска.
@@ -59,27 +195,20 @@ def get_path(name):
         FileExistsError: Если объект с таким именем найден в нескольких местах.
         FileNotFoundError: Если объект не найден в проекте.
     """
+    global _index
     if not name:
         raise ValueError("Имя не указано")
 
-    if name in _cache:
-        return _cache[name]
+    if _index is None:
+        _index = load_index()
+    paths = _index.get(name)
+    if paths is None:
+        # Возможно, файл появился после построения индекса
+        _index = load_index()
+        paths = _index.get(name)
 
-    base_dir = find_project_root()
-    found = None
-    for root, dirs, files in os.walk(base_dir):
-        if any(ignore in root for ignore in [".git", ".venv", "__pycache__"]):
-            continue
-
-        if name in dirs or name in files:
-            path = os.path.join(root, name)
-            if found is None:
-                found = path
-            else:
-                raise FileExistsError(f"'{name}' найден в нескольких местах")
-
-    if found is None:
+    if not paths:
         raise FileNotFoundError(f"Не найден: {name}")
-
-    _cache[name] = found
-    return found
+    if len(paths) > 1:
+        raise FileExistsError(f"'{name}' найден в нескольких местах")
+    return paths[0]
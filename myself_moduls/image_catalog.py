@@ -0,0 +1,231 @@
+"""
+Каталог изображений по содержимому.
+
+Для каждого изображения один раз считается хеш содержимого (BLAKE2b),
+результат хранится на диске (.cache/image_catalog.json) вместе с
+размером и временем изменения файла. При следующем запуске хеш
+пересчитывается только для новых и изменённых файлов, а большие
+пачки файлов хешируются параллельно в нескольких процессах.
+
+Одинаковые по содержимому файлы (например, images_1/frog.png и
+images_4/frog.png) получают один целочисленный идентификатор, поэтому
+совпадение карточек проверяется сравнением чисел, а не путей.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from myself_moduls.get_absolute_path import find_project_root
+
+CATALOG_VERSION = 1
+
+
+def default_catalog_path():
+    """Возвращает путь к каталогу (.cache/image_catalog.json в корне)."""
+    return os.path.join(find_project_root(), ".cache", "image_catalog.json")
+
+
+def hash_file(path, chunk_size=1 << 16):
+    """Возвращает хеш содержимого файла или None, если его не прочитать.
+
+    Args:
+        path: Путь к файлу.
+        chunk_size: Размер блока чтения в байтах.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class ImageCatalog:
+    """Хеши содержимого изображений с кешем на диске.
+
+    Потокобезопасен: используется из фоновой подготовки уровней.
+
+    Attributes:
+        path (str): Путь к файлу каталога.
+        parallel_threshold (int): С какого количества устаревших файлов
+            хеширование идёт в нескольких процессах.
+        workers (int | None): Количество процессов (None - по ядрам).
+        hashed (int): Сколько файлов захешировано за время работы.
+    """
+
+    def __init__(self, path=None, parallel_threshold=256, workers=None):
+        """Создаёт каталог и читает сохранённые хеши.
+
+        Args:
+            path: Путь к файлу каталога (по умолчанию
+                default_catalog_path()).
+            parallel_threshold: Порог параллельного хеширования.
+            workers: Количество процессов для хеширования.
+        """
+        self.path = path or default_catalog_path()
+        self.parallel_threshold = parallel_threshold
+        self.workers = workers
+        self.hashed = 0
+        self._entries = self._read()
+        self._ids = {}
+        self._lock = threading.Lock()
+
+    def _read(self):
+        """Читает записи {путь: [размер, st_mtime_ns, хеш]} с диска."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CATALOG_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def save(self):
+        """Атомарно сохраняет каталог на диск.
+
+        Записи удалённых файлов (например, из временных папок) при
+        сохранении убираются, поэтому каталог не растёт бесконечно."""
+        self._entries = {
+            path: entry
+            for path, entry in self._entries.items()
+            if os.path.isfile(path)
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": CATALOG_VERSION, "entries": self._entries},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+
+    def _hash_many(self, paths):
+        """Хеширует файлы, при большом количестве - в нескольких процессах.
+
+        Returns:
+            list: Хеши в порядке paths (None для нечитаемых файлов).
+        """
+        if len(paths) < self.parallel_threshold:
+            return [hash_file(path) for path in paths]
+        # импорт пула процессов (multiprocessing) занимает десятки
+        # миллисекунд и не нужен при запуске игры
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            with ProcessPoolExecutor(self.workers) as pool:
+                return list(pool.map(hash_file, paths, chunksize=64))
+        except Exception as e:
+            print(f"Параллельное хеширование недоступно: {e}")
+            return [hash_file(path) for path in paths]
+
+    def update(self, paths):
+        """Хеширует новые и изменённые файлы и сохраняет каталог.
+
+        Файл считается изменённым, если изменились его размер или время
+        изменения. Недоступные файлы в каталог не попадают.
+
+        Args:
+            paths: Пути к изображениям.
+
+        Returns:
+            int: Количество захешированных файлов.
+        """
+        with self._lock:
+            stale = {}
+            for path in paths:
+                path = os.path.abspath(path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entry = self._entries.get(path)
+                if entry is None or entry[:2] != [
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ]:
+                    stale[path] = [stat.st_size, stat.st_mtime_ns]
+            if not stale:
+                return 0
+            digests = self._hash_many(list(stale))
+            for (path, stamp), digest in zip(stale.items(), digests):
+                if digest is not None:
+                    self._entries[path] = stamp + [digest]
+            self.hashed += len(stale)
+            try:
+                self.save()
+            except OSError as e:
+                print(f"Не удалось сохранить каталог изображений: {e}")
+            return len(stale)
+
+    def digest(self, path):
+        """Возвращает хеш содержимого файла из каталога или None."""
+        entry = self._entries.get(os.path.abspath(path))
+        return entry[2] if entry else None
+
+    def content_id(self, path):
+        """Возвращает целочисленный идентификатор содержимого файла.
+
+        Файлы с одинаковым содержимым получают один идентификатор.
+        Файлы, которых нет в каталоге, различаются по пути.
+
+        Args:
+            path: Путь к изображению.
+        """
+        key = self.digest(path) or os.path.abspath(path)
+        with self._lock:
+            return self._ids.setdefault(key, len(self._ids))
+
+    def content_ids(self, paths):
+        """Возвращает идентификаторы содержимого для списка путей."""
+        self.update(dict.fromkeys(paths))
+        return [self.content_id(path) for path in paths]
+
+    def distinct(self, paths, refresh=True):
+        """Убирает из списка файлы-дубликаты по содержимому.
+
+        Args:
+            paths: Пути к изображениям.
+            refresh: Сначала захешировать новые и изменённые файлы
+                (update); False - только по уже известным хешам.
+
+        Returns:
+            list: Первый путь для каждого уникального содержимого
+            в исходном порядке.
+        """
+        if refresh:
+            self.update(paths)
+        unique = {}
+        for path in paths:
+            unique.setdefault(self.digest(path) or path, path)
+        return list(unique.values())
+
+
+_catalog = None
+
+
+def get_catalog():
+    """Возвращает общий каталог изображений (создаётся при первом вызове)."""
+    global _catalog
+    if _catalog is None:
+        _catalog = ImageCatalog()
+    return _catalog
+
+
+def set_catalog(catalog):
+    """Заменяет общий каталог изображений (например, временным в тестах).
+
+    Args:
+        catalog: Новый каталог (None - создать заново при get_catalog).
+
+    Returns:
+        ImageCatalog | None: Прежний каталог.
+    """
+    global _catalog
+    previous, _catalog = _catalog, catalog
+    return previous
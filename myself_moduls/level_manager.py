@@ -1,92 +1,265 @@
-from myself_moduls.get_absolute_path import get_path
+import json
 import os
+from itertools import chain, islice
+
+from myself_moduls.get_absolute_path import get_path
+from myself_moduls.make_list_images import iter_images
+
+# Набор уровней по умолчанию (формат файла набора уровней, см. load_pack).
+# Папки задаются индексами в списке dirs.
+DEFAULT_PACK = {
+    "dirs": ["images_1", "images_2", "images_3", "images_4"],
+    # Уровни 1-4: разные комбинации папок, ходов становится меньше
+    "levels": [
+        {"dirs": [0], "moves": 30, "time": 1000, "type": "normal"},
+        {"dirs": [0, 1], "moves": 26, "time": 800, "type": "normal"},
+        {"dirs": [1, 2], "moves": 22, "time": 700, "type": "normal"},
+        {"dirs": [0, 1, 2, 3], "moves": 18, "time": 600, "type": "normal"},
+    ],
+    # Уровни 5+: все папки, ходы и тип повторяются по кругу
+    "cycle": {
+        "dirs": [0, 1, 2, 3],
+        "time": 600,
+        "steps": [
+            {"moves": 17, "type": "normal"},
+            {"moves": 14, "type": "ХАРДКОР!"},
+            {"moves": 17, "type": "normal"},
+            {"moves": 22, "type": "БОНУС!"},
+        ],
+        # Особый уровень каждые 7 уровней (мало времени на показ карточек)
+        "special": {"every": 7, "time": 400, "type": "СПРИНТ"},
+    },
+}
+
+# Столько изображений должно найтись в папках уровня (см. list_files)
+MIN_IMAGES = 8
+
+
+def load_pack(path):
+    """Читает набор уровней из JSON-файла.
+
+    Args:
+        path: Путь к файлу в формате DEFAULT_PACK.
+
+    Returns:
+        dict: Набор уровней.
+
+    Raises:
+        FileNotFoundError: Если файл не найден.
+        ValueError: Если файл не является JSON-объектом.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            pack = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Набор уровней {path} повреждён: {e}")
+    if not isinstance(pack, dict):
+        raise ValueError(f"Набор уровней {path} должен быть объектом")
+    return pack
 
 
 class LevelManager:
     """Менеджер уровней для игры. Управляет настройками и ресурсами уровней.
 
-    Уровни 1-4 используют разные комбинации из 4 папок с изображениями.
-    Уровни 5+ используют все 4 папки с модификаторами сложности.
+    Уровни описываются набором уровней (DEFAULT_PACK или JSON-файл из
+    custom_paths['levels']): список первых уровней и круг для всех
+    следующих. При создании менеджера набор проверяется и компилируется
+    в таблицу правил, а папки с картинками находятся и проверяются один
+    раз при первом запросе уровня (load). После этого get_level и
+    get_levels работают за O(1) на уровень без обращений к диску.
+
+    Размер поля по умолчанию 4x4. Если задан grow_every, сторона поля
+    увеличивается на 2 каждые grow_every уровней (до max_board_side),
+    а количество ходов растёт пропорционально количеству пар.
 
     Attributes:
         dirs (tuple): Кортеж с именами папок изображений.
-        base_levels (dict): Базовые конфигурации для первых 5 уровней.
-        Ключ - номер базового уровня (1-5), значение - кортеж
-            (названия папок картинок, время показа карточки, тип уровня).
-        INITIAL_MOVES (int): Количество ходов для 1-го уровня.
-        MOVES_DECREMENT (int): Шаг уменьшения ходов между базовыми уровнями.
+        BASE_PAIRS (int): Количество пар, на которое рассчитаны ходы (4x4).
+        board_side (int): Сторона поля на первом уровне.
+        grow_every (int): Через сколько уровней поле растёт (0 - не растёт).
+        max_board_side (int): Максимальная сторона поля.
     """
 
+    BASE_PAIRS = 8
+
     def __init__(
         self,
-        dirs=("images_1", "images_2", "images_3", "images_4"),
+        dirs=None,
         custom_paths=None,
+        board_side=4,
+        grow_every=0,
+        max_board_side=32,
+        pack=None,
     ):
-        """Инициализирует менеджер с базовыми настройками уровней.
+        """Инициализирует менеджер и компилирует набор уровней.
 
         Args:
-            dirs (tuple): Кортеж из 4 элементов с именами папок ресурсов.
-                Можно передавать относительные имена папок
+            dirs (tuple): Имена папок ресурсов вместо папок из набора
+                уровней (столько же, сколько в наборе). Можно
+                передавать относительные имена папок
                 (ищутся через get_path), которая ищет от корневой
                 директории проекта. Убедитесь, что папки существуют в проекте.
+            custom_paths: Пользовательские пути (ключи 'images' и
+                'levels' - файл набора уровней).
+            board_side: Сторона поля на первом уровне (чётная).
+            grow_every: Через сколько уровней сторона поля растёт на 2
+                (0 - размер поля не меняется).
+            max_board_side: Максимальная сторона поля (чётная).
+            pack: Набор уровней (словарь или путь к JSON-файлу);
+                по умолчанию custom_paths['levels'] или DEFAULT_PACK.
 
         Raises:
-            ValueError: Если длина кортежа dirs не 4.
+            ValueError: Если набор уровней некорректен, количество папок
+                не совпадает с набором или сторона поля нечётная или
+                меньше 2.
+            FileNotFoundError: Если файл набора уровней не найден.
         """
-        self.dirs = dirs
         self.custom_paths = custom_paths if custom_paths else {}
+        if pack is None:
+            pack = self.custom_paths.get("levels", DEFAULT_PACK)
+        if isinstance(pack, str):
+            pack = load_pack(pack)
+        pack_dirs = pack.get("dirs")
+        if not pack_dirs:
+            raise ValueError("В наборе уровней нет списка папок 'dirs'")
+        self.dirs = tuple(dirs) if dirs is not None else tuple(pack_dirs)
         k = len(self.dirs)
-        if k != 4:
+        if k != len(pack_dirs):
             raise ValueError(
                 f"Передаваемый кортеж должен "
-                f"содержать 4 папки, получено: {k}"
+                f"содержать {len(pack_dirs)} папки, получено: {k}"
             )
 
-        self.base_levels = {
-            1: ((dirs[0],), 1000, "normal"),
-            2: (dirs[:2], 800, "normal"),
-            3: (dirs[1:3], 700, "normal"),
-            4: (dirs, 600, "normal"),
-        }
-        self.INITIAL_MOVES = 30
-        self.MOVES_DECREMENT = 4
+        for side in (board_side, max_board_side):
+            if side < 2 or side % 2:
+                raise ValueError(
+                    f"Сторона поля должна быть чётной и >= 2, получено: {side}"
+                )
+        self.board_side = board_side
+        self.grow_every = grow_every
+        self.max_board_side = max(max_board_side, board_side)
 
-    def get_level(self, lvl_num: int):
-        """Возвращает параметры для указанного уровня.
+        self._compile(pack)
+        # Пути к папкам по индексам, заполняются при load()
+        self._paths = None
 
-        Args:
-            lvl_num (int): Номер уровня.
+    def _compile(self, pack):
+        """Проверяет набор уровней и строит таблицу правил.
 
-        Returns:
-            Кортеж из:
-            - moves: Количество ходов
-            - paths: Список из полных путей к папкам с картинками
-            - time: Время показа карточки в миллисекундах
-            - lvl_type: Тип уровня
+        Правило уровня - (moves, time, lvl_type, индексы папок) для
+        поля 4x4; уровни после списка levels берутся из круга cycle.
+
+        Raises:
+            ValueError: Если набор уровней некорректен.
+        """
+        levels = pack.get("levels", [])
+        cycle = pack.get("cycle")
+        if not levels and not cycle:
+            raise ValueError("Набор уровней пуст")
+        self._table = [
+            self._rule(level, level, f"уровень {i}")
+            for i, level in enumerate(levels, start=1)
+        ]
+        self._cycle = []
+        self._special = None
+        if cycle:
+            self._cycle = [
+                self._rule(step, cycle, f"круг, шаг {i}")
+                for i, step in enumerate(cycle.get("steps", []), start=1)
+            ]
+            if not self._cycle:
+                raise ValueError("В круге уровней нет шагов 'steps'")
+            special = cycle.get("special")
+            if special:
+                every = special.get("every", 0)
+                if not isinstance(every, int) or every < 1:
+                    raise ValueError(
+                        f"Особый уровень: every должно быть >= 1, "
+                        f"получено: {every}"
+                    )
+                self._special = (
+                    every,
+                    max(special.get("time", 100), 100),
+                    special.get("type", "normal"),
+                )
+
+    def _rule(self, entry, defaults, name):
+        """Строит правило уровня из описания и значений по умолчанию.
+
+        Raises:
+            ValueError: Если не хватает полей или они некорректны.
+        """
+        try:
+            moves = entry["moves"]
+            time = entry.get("time", defaults.get("time"))
+            dirs = tuple(entry.get("dirs", defaults.get("dirs", ())))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Набор уровней, {name}: нет поля {e}")
+        if not isinstance(moves, int) or moves < 1:
+            raise ValueError(f"Набор уровней, {name}: moves должно быть >= 1")
+        if not isinstance(time, int) or time < 1:
+            raise ValueError(f"Набор уровней, {name}: time должно быть >= 1")
+        if not dirs or any(
+            not isinstance(d, int) or not 0 <= d < len(self.dirs)
+            for d in dirs
+        ):
+            raise ValueError(
+                f"Набор уровней, {name}: неверные индексы папок {dirs}"
+            )
+        return moves, max(time, 100), entry.get("type", "normal"), dirs
+
+    def _lookup(self, lvl_num):
+        """Возвращает правило уровня из таблицы или круга за O(1).
 
         Raises:
             ValueError: Если lvl_num < 1.
-            FileNotFoundError: Если не удалось найти одну из папок ресурсов."""
+        """
         if lvl_num < 1:
             raise ValueError(
                 f"Номер уровня должен быть >= 1, получен: {lvl_num}"
             )
-        base_lvl = min(
-            lvl_num, 4
-        )  # Определяем базовый уровень (для всех уровней > 4 - 4)
-        dir_names, time, lvl_type = self.base_levels[
-            base_lvl
-        ]  # Получаем базовую конфигурацию
-        paths = []
-        for dir_name in dir_names:
+        if lvl_num <= len(self._table):
+            return self._table[lvl_num - 1]
+        if not self._cycle:
+            # без круга последний уровень повторяется
+            return self._table[-1]
+        pos = (lvl_num - len(self._table) - 1) % len(self._cycle)
+        moves, time, lvl_type, dirs = self._cycle[pos]
+        if self._special and lvl_num % self._special[0] == 0:
+            time, lvl_type = self._special[1:]
+        return moves, time, lvl_type, dirs
+
+    def load(self):
+        """Находит и проверяет папки с картинками всех уровней.
+
+        Выполняется один раз (повторно - только после ошибки). Папка
+        проверяется, только если её использует какой-нибудь уровень, а
+        в папках каждого уровня должно быть не меньше MIN_IMAGES
+        изображений.
+
+        Returns:
+            list: Пути к папкам по индексам (None - папка не используется).
+
+        Raises:
+            FileNotFoundError: Если не найдена папка ресурсов или в папках
+                уровня мало изображений.
+        """
+        if self._paths is not None:
+            return self._paths
+        dir_sets = {rule[3] for rule in chain(self._table, self._cycle)}
+        used = sorted(set(chain.from_iterable(dir_sets)))
+        paths = [None] * len(self.dirs)
+        if "images" in self.custom_paths:
+            # Путь относительно пользовательской папки
+            base_path = self.custom_paths["images"]
+            if not os.path.isdir(base_path):
+                raise FileNotFoundError(
+                    f"Папка с ресурсами не найдена: {base_path}"
+                )
+        for index in used:
+            dir_name = self.dirs[index]
             if "images" in self.custom_paths:
-                # Путь относительно пользовательской папки
-                base_path = self.custom_paths["images"]
-                if not os.path.isdir(base_path):
-                    raise FileNotFoundError(
-                        f"Папка с ресурсами не найдена: {base_path}"
-                    )
-                path = os.path.join(base_path, dir_name)
+                path = os.path.join(self.custom_paths["images"], dir_name)
             else:
                 path = get_path(dir_name)
 
@@ -94,19 +267,83 @@ class LevelManager:
                 raise FileNotFoundError(
                     f"Папка с картинками не найдена: {path}"
                 )
+            paths[index] = path
+        for dirs in dir_sets:
+            level_paths = [paths[d] for d in dirs]
+            images = chain.from_iterable(iter_images(p) for p in level_paths)
+            if len(list(islice(images, MIN_IMAGES))) < MIN_IMAGES:
+                raise FileNotFoundError(
+                    f"Недостаточно изображений для игры в: {level_paths}"
+                )
+        self._paths = paths
+        return paths
+
+    def get_board_size(self, lvl_num: int):
+        """Возвращает размер поля для указанного уровня.
+
+        Args:
+            lvl_num (int): Номер уровня.
+
+        Returns:
+            tuple: (rows, cols) - количество строк и столбцов карточек.
+        """
+        side = self.board_side
+        if self.grow_every > 0:
+            side += 2 * ((max(lvl_num, 1) - 1) // self.grow_every)
+        side = min(side, self.max_board_side)
+        return side, side
+
+    def get_rules(self, lvl_num: int):
+        """Возвращает правила уровня без обращения к файловой системе.
 
-            paths.append(path)
-        # Рассчитываем базовое кол-во ходов
-        moves = self.INITIAL_MOVES - ((base_lvl - 1) * self.MOVES_DECREMENT)
-        # Дополнительные модификации для уровней выше 4-го
-        if lvl_num > 4:
-            pos = (lvl_num - 5) % 4  # Циклическая позиция для вариаций
-            # Модификация ходов (отклонения от базового кол-ва)
-            moves = moves + [-1, -4, -1, +4][pos]
-            types = ["normal", "ХАРДКОР!", "normal", "БОНУС!"]
-            lvl_type = types[pos]
-            # Особый уровень каждые 7 уровней (мало времени на показ карточек)
-            if lvl_num % 7 == 0:
-                time, lvl_type = 400, "СПРИНТ"
-        moves, time = max(moves, 1), max(time, 100)
-        return moves, paths, time, lvl_type
+        Args:
+            lvl_num (int): Номер уровня.
+
+        Returns:
+            tuple: (moves, time, lvl_type) - количество ходов, время
+            показа карточки в миллисекундах и тип уровня.
+
+        Raises:
+            ValueError: Если lvl_num < 1.
+        """
+        moves, time, lvl_type, _ = self._lookup(lvl_num)
+        # Ходы рассчитаны на поле 4x4, большие поля получают больше ходов
+        rows, cols = self.get_board_size(lvl_num)
+        moves = moves * (rows * cols // 2) // self.BASE_PAIRS
+        return max(moves, 1), time, lvl_type
+
+    def get_level(self, lvl_num: int):
+        """Возвращает параметры для указанного уровня.
+
+        Args:
+            lvl_num (int): Номер уровня.
+
+        Returns:
+            Кортеж из:
+            - moves: Количество ходов
+            - paths: Список из полных путей к папкам с картинками
+            - time: Время показа карточки в миллисекундах
+            - lvl_type: Тип уровня
+
+        Raises:
+            ValueError: Если lvl_num < 1.
+            FileNotFoundError: Если не удалось найти одну из папок ресурсов."""
+        moves, time, lvl_type = self.get_rules(lvl_num)
+        paths = self.load()
+        dirs = self._lookup(lvl_num)[3]
+        return moves, [paths[d] for d in dirs], time, lvl_type
+
+    def get_levels(self, levels):
+        """Возвращает параметры нескольких уровней (см. get_level).
+
+        Args:
+            levels: Номера уровней (например, range(1, 101)).
+
+        Returns:
+            list: Кортежи (moves, paths, time, lvl_type) по уровням.
+
+        Raises:
+            ValueError: Если какой-то номер уровня < 1.
+            FileNotFoundError: Если не удалось найти одну из папок ресурсов.
+        """
+        return [self.get_level(lvl_num) for lvl_num in levels]
@@ -0,0 +1,148 @@
+import random
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from myself_moduls.image_catalog import get_catalog
+from myself_moduls.make_list_images import list_files
+
+PreparedLevel = namedtuple(
+    "PreparedLevel",
+    "lvl_num moves paths time lvl_type board_size images keys faces seed",
+)
+PreparedLevel.__doc__ = """Подготовленный уровень.
+
+Поля moves, paths, time, lvl_type совпадают с результатом
+LevelManager.get_level, board_size - (rows, cols) из
+LevelManager.get_board_size, images - перемешанный список карточек
+из list_files, keys - идентификаторы содержимого этих изображений
+(ImageCatalog.content_ids), faces - словарь
+{путь: декодированное изображение},
+seed - зерно, с которым выбраны и перемешаны изображения."""
+
+
+def new_seed():
+    """Возвращает случайное зерно для раскладки доски."""
+    return random.getrandbits(32)
+
+
+class LevelPrefetcher:
+    """Готовит уровни в фоновом потоке, пока идёт текущая игра.
+
+    Для каждого уровня заранее выполняются проверки папок
+    (LevelManager.get_level), сканирование и выборка изображений
+    (list_files) и, если передана функция decode, декодирование
+    изображений карточек. Нажатие «следующий уровень» забирает готовый
+    результат без обращения к диску в GUI-потоке.
+
+    Attributes:
+        level_manager (LevelManager): Источник параметров уровней.
+        stream (bool): Выбирать изображения потоково (list_files
+            с stream=True), для больших пользовательских библиотек.
+    """
+
+    def __init__(self, level_manager, stream=False):
+        """Создаёт фоновый поток подготовки уровней.
+
+        Args:
+            level_manager: Менеджер уровней (LevelManager).
+            stream: Выбирать изображения без составления списка всех
+                файлов библиотеки.
+        """
+        self.level_manager = level_manager
+        self.stream = stream
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="level-prefetch"
+        )
+        self._futures = {}
+
+    def prepare_level(self, lvl_num, decode=None, seed=None):
+        """Синхронно готовит уровень.
+
+        Args:
+            lvl_num: Номер уровня.
+            decode: Функция path -> изображение для предварительного
+                декодирования карточек (необязательно).
+            seed: Зерно раскладки (по умолчанию новое случайное).
+
+        Returns:
+            PreparedLevel: Подготовленный уровень.
+
+        Raises:
+            ValueError: Если lvl_num < 1.
+            FileNotFoundError: Если не найдены ресурсы уровня.
+        """
+        moves, paths, time, lvl_type = self.level_manager.get_level(lvl_num)
+        rows, cols = self.level_manager.get_board_size(lvl_num)
+        if seed is None:
+            seed = new_seed()
+        images = list_files(
+            paths,
+            pairs=rows * cols // 2,
+            stream=self.stream,
+            rng=random.Random(seed),
+        )
+        keys = get_catalog().content_ids(images)
+        faces = {}
+        if decode:
+            for path in dict.fromkeys(images):
+                faces[path] = decode(path)
+        return PreparedLevel(
+            lvl_num,
+            moves,
+            paths,
+            time,
+            lvl_type,
+            (rows, cols),
+            images,
+            keys,
+            faces,
+            seed,
+        )
+
+    def prefetch(self, levels, decode=None):
+        """Ставит уровни в очередь фоновой подготовки.
+
+        Уже запрошенные уровни повторно не готовятся.
+
+        Args:
+            levels: Номера уровней (например, следующий при победе
+                и первый при поражении).
+            decode: Функция path -> изображение, вызывается в фоне.
+        """
+        for lvl_num in levels:
+            if lvl_num not in self._futures:
+                self._futures[lvl_num] = self._executor.submit(
+                    self.prepare_level, lvl_num, decode
+                )
+
+    def take(self, lvl_num, seed=None):
+        """Возвращает подготовленный уровень и сбрасывает остальные.
+
+        Если уровень не запрашивался заранее или задано зерно, уровень
+        готовится синхронно (без декодирования изображений).
+
+        Args:
+            lvl_num: Номер уровня.
+            seed: Зерно раскладки (например, из записи партии).
+
+        Returns:
+            PreparedLevel: Подготовленный уровень.
+
+        Raises:
+            ValueError: Если lvl_num < 1.
+            FileNotFoundError: Если не найдены ресурсы уровня.
+        """
+        future = self._futures.pop(lvl_num, None)
+        for other in self._futures.values():
+            other.cancel()
+        self._futures.clear()
+        if future is None or seed is not None:
+            return self.prepare_level(lvl_num, seed=seed)
+        return future.result()
+
+    def shutdown(self):
+        """Останавливает фоновый поток, отменяя невыполненные задачи."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,286 @@
+"""
+Нагрузочный клиент игрового сервера (myself_moduls/game_server.py).
+
+Открывает несколько соединений, в каждом - активные партии, которые
+играют боты (myself_moduls/bots.py), и ожидающие партии, которые
+только занимают место на сервере. Бот видит доску так же, как живой
+игрок: изображение карточки становится известно из ответа сервера
+после переворота (BoardView). В каждой активной партии не больше
+одного запроса без ответа; время ответа на переворот замеряется.
+
+Запуск (сервер должен быть запущен, для скорости - с --time-show 0):
+    python -m myself_moduls.load_client [--host 127.0.0.1] [--port 8765]
+        [--connections 4] [--sessions 64] [--idle 10000] [--duration 10]
+        [--bot perfect|random|memory:N] [--seed N]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from myself_moduls.bots import make_bot
+from myself_moduls.game_server import DEFAULT_PORT
+
+
+class BoardView:
+    """Доска глазами клиента: атрибуты GameEngine, нужные ботам.
+
+    Attributes:
+        image_ids (list): Известные изображения карточек (-1 - не видели).
+        turned (bytearray): 1, если карточка перевернута.
+        found (bytearray): 1, если для карточки найдена пара.
+        turned_cards (list): Перевернутые карточки без пары.
+    """
+
+    __slots__ = ("image_ids", "turned", "found", "turned_cards")
+
+    def __init__(self, size):
+        self.image_ids = [-1] * size
+        self.turned = bytearray(size)
+        self.found = bytearray(size)
+        self.turned_cards = []
+
+    def __len__(self):
+        """Возвращает количество карточек."""
+        return len(self.image_ids)
+
+    def apply_turn(self, reply):
+        """Применяет ответ сервера на переворот."""
+        card = reply["card"]
+        self.image_ids[card] = reply["image"]
+        self.turned[card] = 1
+        self.turned_cards.append(card)
+        if reply.get("match"):
+            index_1, index_2 = self.turned_cards
+            self.found[index_1] = self.found[index_2] = 1
+            self.turned_cards.clear()
+
+    def apply_hide(self, cards):
+        """Переворачивает обратно скрытые сервером карточки."""
+        for card in cards:
+            self.turned[card] = 0
+        self.turned_cards.clear()
+
+
+class Player:
+    """Активная партия клиента.
+
+    Attributes:
+        sid (int): Номер партии на сервере.
+        bot (Bot): Бот.
+        view (BoardView | None): Текущая доска.
+        sent_at (float): Момент отправки последнего переворота.
+    """
+
+    __slots__ = ("sid", "bot", "view", "sent_at")
+
+    def __init__(self, bot):
+        self.sid = None
+        self.bot = bot
+        self.view = None
+        self.sent_at = 0.0
+
+
+class LoadStats:
+    """Счётчики нагрузки.
+
+    Attributes:
+        moves (int): Перевороты с ответом.
+        games (int): Законченные партии.
+        wins (int): Выигранные партии.
+        errors (int): Ответы с ошибкой.
+        latencies (list): Время ответа на переворот в секундах.
+    """
+
+    def __init__(self):
+        self.moves = self.games = self.wins = self.errors = 0
+        self.latencies = []
+
+    def summary(self, seconds, idle):
+        """Возвращает сводку нагрузки.
+
+        Returns:
+            dict: moves, games, wins, errors, idle, seconds, moves_per_s,
+            p50_ms, p95_ms.
+        """
+        values = sorted(value * 1000 for value in self.latencies)
+        last = len(values) - 1
+        return {
+            "moves": self.moves,
+            "games": self.games,
+            "wins": self.wins,
+            "errors": self.errors,
+            "idle": idle,
+            "seconds": seconds,
+            "moves_per_s": self.moves / seconds if seconds else 0.0,
+            "p50_ms": values[last // 2] if values else None,
+            "p95_ms": values[last * 95 // 100] if values else None,
+        }
+
+
+async def _drive(host, port, players, idle, stats, deadline, level):
+    """Ведёт партии одного соединения до deadline."""
+    reader, writer = await asyncio.open_connection(host, port)
+
+    def send(message):
+        writer.write(json.dumps(message, separators=(",", ":")).encode())
+        writer.write(b"\n")
+
+    def turn(player):
+        if time.perf_counter() >= deadline:
+            return
+        player.sent_at = time.perf_counter()
+        card = player.bot.pick(player.view)
+        send({"op": "turn", "s": player.sid, "card": card})
+
+    for number in range(idle):
+        send({"op": "new", "level": level, "id": -1 - number})
+    for number in range(len(players)):
+        send({"op": "new", "level": level, "id": number})
+    by_sid = {}
+    try:
+        while time.perf_counter() < deadline:
+            try:
+                line = await asyncio.wait_for(
+                    reader.readline(), deadline - time.perf_counter()
+                )
+            except asyncio.TimeoutError:
+                break
+            if not line:
+                break
+            reply = json.loads(line)
+            event = reply.get("ev")
+            if event == "error":
+                stats.errors += 1
+                continue
+            if event == "new":
+                player = by_sid.get(reply["s"])
+                if player is None:
+                    if reply.get("id", -1) < 0:
+                        continue
+                    player = players[reply["id"]]
+                    player.sid = reply["s"]
+                    by_sid[player.sid] = player
+                player.view = BoardView(reply["rows"] * reply["cols"])
+                player.bot.reset()
+                turn(player)
+                continue
+            player = by_sid.get(reply.get("s"))
+            if player is None:
+                continue
+            if event == "hide":
+                player.view.apply_hide(reply["cards"])
+                turn(player)
+            elif event == "turn":
+                if not reply.get("ok", True):
+                    stats.errors += 1
+                    continue
+                stats.moves += 1
+                stats.latencies.append(time.perf_counter() - player.sent_at)
+                player.view.apply_turn(reply)
+                player.bot.observe(reply["card"], reply["image"])
+                if "result" in reply:
+                    stats.games += 1
+                    stats.wins += reply["result"] == "win"
+                    send({"op": "new", "s": player.sid, "level": level})
+                elif reply.get("match", True):
+                    # после совпадения или первой карточки - следующий ход,
+                    # после промаха - ждём события hide
+                    turn(player)
+            if writer.transport.get_write_buffer_size() > 1 << 16:
+                await writer.drain()
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def run_load(
+    host="127.0.0.1",
+    port=DEFAULT_PORT,
+    connections=4,
+    sessions=64,
+    idle=0,
+    duration=10.0,
+    bot="perfect",
+    seed=None,
+    level=1,
+):
+    """Создаёт нагрузку на сервер.
+
+    Args:
+        host: Адрес сервера.
+        port: Порт сервера.
+        connections: Количество соединений.
+        sessions: Активных партий на все соединения.
+        idle: Ожидающих партий на все соединения.
+        duration: Длительность в секундах.
+        bot: Описание бота (см. make_bot).
+        seed: Зерно ботов.
+        level: Уровень партий.
+
+    Returns:
+        dict: Сводка (см. LoadStats.summary).
+    """
+    rng = random.Random(seed)
+    stats = LoadStats()
+    start = time.perf_counter()
+    deadline = start + duration
+    tasks = []
+    for number in range(connections):
+        players = [
+            Player(make_bot(bot, random.Random(rng.getrandbits(32))))
+            for _ in range(number, sessions, connections)
+        ]
+        waiting = len(range(number, idle, connections))
+        tasks.append(
+            _drive(host, port, players, waiting, stats, deadline, level)
+        )
+    await asyncio.gather(*tasks)
+    return stats.summary(time.perf_counter() - start, idle)
+
+
+def main(argv):
+    """Запускает нагрузку и печатает сводку."""
+    parser = argparse.ArgumentParser(
+        description="Нагрузочный клиент сервера Memory Game"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--sessions", type=int, default=64)
+    parser.add_argument("--idle", type=int, default=0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--bot", default="perfect")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--level", type=int, default=1)
+    args = parser.parse_args(argv)
+    try:
+        summary = asyncio.run(
+            run_load(
+                args.host,
+                args.port,
+                args.connections,
+                args.sessions,
+                args.idle,
+                args.duration,
+                args.bot,
+                args.seed,
+                args.level,
+            )
+        )
+    except OSError as e:
+        print(f"Сервер недоступен: {e}")
+        return 1
+    for name, value in summary.items():
+        print(f"{name}: {value if value is not None else '-'}")
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+
+
+class SizedLruCache:
+    """LRU-кеш с ограничением по суммарному размеру значений.
+
+    Каждое значение кладётся в кеш вместе со своей «стоимостью»
+    (например, размером в байтах). Если сумма стоимостей превышает
+    max_cost, вытесняются давно не использованные значения.
+
+    Attributes:
+        max_cost (int): Максимальная суммарная стоимость значений.
+        total_cost (int): Текущая суммарная стоимость значений.
+        hits (int): Количество попаданий в кеш.
+        misses (int): Количество промахов.
+    """
+
+    def __init__(self, max_cost):
+        """Создаёт пустой кеш.
+
+        Args:
+            max_cost: Максимальная суммарная стоимость значений.
+
+        Raises:
+            ValueError: Если max_cost меньше 0.
+        """
+        if max_cost < 0:
+            raise ValueError(
+                f"Размер кеша должен быть >= 0, получен: {max_cost}"
+            )
+        self.max_cost = max_cost
+        self.total_cost = 0
+        self.hits = self.misses = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        """Возвращает количество значений в кеше."""
+        return len(self._items)
+
+    def __contains__(self, key):
+        """Проверяет наличие ключа, не меняя порядок вытеснения."""
+        return key in self._items
+
+    def get(self, key, default=None):
+        """Возвращает значение и помечает его как недавно использованное.
+
+        Args:
+            key: Ключ значения.
+            default: Что вернуть при промахе.
+        """
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._items.move_to_end(key)
+        return item[0]
+
+    def put(self, key, value, cost):
+        """Кладёт значение в кеш, вытесняя старые при переполнении.
+
+        Значение дороже max_cost не кешируется.
+
+        Args:
+            key: Ключ значения.
+            value: Значение.
+            cost: Стоимость значения (например, размер в байтах).
+        """
+        self.pop(key)
+        if cost > self.max_cost:
+            return
+        self._items[key] = (value, cost)
+        self.total_cost += cost
+        while self.total_cost > self.max_cost:
+            _, (_, old_cost) = self._items.popitem(last=False)
+            self.total_cost -= old_cost
+
+    def pop(self, key):
+        """Удаляет значение из кеша и возвращает его (или None)."""
+        item = self._items.pop(key, None)
+        if item is None:
+            return None
+        self.total_cost -= item[1]
+        return item[0]
+
+    def clear(self):
+        """Очищает кеш."""
+        self._items.clear()
+        self.total_cost = 0
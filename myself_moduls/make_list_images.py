@@ -1,40 +1,214 @@
 import os
-from random import sample, shuffle
+import threading
+import weakref
+from itertools import chain, islice
+from math import exp, floor, log
+import random
 
+from myself_moduls.image_catalog import get_catalog
 
-def list_files(dir_paths):
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Кеш сканирования: {папка: (st_mtime_ns папки, кортеж путей)}
+_scan_cache = {}
+_scan_lock = threading.Lock()
+# Кеш уникальных по содержимому изображений для каждого каталога:
+# {каталог: {папка: (st_mtime_ns папки, кортеж путей)}}
+_distinct_cache = weakref.WeakKeyDictionary()
+_END = object()
+
+
+def iter_images(dir_path):
+    """Перебирает изображения в директории, не составляя их список.
+
+    Args:
+        dir_path: Путь к директории.
+
+    Yields:
+        str: Путь к изображению.
+    """
+    if not os.path.isdir(dir_path):
+        return
+    try:
+        for file in os.scandir(dir_path):
+            if file.is_file() and file.name.lower().endswith(
+                IMAGE_EXTENSIONS
+            ):
+                yield file.path
+    except Exception as e:
+        print(f"Нет доступа к директории {dir_path}: {e}")
+
+
+def scan_images(dir_path):
+    """Возвращает изображения директории, используя кеш сканирования.
+
+    Директория сканируется заново только если изменилось время её
+    изменения (добавление, удаление или переименование файлов). Пути
+    отсортированы, поэтому выбор изображений с одним зерном не зависит
+    от порядка файлов в файловой системе.
+
+    Args:
+        dir_path: Путь к директории.
+
+    Returns:
+        tuple: Пути к изображениям.
+    """
+    try:
+        mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return tuple(sorted(iter_images(dir_path)))
+    with _scan_lock:
+        cached = _scan_cache.get(dir_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    images = tuple(sorted(iter_images(dir_path)))
+    with _scan_lock:
+        _scan_cache[dir_path] = (mtime, images)
+    return images
+
+
+def distinct_images(dir_path, catalog):
+    """Возвращает уникальные по содержимому изображения директории.
+
+    Результат кешируется для каталога до изменения директории, как в
+    scan_images: повторный вызов не обращается к файлам (catalog.update
+    проверяет каждый файл и на больших папках занимает сотни
+    миллисекунд). Изменение содержимого файла без изменения директории
+    замечается только после её изменения.
+
+    Args:
+        dir_path: Путь к директории.
+        catalog: Каталог хешей содержимого (ImageCatalog).
+
+    Returns:
+        tuple: Первый путь для каждого уникального содержимого.
+    """
+    try:
+        mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return tuple(catalog.distinct(scan_images(dir_path)))
+    with _scan_lock:
+        cached = _distinct_cache.get(catalog, {}).get(dir_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    images = tuple(catalog.distinct(scan_images(dir_path)))
+    with _scan_lock:
+        _distinct_cache.setdefault(catalog, {})[dir_path] = (mtime, images)
+    return images
+
+
+def reservoir_sample(items, k, rng=None):
+    """Выбирает k случайных элементов из итератора за один проход.
+
+    Резервуарная выборка (алгоритм L): в памяти хранится только
+    выборка, а случайные числа берутся лишь для элементов, попадающих
+    в неё, остальные элементы пропускаются.
+
+    Args:
+        items: Итерируемый объект (например, генератор путей).
+        k: Размер выборки.
+        rng: Генератор случайных чисел (random.Random, по умолчанию
+            общий генератор модуля random).
+
+    Returns:
+        list: Выборка из min(k, количество элементов) элементов.
+    """
+    rng = rng or random
+    items = iter(items)
+    reservoir = list(islice(items, k))
+    if len(reservoir) < k or k <= 0:
+        return reservoir
+    w = exp(log(1.0 - rng.random()) / k)
+    while w < 1.0:
+        skip = floor(log(1.0 - rng.random()) / log(1.0 - w))
+        item = next(islice(items, skip, None), _END)
+        if item is _END:
+            break
+        reservoir[rng.randrange(k)] = item
+        w *= exp(log(1.0 - rng.random()) / k)
+    return reservoir
+
+
+def _stream_distinct(dir_paths, pairs, catalog, rng):
+    """Выбирает до pairs разных по содержимому изображений потоково.
+
+    Хешируются только изображения из выборки. Если в выборке нашлись
+    дубликаты, выборка повторяется с удвоенным размером. Пути каждой
+    папки сортируются перед выборкой (в памяти - пути одной папки, а не
+    всей библиотеки), поэтому с одним зерном выборка не зависит от
+    порядка файлов в файловой системе.
+    """
+    k = pairs
+    while True:
+        selected = reservoir_sample(
+            chain.from_iterable(sorted(iter_images(d)) for d in dir_paths),
+            k,
+            rng,
+        )
+        unique = catalog.distinct(selected)
+        if len(unique) >= pairs or len(selected) < k:
+            return unique[:pairs]
+        k *= 2
+
+
+def list_files(dir_paths, pairs=8, catalog=None, stream=False, rng=None):
     """Находит изображения в указанных директориях и
     подготавливает пары для игры.
 
-    Требуется минимум 8 уникальных изображений для создания 8 пар карточек.
+    Требуется минимум 8 уникальных изображений (или pairs, если пар
+    меньше). Если изображений меньше, чем пар (большие поля),
+    изображения повторяются: одно изображение даёт несколько пар.
+
+    Одинаковые по содержимому файлы из разных папок считаются одним
+    изображением (см. myself_moduls/image_catalog.py), поэтому пара
+    никогда не составляется из двух разных файлов.
 
     Args:
         dir_paths (tuple): Кортеж путей к директориям для поиска изображений.
+        pairs (int): Количество пар карточек (по умолчанию 8 для поля 4x4).
+        catalog (ImageCatalog): Каталог хешей содержимого (по умолчанию
+            общий каталог get_catalog()).
+        stream (bool): True для больших библиотек: изображения
+            выбираются резервуарной выборкой за один проход без
+            составления списка всех файлов библиотеки и хеширования
+            всех файлов.
+        rng (random.Random): Генератор случайных чисел; с генератором
+            от одного зерна на тех же папках получается та же раскладка
+            (по умолчанию общий генератор модуля random).
 
     Returns:
-        List[str]: Список из 16 путей к изображениям (8 уникальных × 2).
+        List[str]: Список из pairs * 2 путей к изображениям.
 
     Raises:
         FileNotFoundError: Если не найдено минимум 8 изображений.
     """
-    all_images = []
-    for dir_path in dir_paths:
-        if not os.path.isdir(dir_path):
-            continue
-        try:
-            for file in os.scandir(dir_path):
-                if file.is_file() and file.name.lower().endswith(
-                    (".png", ".jpg", ".jpeg")
-                ):
-                    all_images.append(file.path)
-        except Exception as e:
-            print(f"Нет доступа к директории {dir_path}: {e}")
-            continue
-    if len(all_images) < 8:
+    catalog = catalog or get_catalog()
+    rng = rng or random
+    if stream:
+        all_images = _stream_distinct(dir_paths, pairs, catalog, rng)
+    elif len(dir_paths) == 1:
+        all_images = distinct_images(dir_paths[0], catalog)
+    else:
+        # папки уже без дубликатов, между папками дубликаты убираются по
+        # сохранённым хешам без повторной проверки файлов
+        all_images = catalog.distinct(
+            list(
+                chain.from_iterable(
+                    distinct_images(d, catalog) for d in dir_paths
+                )
+            ),
+            refresh=False,
+        )
+    if len(all_images) < min(pairs, 8):
         raise FileNotFoundError(
             f"Недостаточно изображений для игры в: {dir_paths}"
         )
-    selected = sample(all_images, 8)
-    pairs = selected * 2
-    shuffle(pairs)
-    return pairs
+    if len(all_images) >= pairs:
+        selected = rng.sample(all_images, pairs)
+    else:
+        all_images = list(all_images)
+        rng.shuffle(all_images)
+        selected = [all_images[i % len(all_images)] for i in range(pairs)]
+    cards = selected * 2
+    rng.shuffle(cards)
+    return cards
@@ -1,5 +1,10 @@
+import queue
+import threading
+import time
+
+from myself_moduls.audio_engine import get_engine
 from myself_moduls.get_absolute_path import get_path
-import pygame
+from myself_moduls.startup_timeline import timeline
 
 
 class SoundManager:
@@ -8,47 +13,140 @@ class SoundManager:
     Управляет воспроизведением звуков: переворот карты, совпадение,
     победа, поражение.
 
+    Звуки загружаются в фоновом потоке по приоритету (LOAD_ORDER):
+    сначала переворот, затем совпадение, затем победа и поражение,
+    которые нужны только в конце уровня. Окно игры не ждёт декодирования.
+    Звук, запрошенный до окончания загрузки, поднимается в начало
+    очереди и проигрывается сразу после загрузки, если опоздание
+    не превышает LATE_PLAY_LIMIT, иначе пропускается.
+
+    Микшер и каналы принадлежат общему аудиодвижку (AudioEngine):
+    каждый эффект играет в своём пуле каналов.
+
     Attributes:
+        LOAD_ORDER (tuple): Имена звуков в порядке загрузки.
+        LATE_PLAY_LIMIT (float): Допустимое опоздание звука в секундах.
         playing (bool): Флаг включения/выключения звуков.
         sounds (Dict[str, pygame.mixer.Sound]): Словарь загруженных звуков.
+        engine (AudioEngine): Аудиодвижок для воспроизведения.
     """
 
-    def __init__(self, custom_paths=None):
-        """Инициализирует менеджер звуков и загружает звуковые файлы."""
+    LOAD_ORDER = ("flip", "match", "win", "lose")
+    LATE_PLAY_LIMIT = 0.15
+
+    def __init__(self, custom_paths=None, engine=None):
+        """Инициализирует менеджер звуков и запускает фоновую загрузку.
+
+        Args:
+            custom_paths: Пользовательские пути к звукам (sound_<имя>).
+            engine: Аудиодвижок (по умолчанию общий, get_engine()).
+        """
         self.playing = True
         self.custom_paths = custom_paths if custom_paths else {}
+        self.engine = engine or get_engine()
+        self.sounds = {}
+        self._failed = set()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._queue = queue.PriorityQueue()
+        for priority, name in enumerate(self.LOAD_ORDER):
+            self._queue.put((priority, name))
+        self._loader = threading.Thread(
+            target=self._load_sounds, name="sound-loader", daemon=True
+        )
+        self._loader.start()
+
+    def _sound_path(self, name):
+        """Возвращает путь к файлу звука с учётом custom_paths."""
+        custom_sound = self.custom_paths.get(f"sound_{name}")
+        return custom_sound if custom_sound else get_path(f"{name}.wav")
+
+    def _load_sounds(self):
+        """Загружает звуки из очереди (выполняется в фоновом потоке)."""
         try:
-            pygame.mixer.init()
-            sound_names = ("flip", "match", "win", "lose")
-            self.sounds = {}
-            for name in sound_names:
-                custom_sound = self.custom_paths.get(f"sound_{name}")
-                if custom_sound:
-                    path = custom_sound
-                else:
-                    path = get_path(f"{name}.wav")
-
-                self.sounds[name] = pygame.mixer.Sound(path)
+            mixer = self.engine.mixer()
         except Exception as e:
             print(f"Ошибка загрузки звуков: {e}")
+            with self._lock:
+                self._failed.update(self.LOAD_ORDER)
+                self._pending.clear()
+            return
+
+        while True:
+            try:
+                _, name = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if name in self.sounds or name in self._failed:
+                continue
+            try:
+                with timeline.phase(f"sound load {name}"):
+                    sound = mixer.Sound(self._sound_path(name))
+            except Exception as e:
+                print(f"Ошибка загрузки звука '{name}': {e}")
+                with self._lock:
+                    self._failed.add(name)
+                    self._pending.pop(name, None)
+                continue
+            with self._lock:
+                self.sounds[name] = sound
+                requested = self._pending.pop(name, None)
+            if (
+                requested is not None
+                and self.playing
+                and time.perf_counter() - requested <= self.LATE_PLAY_LIMIT
+            ):
+                self._play(name, sound, requested)
+
+    def wait_loaded(self, timeout=None):
+        """Ждёт окончания фоновой загрузки звуков.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах.
+
+        Returns:
+            bool: True, если загрузка завершена.
+        """
+        self._loader.join(timeout)
+        return not self._loader.is_alive()
 
     def play_param(self, param):
         """Воспроизводит звук по его имени.
 
+        Никогда не блокирует: если звук ещё загружается, он будет
+        проигран после загрузки (или пропущен при большом опоздании).
+
         Args:
             param: Имя звука ('flip', 'match', 'win', 'lose')
         """
         if not self.playing:
             return
 
-        if param not in self.sounds:
+        requested = time.perf_counter()
+        with self._lock:
+            sound = self.sounds.get(param)
+            if sound is None:
+                if param in self.LOAD_ORDER and param not in self._failed:
+                    self._pending[param] = requested
+                    self._queue.put((-1, param))  # загрузить следующим
+                    return
+        if sound is None:
             print(
                 f"Звук '{param}' не найден. "
                 f"Доступные: {list(self.sounds.keys())}")
             return
+        self._play(param, sound, requested)
+
+    def _play(self, param, sound, requested):
+        """Проигрывает загруженный звук в пуле каналов его типа.
 
+        Args:
+            param: Имя звука.
+            sound: Загруженный звук.
+            requested: Момент запроса звука (time.perf_counter()).
+        """
         try:
-            self.sounds[param].play()
+            self.engine.play_effect(param, sound, requested)
         except Exception as e:
             print(f"Ошибка воспроизведения звука '{param}': {e}")
 
@@ -57,22 +155,26 @@ class MusicManager:
     """Менеджер фоновой музыки в игре.
 
     Обеспечивает загрузку, воспроизведение и управление фоновой музыкой
-    с использованием библиотеки Pygame mixer.
+    с использованием библиотеки Pygame mixer. Микшером владеет общий
+    аудиодвижок (AudioEngine), он инициализируется при первой загрузке.
 
     Attributes:
         playing (bool): Флаг, указывающий играет ли музыка в данный момент.
         loaded (bool): Флаг, указывающий успешно ли загружен музыкальный файл.
+        engine (AudioEngine): Аудиодвижок игры.
     """
 
-    def __init__(self, custom_paths=None):
-        """Инициализирует менеджер музыки и звуковую систему Pygame."""
+    def __init__(self, custom_paths=None, engine=None):
+        """Инициализирует менеджер музыки.
+
+        Args:
+            custom_paths: Пользовательские пути (ключ 'music').
+            engine: Аудиодвижок (по умолчанию общий, get_engine()).
+        """
         self.playing = False
         self.loaded = False
         self.custom_paths = custom_paths if custom_paths else {}
-        try:
-            pygame.mixer.init()
-        except Exception as e:
-            print(f"Ошибка инициализации музыки: {e}")
+        self.engine = engine or get_engine()
 
     def load(self, filename="music.ogg", volume=0.5):
         """Загружает музыкальный файл.
@@ -87,8 +189,10 @@ class MusicManager:
             custom_music = self.custom_paths.get("music")
             music_path = custom_music if custom_music else get_path(filename)
 
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
+            mixer = self.engine.mixer()
+            with timeline.phase("music load"):
+                mixer.music.load(music_path)
+            mixer.music.set_volume(volume)
             self.loaded = True
             return True
         except Exception as e:
@@ -101,7 +205,7 @@ class MusicManager:
         Музыка воспроизводится в бесконечном цикле (-1)."""
         if self.loaded and not self.playing:
             try:
-                pygame.mixer.music.play(-1)
+                self.engine.mixer().music.play(-1)
                 self.playing = True
             except Exception as e:
                 print(f"Ошибка воспроизведения музыки: {e}")
@@ -111,7 +215,7 @@ class MusicManager:
         Музыку можно возобновить вызовом play()."""
         if self.playing:
             try:
-                pygame.mixer.music.pause()
+                self.engine.mixer().music.pause()
                 self.playing = False
             except Exception as e:
                 print(f"Ошибка паузы музыки: {e}")
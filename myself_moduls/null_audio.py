@@ -0,0 +1,170 @@
+"""
+Беззвучное аудиоустройство для прогонов игры без звука.
+
+NullPygame повторяет ту часть pygame.mixer, которой пользуются
+AudioEngine, SoundManager и MusicManager, но ничего не проигрывает и
+не открывает аудиоустройство. Так окно игры запускается на серверах
+без звуковой карты и без pygame, а звуковой код (пулы каналов, фоновая
+загрузка, замер задержки) выполняется как обычно. Проигранные эффекты
+считаются в NullMixer.played.
+
+Использование:
+    previous = null_audio.install()
+    ...
+    audio_engine.set_engine(previous)
+"""
+
+import threading
+from collections import Counter
+
+from myself_moduls import audio_engine
+
+
+class NullSound:
+    """Звук-заглушка (pygame.mixer.Sound)."""
+
+    def __init__(self, path=None, mixer=None):
+        self.path = path
+        self._mixer = mixer
+        self._volume = 1.0
+
+    def play(self, *args, **kwargs):
+        if self._mixer is not None:
+            self._mixer.count(self)
+
+    def stop(self):
+        pass
+
+    def set_volume(self, volume):
+        self._volume = volume
+
+    def get_volume(self):
+        return self._volume
+
+    def get_length(self):
+        return 0.0
+
+
+class NullChannel:
+    """Канал-заглушка: сразу освобождается после play."""
+
+    def __init__(self, index, mixer):
+        self.index = index
+        self._mixer = mixer
+
+    def play(self, sound, *args, **kwargs):
+        self._mixer.count(sound)
+
+    def stop(self):
+        pass
+
+    def get_busy(self):
+        return False
+
+    def set_volume(self, *volume):
+        pass
+
+
+class NullMusic:
+    """Фоновая музыка-заглушка (pygame.mixer.music)."""
+
+    def __init__(self):
+        self.path = None
+        self.playing = False
+        self._volume = 1.0
+
+    def load(self, path):
+        self.path = path
+
+    def play(self, loops=0, *args, **kwargs):
+        self.playing = True
+
+    def pause(self):
+        self.playing = False
+
+    def unpause(self):
+        self.playing = True
+
+    def stop(self):
+        self.playing = False
+
+    def get_busy(self):
+        return self.playing
+
+    def set_volume(self, volume):
+        self._volume = volume
+
+    def get_volume(self):
+        return self._volume
+
+
+class NullMixer:
+    """Микшер-заглушка (pygame.mixer).
+
+    Attributes:
+        played (Counter): Сколько раз проигран каждый файл звука.
+        music (NullMusic): Фоновая музыка.
+    """
+
+    def __init__(self):
+        self.played = Counter()
+        self.music = NullMusic()
+        self._channels = {}
+        self._num_channels = 8
+        self._lock = threading.Lock()
+
+    def count(self, sound):
+        """Засчитывает проигрывание звука (из любого потока)."""
+        with self._lock:
+            self.played[getattr(sound, "path", sound)] += 1
+
+    def pre_init(self, *args, **kwargs):
+        pass
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def quit(self):
+        pass
+
+    def get_init(self):
+        return True
+
+    def get_num_channels(self):
+        return self._num_channels
+
+    def set_num_channels(self, count):
+        self._num_channels = count
+
+    def set_reserved(self, count):
+        pass
+
+    def stop(self):
+        pass
+
+    def Channel(self, index):
+        return self._channels.setdefault(index, NullChannel(index, self))
+
+    def Sound(self, path=None, *args, **kwargs):
+        return NullSound(path, self)
+
+
+class NullPygame:
+    """Модуль pygame с беззвучным микшером (см. AudioEngine backend)."""
+
+    def __init__(self):
+        self.mixer = NullMixer()
+
+
+def install(**settings):
+    """Делает общий аудиодвижок игры беззвучным.
+
+    Args:
+        **settings: Параметры AudioEngine (frequency, buffer, channels).
+
+    Returns:
+        AudioEngine | None: Прежний аудиодвижок (для set_engine).
+    """
+    return audio_engine.set_engine(
+        audio_engine.AudioEngine(backend=NullPygame(), **settings)
+    )
@@ -1,61 +1,166 @@
+import atexit
 import json
 import os
+import threading
+import time
+
+from myself_moduls.get_absolute_path import find_project_root
+
+# прежнее место файла прогресса (папка модуля)
+LEGACY_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 class Progress:
     """Класс для управления прогрессом игры (текущий уровень и рекорд).
 
-    Сохраняет прогресс в JSON файл и обеспечивает его загрузку при старте.
+    Прогресс читается из JSON файла один раз при создании и дальше
+    хранится в памяти. Сохранение выполняет фоновый поток: несколько
+    изменений подряд объединяются в одну запись (через delay секунд
+    после первого), а файл записывается атомарно - во временный файл,
+    который затем заменяет основной, поэтому сбой во время записи не
+    портит сохранённый прогресс. Несохранённые изменения записываются
+    вызовом flush или close (и при выходе из программы).
+
+    Файл по умолчанию лежит в .cache в корне проекта: эта папка не
+    входит в индекс ресурсов (get_absolute_path), поэтому сохранение
+    прогресса не делает индекс устаревшим. Прогресс из прежнего места
+    (папка модуля) читается один раз, если нового файла ещё нет.
 
     Attributes:
         record (int): Максимальный достигнутый уровень.
         current_lvl (int): Текущий уровень, на котором находится игрок.
         progress_file (str): Полный путь к файлу с сохранённым прогрессом.
+        delay (float): Задержка фоновой записи в секундах.
+        writes (int): Количество записей файла.
     """
 
-    def __init__(self, file_name="progress.json"):
+    def __init__(self, file_name="progress.json", delay=0.5):
         """Инициализирует менеджер прогресса.
 
         Args:
             file_name: Имя файла для сохранения прогресса
             (по умолчанию 'progress.json').
-            Файл создаётся в той же директории, где находится этот модуль."""
+            Относительное имя отсчитывается от папки .cache в корне
+            проекта.
+            delay: Задержка фоновой записи в секундах."""
         self.record = self.current_lvl = 1
         self.progress_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), file_name
+            find_project_root(), ".cache", file_name
         )
+        self._legacy_file = (
+            None
+            if os.path.isabs(file_name)
+            else os.path.join(LEGACY_DIR, file_name)
+        )
+        self.delay = delay
+        self.writes = 0
+        self._pending = False
+        self._closed = False
+        self._writer = None
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
         self.load()
 
     def load(self):
         """Загружает сохранённый прогресс из файла.
         Если проблемы с файлом, создаётся новый с начальными значениями."""
+        path = self.progress_file
+        if (
+            not os.path.exists(path)
+            and self._legacy_file
+            and os.path.exists(self._legacy_file)
+        ):
+            path = self._legacy_file
         try:
-            with open(self.progress_file, "r") as f:
+            with open(path, "r") as f:
                 data = json.load(f)
                 self.record = data.get("record", 1)
                 self.current_lvl = data.get("current", 1)
+            if path != self.progress_file:
+                # перенос в .cache; прежний файл не трогаем
+                self._write(self._snapshot())
         except Exception as e:
             print(f"Ошибка загрузки прогресса: {e}")
-            self.save_progress()
+            self._write(self._snapshot())
 
-    def save_progress(self):
-        """Сохраняет текущий прогресс в файл."""
+    def _snapshot(self):
+        """Возвращает данные прогресса для записи в файл."""
+        return {"record": self.record, "current": self.current_lvl}
+
+    def _write(self, data):
+        """Атомарно записывает данные в файл прогресса."""
+        tmp_file = f"{self.progress_file}.tmp"
         try:
-            with open(self.progress_file, "w", encoding="utf-8") as f:
-                json.dump({"record": self.record,
-                           "current": self.current_lvl}, f)
+            os.makedirs(os.path.dirname(self.progress_file), exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.progress_file)
+            self.writes += 1
         except Exception as e:
             print(f"Ошибка сохранения прогресса: {e}")
 
+    def save_progress(self):
+        """Передаёт сохранение прогресса фоновому потоку записи."""
+        with self._cond:
+            if self._closed:
+                return
+            self._pending = True
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run, name="progress-writer", daemon=True
+                )
+                self._writer.start()
+                atexit.register(self.close)
+            self._cond.notify()
+
+    def _run(self):
+        """Цикл фонового потока: ждёт изменений и записывает их."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # изменения за время задержки попадут в эту же запись
+                deadline = time.monotonic() + self.delay
+                while not self._closed:
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        break
+                    self._cond.wait(left)
+            self.flush()
+
+    def flush(self):
+        """Сразу записывает несохранённые изменения в файл."""
+        with self._io_lock:
+            with self._cond:
+                if not self._pending:
+                    return
+                self._pending = False
+                data = self._snapshot()
+            self._write(data)
+
+    def close(self):
+        """Останавливает фоновую запись и сохраняет изменения."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+
     def new_level(self, win):
         """Обновляет прогресс после завершения уровня (победа или проигрыш).
 
         Args:
             win: True если игрок победил.
         """
-        self.current_lvl = self.current_lvl + 1 if win else 1
-        if self.current_lvl > self.record:
-            self.record = self.current_lvl
+        with self._cond:
+            self.current_lvl = self.current_lvl + 1 if win else 1
+            if self.current_lvl > self.record:
+                self.record = self.current_lvl
         self.save_progress()
 
     def get_level(self):
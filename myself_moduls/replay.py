@@ -0,0 +1,378 @@
+"""
+Запись и воспроизведение партий.
+
+Каждая партия получает зерно раскладки (см. LevelPrefetcher), а
+MemoryGame записывает её в журнал .cache/replays.ndjson одной строкой:
+
+    {"v":1,"seed":123,"level":3,"moves":22,"time":700,
+     "board":"AAEC...","cards":"BQcA...","dt":"kAM...","result":"win"}
+
+board - раскладка (идентификаторы изображений карточек в порядке
+первого появления), cards - индексы перевернутых карточек по порядку,
+dt - интервалы между переворотами в миллисекундах (первый - от начала
+партии). Числа хранятся как varint (LEB128) в base64, поэтому партия
+4x4 занимает пару сотен байт.
+
+Воспроизведение записей журнала на игровом движке с полной скоростью
+(проверка, что партии заканчиваются так же, и скорость движка):
+    python -m myself_moduls.replay [путь к журналу]
+В окне игры в реальном времени (по умолчанию последняя партия):
+    python -m myself_moduls.replay [путь к журналу] --gui [--index N]
+        [--speed X]
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from myself_moduls.game_engine import GameEngine
+from myself_moduls.get_absolute_path import find_project_root
+
+REPLAY_VERSION = 1
+
+
+def default_log_path():
+    """Возвращает путь к журналу (.cache/replays.ndjson в корне)."""
+    return os.path.join(find_project_root(), ".cache", "replays.ndjson")
+
+
+def encode_varints(values):
+    """Кодирует неотрицательные целые числа в строку base64 (LEB128).
+
+    Args:
+        values: Последовательность чисел >= 0.
+
+    Returns:
+        str: Строка base64.
+
+    Raises:
+        ValueError: Если есть отрицательное число.
+    """
+    data = bytearray()
+    for value in values:
+        if value < 0:
+            raise ValueError(f"Отрицательное число в записи: {value}")
+        while value > 0x7F:
+            data.append(value & 0x7F | 0x80)
+            value >>= 7
+        data.append(value)
+    return base64.b64encode(bytes(data)).decode("ascii")
+
+
+def decode_varints(text):
+    """Декодирует строку из encode_varints.
+
+    Returns:
+        list[int]: Числа.
+
+    Raises:
+        ValueError: Если строка повреждена.
+    """
+    values = []
+    value = shift = 0
+    for byte in base64.b64decode(text, validate=True):
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    if shift:
+        raise ValueError("Запись партии обрывается посреди числа")
+    return values
+
+
+def arrange_board(images, board):
+    """Раскладывает изображения уровня по записанной раскладке.
+
+    Нужна, когда у игрока другая библиотека изображений и зерно дало
+    другую раскладку: карточки получают изображения в порядке их первого
+    появления, поэтому пары совпадают с записью.
+
+    Args:
+        images: Изображения карточек уровня.
+        board: Раскладка из записи (Replay.board).
+
+    Returns:
+        list: Изображения карточек в порядке записи.
+
+    Raises:
+        ValueError: Если изображений меньше, чем нужно раскладке.
+    """
+    distinct = list(dict.fromkeys(images))
+    if not board or max(board) >= len(distinct):
+        raise ValueError(
+            f"Для раскладки нужно {max(board, default=-1) + 1} изображений, "
+            f"есть {len(distinct)}"
+        )
+    return [distinct[image_id] for image_id in board]
+
+
+class Replay:
+    """Запись одной партии.
+
+    Attributes:
+        seed (int): Зерно раскладки.
+        level (int): Номер уровня.
+        moves (int): Количество ходов уровня.
+        time (int): Время показа несовпавших карточек в мс.
+        board (list): Идентификаторы изображений карточек.
+        cards (list): Индексы перевернутых карточек по порядку.
+        times (list): Моменты переворотов в мс от начала партии.
+        result (str | None): 'win', 'lose' или None (не доиграна).
+    """
+
+    __slots__ = (
+        "seed",
+        "level",
+        "moves",
+        "time",
+        "board",
+        "cards",
+        "times",
+        "result",
+        "_started",
+    )
+
+    def __init__(
+        self,
+        seed,
+        level,
+        moves,
+        time_show,
+        board,
+        cards=None,
+        times=None,
+        result=None,
+    ):
+        """Создаёт запись; отсчёт времени начинается сейчас.
+
+        Args:
+            seed: Зерно раскладки.
+            level: Номер уровня.
+            moves: Количество ходов уровня.
+            time_show: Время показа несовпавших карточек в мс.
+            board: Идентификаторы изображений карточек.
+            cards: Индексы перевернутых карточек.
+            times: Моменты переворотов в мс от начала партии.
+            result: Итог партии.
+        """
+        self.seed = seed
+        self.level = level
+        self.moves = moves
+        self.time = time_show
+        self.board = list(board)
+        self.cards = cards if cards is not None else []
+        self.times = times if times is not None else []
+        self.result = result
+        self._started = time.perf_counter()
+
+    def __len__(self):
+        """Возвращает количество переворотов."""
+        return len(self.cards)
+
+    def press(self, index_card):
+        """Записывает переворот карточки."""
+        self.cards.append(index_card)
+        self.times.append(int((time.perf_counter() - self._started) * 1000))
+
+    def to_line(self):
+        """Возвращает запись строкой журнала (без перевода строки)."""
+        deltas = [
+            later - earlier
+            for earlier, later in zip([0] + self.times, self.times)
+        ]
+        return json.dumps(
+            {
+                "v": REPLAY_VERSION,
+                "seed": self.seed,
+                "level": self.level,
+                "moves": self.moves,
+                "time": self.time,
+                "board": encode_varints(self.board),
+                "cards": encode_varints(self.cards),
+                "dt": encode_varints(deltas),
+                "result": self.result,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_line(cls, line):
+        """Создаёт запись из строки журнала.
+
+        Raises:
+            ValueError: Если строка повреждена или другой версии.
+        """
+        try:
+            data = json.loads(line)
+            if data.get("v") != REPLAY_VERSION:
+                raise ValueError(f"версия {data.get('v')}")
+            times = []
+            moment = 0
+            for delta in decode_varints(data["dt"]):
+                moment += delta
+                times.append(moment)
+            replay = cls(
+                data["seed"],
+                data["level"],
+                data["moves"],
+                data["time"],
+                decode_varints(data["board"]),
+                decode_varints(data["cards"]),
+                times,
+                data.get("result"),
+            )
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            raise ValueError(f"Повреждённая запись партии: {e}")
+        if len(replay.cards) != len(replay.times):
+            raise ValueError("Повреждённая запись партии: разная длина")
+        return replay
+
+
+class ReplayLog:
+    """Журнал записей партий с записью в фоновом потоке.
+
+    Attributes:
+        path (str): Путь к журналу NDJSON.
+    """
+
+    def __init__(self, path=None):
+        """Создаёт журнал; файл открывается при первой записи.
+
+        Args:
+            path: Путь к журналу (по умолчанию default_log_path()).
+        """
+        self.path = path or default_log_path()
+        self._executor = None
+
+    def append(self, replay):
+        """Передаёт запись фоновому потоку записи."""
+        line = replay.to_line() + "\n"
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="replays"
+            )
+        self._executor.submit(self._write, line)
+
+    def _write(self, line):
+        """Дописывает строку в журнал (в фоновом потоке)."""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except Exception as e:
+            print(f"Ошибка записи партии: {e}")
+
+    def close(self):
+        """Дожидается записи всех переданных партий."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def read_replays(path):
+    """Читает записи партий из журнала, пропуская повреждённые строки.
+
+    Args:
+        path: Путь к журналу.
+
+    Returns:
+        list[Replay]: Записи.
+    """
+    replays = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                replays.append(Replay.from_line(line))
+            except ValueError:
+                continue
+    return replays
+
+
+def run_replay(replay, engine=None):
+    """Выполняет запись на игровом движке с полной скоростью.
+
+    Args:
+        replay: Запись партии.
+        engine: GameEngine для повторного использования (необязательно).
+
+    Returns:
+        str | None: Итог партии ('win', 'lose') или None.
+
+    Raises:
+        ValueError: Если в записи есть ход, невозможный на этой доске.
+    """
+    if engine is None:
+        engine = GameEngine()
+    engine.new_board(replay.board, replay.moves)
+    for step, index_card in enumerate(replay.cards):
+        if not engine.turn(index_card):
+            raise ValueError(
+                f"Ход {step}: карточку {index_card} нельзя перевернуть"
+            )
+        if len(engine.turned_cards) == 2:
+            index_1, index_2, match = engine.check_match()
+            engine.apply_match(index_1, index_2, match)
+            if not match:
+                engine.hide_cards(index_1, index_2)
+    return engine.status()
+
+
+def main(argv):
+    """Воспроизводит записи журнала (см. описание модуля)."""
+    # модуль импортируется при запуске игры, а argparse нужен только CLI
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Воспроизведение записанных партий Memory Game"
+    )
+    parser.add_argument("path", nargs="?", default=None)
+    parser.add_argument("--gui", action="store_true")
+    parser.add_argument("--index", type=int, default=-1)
+    parser.add_argument("--speed", type=float, default=1.0)
+    args = parser.parse_args(argv)
+    path = args.path or default_log_path()
+    try:
+        replays = read_replays(path)
+    except OSError as e:
+        print(f"Журнал партий не прочитан: {e}")
+        return 1
+    if not replays:
+        print(f"В журнале {path} нет партий")
+        return 1
+
+    if args.gui:
+        from myself_moduls.autoplay import play_replay
+
+        return play_replay(replays[args.index], args.speed)
+
+    engine = GameEngine()
+    diverged = presses = 0
+    start = time.perf_counter()
+    for number, replay in enumerate(replays):
+        try:
+            result = run_replay(replay, engine)
+        except ValueError as e:
+            result = f"ошибка ({e})"
+        presses += len(replay)
+        if result != replay.result:
+            diverged += 1
+            print(
+                f"Партия {number} (уровень {replay.level}, зерно "
+                f"{replay.seed}): записано {replay.result}, получено {result}"
+            )
+    elapsed = time.perf_counter() - start
+    print(
+        f"Партий: {len(replays)}, расхождений: {diverged}, "
+        f"переворотов: {presses}, "
+        f"{presses / elapsed if elapsed else 0:,.0f} переворотов/с"
+    )
+    return 1 if diverged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,325 @@
+"""
+Атласы изображений карточек.
+
+Папка с изображениями упаковывается в одно большое изображение
+(atlas.png) и таблицу смещений (atlas.json). Атлас читается с диска
+один раз, а отдельные карточки вырезаются из него по прямоугольнику,
+поэтому уровень из сотен карточек не открывает сотни файлов.
+
+Атлас пересобирается автоматически, если в исходной папке изменился
+состав файлов, их размер или время изменения.
+
+Сборка атласов заранее:
+    python -m myself_moduls.sprite_atlas resources/img/images_1 ...
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+
+from myself_moduls.get_absolute_path import find_project_root
+
+ATLAS_VERSION = 1
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+def default_cache_dir():
+    """Возвращает папку для атласов (.cache/atlases в корне проекта)."""
+    return os.path.join(find_project_root(), ".cache", "atlases")
+
+
+def atlas_dir_for(folder, cache_dir=None):
+    """Возвращает папку атласа для исходной папки изображений.
+
+    Args:
+        folder: Папка с изображениями.
+        cache_dir: Общая папка атласов (по умолчанию default_cache_dir()).
+    """
+    folder = os.path.abspath(folder)
+    digest = hashlib.sha1(folder.encode("utf-8")).hexdigest()[:10]
+    return os.path.join(
+        cache_dir or default_cache_dir(),
+        f"{os.path.basename(folder)}-{digest}",
+    )
+
+
+def folder_signature(folder):
+    """Возвращает подпись содержимого папки изображений.
+
+    Args:
+        folder: Папка с изображениями.
+
+    Returns:
+        list: Отсортированный список [имя, размер, st_mtime_ns]
+        для каждого изображения в папке.
+    """
+    signature = []
+    for entry in os.scandir(folder):
+        if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS):
+            stat = entry.stat()
+            signature.append([entry.name, stat.st_size, stat.st_mtime_ns])
+    signature.sort()
+    return signature
+
+
+def pack_shelves(sizes, max_width=4096):
+    """Раскладывает прямоугольники по полкам (shelf packing).
+
+    Прямоугольники ставятся в ряд слева направо, пока помещаются
+    по ширине, затем начинается новая полка. Высота полки равна
+    самому высокому прямоугольнику в ней.
+
+    Args:
+        sizes: Список размеров (ширина, высота).
+        max_width: Максимальная ширина атласа.
+
+    Returns:
+        tuple: (positions, width, height), где positions - список (x, y)
+        в порядке sizes, width и height - размер атласа.
+
+    Raises:
+        ValueError: Если прямоугольник шире max_width.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if w > max_width:
+            raise ValueError(
+                f"Изображение шириной {w} не помещается в атлас {max_width}"
+            )
+        if x + w > max_width:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += w
+        width = max(width, x)
+        shelf_height = max(shelf_height, h)
+    return positions, width, y + shelf_height
+
+
+def read_manifest(atlas_dir):
+    """Читает таблицу атласа или возвращает None, если её нет."""
+    try:
+        manifest_path = os.path.join(atlas_dir, "atlas.json")
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_atlas_fresh(folder, atlas_dir):
+    """Проверяет, что атлас собран из текущего содержимого папки.
+
+    Args:
+        folder: Папка с изображениями.
+        atlas_dir: Папка атласа.
+    """
+    manifest = read_manifest(atlas_dir)
+    return (
+        manifest is not None
+        and manifest.get("version") == ATLAS_VERSION
+        and manifest.get("source") == folder_signature(folder)
+        and os.path.exists(os.path.join(atlas_dir, manifest["image"]))
+    )
+
+
+def build_atlas(folder, atlas_dir, max_cell=256, max_width=4096):
+    """Собирает атлас из папки изображений.
+
+    Изображения больше max_cell уменьшаются с сохранением пропорций.
+
+    Args:
+        folder: Папка с изображениями.
+        atlas_dir: Куда сохранить atlas.png и atlas.json.
+        max_cell: Максимальная сторона изображения в атласе.
+        max_width: Максимальная ширина атласа.
+
+    Returns:
+        dict: Таблица атласа (содержимое atlas.json).
+
+    Raises:
+        FileNotFoundError: Если в папке нет изображений.
+    """
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QImage, QPainter
+
+    signature = folder_signature(folder)
+    images = []
+    for name, _, _ in signature:
+        image = QImage(os.path.join(folder, name))
+        if image.isNull():
+            print(f"Не удалось прочитать изображение для атласа: {name}")
+            continue
+        if image.width() > max_cell or image.height() > max_cell:
+            image = image.scaled(
+                max_cell, max_cell, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        images.append((name, image))
+    if not images:
+        raise FileNotFoundError(f"Нет изображений для атласа в: {folder}")
+
+    positions, width, height = pack_shelves(
+        [(image.width(), image.height()) for _, image in images], max_width
+    )
+    atlas = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    atlas.fill(Qt.transparent)
+    painter = QPainter(atlas)
+    sprites = {}
+    for (name, image), (x, y) in zip(images, positions):
+        painter.drawImage(x, y, image)
+        w, h = image.width(), image.height()
+        sprites[name] = {
+            "rect": [x, y, w, h],
+            "uv": [x / width, y / height, (x + w) / width, (y + h) / height],
+        }
+    painter.end()
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    manifest = {
+        "version": ATLAS_VERSION,
+        "source": signature,
+        "image": "atlas.png",
+        "size": [width, height],
+        "sprites": sprites,
+    }
+    if not atlas.save(os.path.join(atlas_dir, "atlas.png"), "PNG"):
+        raise OSError(f"Не удалось сохранить атлас в: {atlas_dir}")
+    manifest_path = os.path.join(atlas_dir, "atlas.json")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return manifest
+
+
+def ensure_atlas(folder, cache_dir=None, **build_options):
+    """Возвращает атлас папки, пересобирая его при изменениях.
+
+    Args:
+        folder: Папка с изображениями.
+        cache_dir: Общая папка атласов.
+        **build_options: Параметры build_atlas (max_cell, max_width).
+
+    Returns:
+        SpriteAtlas: Загруженный атлас.
+    """
+    atlas_dir = atlas_dir_for(folder, cache_dir)
+    if not is_atlas_fresh(folder, atlas_dir):
+        build_atlas(folder, atlas_dir, **build_options)
+    return SpriteAtlas(atlas_dir)
+
+
+class SpriteAtlas:
+    """Загруженный атлас: одно изображение и таблица прямоугольников.
+
+    Attributes:
+        manifest (dict): Таблица атласа (atlas.json).
+        image (QImage): Изображение атласа.
+    """
+
+    def __init__(self, atlas_dir):
+        """Читает атлас с диска (один файл изображения).
+
+        Args:
+            atlas_dir: Папка с atlas.png и atlas.json.
+
+        Raises:
+            FileNotFoundError: Если атлас не найден.
+        """
+        from PyQt5.QtGui import QImage
+
+        self.manifest = read_manifest(atlas_dir)
+        if self.manifest is None:
+            raise FileNotFoundError(f"Атлас не найден: {atlas_dir}")
+        self.image = QImage(os.path.join(atlas_dir, self.manifest["image"]))
+        if self.image.isNull():
+            raise FileNotFoundError(
+                f"Изображение атласа не найдено: {atlas_dir}"
+            )
+
+    def names(self):
+        """Возвращает имена изображений в атласе."""
+        return list(self.manifest["sprites"])
+
+    def sprite(self, name):
+        """Вырезает изображение из атласа по его прямоугольнику.
+
+        Args:
+            name: Имя исходного файла изображения.
+
+        Returns:
+            QImage | None: Изображение или None, если его нет в атласе.
+        """
+        from PyQt5.QtCore import QRect
+
+        sprite = self.manifest["sprites"].get(name)
+        if sprite is None:
+            return None
+        return self.image.copy(QRect(*sprite["rect"]))
+
+
+class AtlasRegistry:
+    """Атласы папок изображений, загружаемые по первому обращению.
+
+    Потокобезопасен: может использоваться из фоновой подготовки уровней.
+    """
+
+    def __init__(self, cache_dir=None, **build_options):
+        """Создаёт пустой реестр.
+
+        Args:
+            cache_dir: Общая папка атласов.
+            **build_options: Параметры build_atlas (max_cell, max_width).
+        """
+        self.cache_dir = cache_dir
+        self.build_options = build_options
+        self._atlases = {}
+        self._lock = threading.Lock()
+
+    def atlas(self, folder):
+        """Возвращает атлас папки (или None, если его не собрать)."""
+        folder = os.path.abspath(folder)
+        with self._lock:
+            if folder not in self._atlases:
+                try:
+                    self._atlases[folder] = ensure_atlas(
+                        folder, self.cache_dir, **self.build_options
+                    )
+                except Exception as e:
+                    print(f"Атлас не собран для {folder}: {e}")
+                    self._atlases[folder] = None
+            return self._atlases[folder]
+
+    def sprite(self, path):
+        """Возвращает изображение по пути исходного файла из атласа.
+
+        Args:
+            path: Путь к исходному изображению.
+
+        Returns:
+            QImage | None: Изображение или None, если атласа нет.
+        """
+        folder, name = os.path.split(path)
+        atlas = self.atlas(folder)
+        return atlas.sprite(name) if atlas else None
+
+
+def main(folders):
+    """Собирает (или обновляет) атласы для указанных папок."""
+    for folder in folders:
+        atlas_dir = atlas_dir_for(folder)
+        if is_atlas_fresh(folder, atlas_dir):
+            print(f"{folder}: атлас актуален")
+            continue
+        manifest = build_atlas(folder, atlas_dir)
+        width, height = manifest["size"]
+        print(
+            f"{folder}: {len(manifest['sprites'])} изображений, "
+            f"{width}x{height} -> {atlas_dir}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
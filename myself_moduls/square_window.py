@@ -1,17 +1,106 @@
-from PyQt5.QtCore import QSize
+from PyQt5.QtCore import QEvent, QObject, QSize, QTimer
 from PyQt5.QtWidgets import QWidget, QPushButton
 
+# Шаг размера иконок карточек: размеры округляются вниз до кратного,
+# поэтому при изменении окна на несколько пикселей иконки (и кеш
+# отмасштабированных изображений) не пересоздаются
+ICON_BUCKET = 16
+# Интервал объединения событий изменения размера (один кадр 60 Гц)
+FRAME_MS = 16
+
+
+def snap_icon_size(size, bucket=ICON_BUCKET):
+    """Округляет размер иконки вниз до кратного bucket.
+
+    Args:
+        size: Размер в пикселях.
+        bucket: Шаг округления (0 или None - без округления).
+
+    Returns:
+        int: Округлённый размер (не меньше bucket).
+    """
+    if not bucket:
+        return size
+    return max(bucket, size // bucket * bucket)
+
+
+class SquareResizer(QObject):
+    """Поддерживает квадратную форму окна и размер иконок карточек.
+
+    События изменения размера окна не обрабатываются сразу: первое из
+    них запускает таймер на один кадр, и за кадр выполняется не больше
+    одной перестройки (квадратная форма окна, затем размер иконок),
+    сколько бы событий ни пришло при перетаскивании угла окна.
+
+    Attributes:
+        window (QWidget): Окно, которое поддерживается квадратным.
+        cards (list): Кнопки, у которых обновляется размер иконок.
+        relayouts (int): Количество выполненных перестроек.
+    """
+
+    def __init__(self, window, cards=None):
+        """Устанавливает фильтр событий на окно.
+
+        Args:
+            window: Окно (QWidget).
+            cards: Список кнопок-карточек или None.
+        """
+        super().__init__(window)
+        self.window = window
+        self.cards = cards
+        self.relayouts = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FRAME_MS)
+        self._timer.timeout.connect(self.relayout)
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Откладывает перестройку до следующего кадра."""
+        if obj is self.window and event.type() == QEvent.Resize:
+            self.schedule()
+        return False
+
+    def schedule(self):
+        """Запрашивает перестройку (не чаще одной за кадр)."""
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def relayout(self):
+        """Делает окно квадратным, а затем обновляет размер иконок.
+
+        Если размер окна пришлось изменить, иконки обновятся на
+        следующем кадре, когда раскладка карточек уже пересчитана.
+        """
+        try:
+            self.relayouts += 1
+            width, height = self.window.width(), self.window.height()
+            side = min(width, height)
+            if width != height:
+                self.window.resize(side, side)
+                return
+            if self.cards:
+                update_icon_size(self.cards, bucket=ICON_BUCKET)
+        except Exception as e:
+            print(f"Ошибка при изменении размера окна: {e}")
+
 
 def make_window_square(window, cards=None):
     """
     Устанавливает обработчик события изменения размера, который поддерживает
     квадратную форму окна. Если нужно обновляет размер иконок на кнопках.
 
+    Обработчик устанавливается один раз: повторный вызов только
+    обновляет список карточек.
+
     Args:
         window: Окно, которое нужно сделать квадратным. Экземпляр QWidget.
         cards: Список кнопок (QPushButton), у которых нужно обновлять
                размер иконок при изменении размера окна, если не None.
 
+    Returns:
+        SquareResizer: Установленный обработчик.
+
     Raises:
         TypeError: Если window не является экземпляром QWidget.
         TypeError: Если cards не None и не список.
@@ -21,31 +110,23 @@ def make_window_square(window, cards=None):
     if cards is not None and not isinstance(cards, list):
         raise TypeError(f"cards должен быть списком, получен {type(cards)}")
 
-    original_resize = window.resizeEvent
-
-    def square_resize(event):
-        """Обработчик события изменения размера окна."""
-        try:
-            size = min(event.size().width(), event.size().height())
-            window.resize(size, size)
-            if cards:
-                update_icon_size(cards)
-        except Exception as e:
-            print(f"Ошибка при изменении размера окна: {e}")
-            event.ignore()
-
-        if original_resize:
-            original_resize(event)
-
-    window.resizeEvent = square_resize
+    resizer = window.findChild(SquareResizer)
+    if resizer is None:
+        resizer = SquareResizer(window, cards)
+    else:
+        resizer.cards = cards
+    resizer.schedule()
+    return resizer
 
 
-def update_icon_size(cards: list, percent=0.8):
+def update_icon_size(cards: list, percent=0.8, bucket=None):
     """Обновляет размер иконок на кнопках в зависимости от их текущего размера.
 
     Args:
         cards: Список кнопок (QPushButton), им нужно обновить размер иконок.
         percent: процент размера иконок относительно кнопки (по умолчанию 80%).
+        bucket: Шаг округления размера иконок (см. snap_icon_size),
+            None - без округления.
 
     Raises:
         TypeError: Если cards не является списком.
@@ -59,10 +140,11 @@ def update_icon_size(cards: list, percent=0.8):
             raise TypeError("Все элементы cards должны быть QPushButton.")
         try:
             img_size = QSize(
-                int(card.size().width() * percent),
-                int(card.size().height() * percent),
+                snap_icon_size(int(card.size().width() * percent), bucket),
+                snap_icon_size(int(card.size().height() * percent), bucket),
             )
-            card.setIconSize(img_size)
+            if card.iconSize() != img_size:
+                card.setIconSize(img_size)
         except Exception as e:
             print(f"Ошибка при обновлении иконки кнопки: {e}")
             continue
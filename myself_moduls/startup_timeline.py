@@ -0,0 +1,170 @@
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupTimeline:
+    """Временная шкала запуска игры.
+
+    Хранит фазы запуска (импорты модулей, загрузка UI, инициализация
+    микшера, загрузка музыки) и отметки (первая отрисовка окна).
+    Время отсчитывается от создания шкалы, то есть от импорта модуля.
+
+    Attributes:
+        origin (float): Момент начала отсчёта (time.perf_counter()).
+        events (list): Список (имя, начало, конец) в секундах от origin,
+            у отметок начало равно концу.
+        enabled (bool): Печатать ли шкалу при первой отрисовке окна.
+    """
+
+    def __init__(self):
+        """Создаёт пустую шкалу с началом отсчёта в текущий момент."""
+        self.origin = time.perf_counter()
+        self.events = []
+        self.enabled = False
+        self._import_finder = None
+
+    def now(self):
+        """Возвращает время в секундах от начала отсчёта."""
+        return time.perf_counter() - self.origin
+
+    @contextmanager
+    def phase(self, name):
+        """Контекстный менеджер, замеряющий фазу запуска.
+
+        Args:
+            name: Название фазы.
+        """
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.events.append((name, start, self.now()))
+
+    @contextmanager
+    def import_phase(self, module):
+        """Замеряет импорт модуля как фазу "import <module>".
+
+        Если импорт модуля уже замеряет track_imports, фаза не
+        записывается, чтобы импорт не попал в шкалу дважды.
+
+        Args:
+            module: Имя импортируемого модуля.
+        """
+        finder = self._import_finder
+        if finder is not None and module.startswith(finder.prefixes):
+            yield
+        else:
+            with self.phase(f"import {module}"):
+                yield
+
+    def mark(self, name):
+        """Добавляет отметку времени (фазу нулевой длительности).
+
+        Args:
+            name: Название отметки.
+        """
+        moment = self.now()
+        self.events.append((name, moment, moment))
+
+    def get(self, name):
+        """Возвращает первое событие с указанным именем или None."""
+        for event in self.events:
+            if event[0] == name:
+                return event
+        return None
+
+    def track_imports(
+        self,
+        prefixes=("PyQt5", "pygame", "myself_moduls", "memory_game"),
+    ):
+        """Начинает замерять время импорта модулей с указанными префиксами.
+
+        Время включает вложенные импорты модуля.
+
+        Args:
+            prefixes: Префиксы имён модулей для замера.
+        """
+        if self._import_finder is None:
+            self._import_finder = _TimedImportFinder(self, prefixes)
+            sys.meta_path.insert(0, self._import_finder)
+
+    def stop_tracking_imports(self):
+        """Прекращает замер времени импорта модулей."""
+        if self._import_finder in sys.meta_path:
+            sys.meta_path.remove(self._import_finder)
+        self._import_finder = None
+
+    def report(self):
+        """Возвращает шкалу запуска в виде текста.
+
+        Returns:
+            str: По строке на событие: начало, длительность и имя.
+        """
+        lines = ["Запуск (мс от старта):"]
+        for name, start, end in sorted(self.events, key=lambda e: e[1]):
+            duration = f"{(end - start) * 1000:8.1f} мс" if end > start else ""
+            lines.append(f"{start * 1000:9.1f} {duration:>11}  {name}")
+        return "\n".join(lines)
+
+
+class _TimedImportFinder:
+    """Finder в sys.meta_path, оборачивающий загрузчики модулей в замер."""
+
+    def __init__(self, timeline, prefixes):
+        self.timeline = timeline
+        self.prefixes = tuple(prefixes)
+        self._busy = set()
+
+    def find_spec(self, name, path=None, target=None):
+        """Находит модуль остальными finder'ами и подменяет загрузчик."""
+        if not name.startswith(self.prefixes) or name in self._busy:
+            return None
+        self._busy.add(name)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._busy.discard(name)
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self.timeline, name)
+        return spec
+
+
+class _TimedLoader:
+    """Загрузчик-обёртка, записывающий время импорта модуля в шкалу."""
+
+    def __init__(self, loader, timeline, name):
+        self._loader = loader
+        self._timeline = timeline
+        self._name = name
+        self._start = None
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        """Создаёт модуль (для расширений на C здесь идёт основная работа)."""
+        self._start = self._timeline.now()
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        """Выполняет модуль и записывает длительность импорта."""
+        start = self._start
+        if start is None:
+            start = self._timeline.now()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timeline.events.append(
+                (f"import {self._name}", start, self._timeline.now())
+            )
+
+
+timeline = StartupTimeline()
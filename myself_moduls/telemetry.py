@@ -0,0 +1,324 @@
+"""
+Телеметрия ходов игры.
+
+События (начало уровня, нажатие на карточку, совпадение или промах,
+победа или поражение) записываются в заранее выделенный кольцевой
+буфер из массивов array, поэтому запись события на пути клика не
+создаёт объектов и занимает единицы микросекунд. Буфер пачками
+сбрасывается в фоновом потоке в журнал NDJSON (.cache/telemetry.ndjson),
+по одному событию в строке:
+
+    {"t":1700000000.5,"e":"press","l":3,"a":5,"m":17,"us":84.1}
+
+где t - время, e - тип события, l - уровень, a и b - индексы карточек
+(для события level - строки и столбцы поля), m - оставшиеся ходы,
+us - задержка от нажатия до первой отрисовки после него в микросекундах
+(нет у нажатий, после которых отрисовка не успела произойти до сброса).
+
+Сводка по журналу (ходы на уровень, серии промахов, перцентили
+задержки):
+    python -m myself_moduls.telemetry [путь к журналу]
+"""
+
+import json
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from myself_moduls.get_absolute_path import find_project_root
+
+LEVEL, PRESS, MATCH, MISMATCH, WIN, LOSE = range(6)
+KINDS = ("level", "press", "match", "mismatch", "win", "lose")
+
+
+def default_log_path():
+    """Возвращает путь к журналу (.cache/telemetry.ndjson в корне)."""
+    return os.path.join(find_project_root(), ".cache", "telemetry.ndjson")
+
+
+class Telemetry:
+    """Кольцевой буфер событий игры с пакетной записью в журнал.
+
+    Если события не успели сброситься до заполнения буфера, самые
+    старые перезаписываются и учитываются в dropped.
+
+    Attributes:
+        path (str): Путь к журналу NDJSON.
+        capacity (int): Размер кольцевого буфера (событий).
+        batch (int): Сколько событий накопить до автоматического сброса.
+        dropped (int): Количество перезаписанных несброшенных событий.
+    """
+
+    def __init__(self, path=None, capacity=4096, batch=512):
+        """Выделяет буфер; журнал открывается при первом сбросе.
+
+        Args:
+            path: Путь к журналу (по умолчанию default_log_path()).
+            capacity: Размер кольцевого буфера.
+            batch: Размер пачки событий для сброса.
+        """
+        self.path = path or default_log_path()
+        self.capacity = capacity
+        self.batch = min(batch, capacity)
+        self.dropped = 0
+        self._time = array("d", bytes(8 * capacity))
+        self._latency = array("d", bytes(8 * capacity))
+        self._kind = array("b", bytes(capacity))
+        self._level = array("l", bytes(array("l").itemsize * capacity))
+        self._first = array("l", self._level)
+        self._second = array("l", self._level)
+        self._moves = array("l", self._level)
+        self._head = 0
+        self._flushed = 0
+        self._executor = None
+
+    def __len__(self):
+        """Возвращает количество ещё не сброшенных событий."""
+        return min(self._head - self._flushed, self.capacity)
+
+    def record(
+        self, kind, level, first=-1, second=-1, moves=0, latency=None
+    ):
+        """Записывает событие в буфер.
+
+        Args:
+            kind: Тип события (LEVEL, PRESS, MATCH, MISMATCH, WIN, LOSE).
+            level: Номер уровня.
+            first: Индекс первой карточки (-1, если нет).
+            second: Индекс второй карточки (-1, если нет).
+            moves: Оставшееся количество ходов.
+            latency: Задержка нажатие - отрисовка в секундах (None -
+                не измерена, её можно указать позже через set_latency).
+
+        Returns:
+            int: Номер события для set_latency.
+        """
+        i = self._head % self.capacity
+        self._time[i] = time.time()
+        self._kind[i] = kind
+        self._level[i] = level
+        self._first[i] = first
+        self._second[i] = second
+        self._moves[i] = moves
+        self._latency[i] = -1.0 if latency is None else latency
+        self._head += 1
+        if self._head - self._flushed >= self.batch:
+            self.flush()
+        return self._head - 1
+
+    def set_latency(self, number, latency):
+        """Указывает задержку события, ещё не сброшенного в журнал.
+
+        Args:
+            number: Номер события (результат record).
+            latency: Задержка в секундах.
+
+        Returns:
+            bool: False, если событие уже сброшено или перезаписано.
+        """
+        if number < max(self._flushed, self._head - self.capacity):
+            return False
+        self._latency[number % self.capacity] = latency
+        return True
+
+    def _take(self):
+        """Копирует несброшенные события из буфера (срезами массивов).
+
+        Returns:
+            tuple: Столбцы (time, kind, level, first, second, moves,
+            latency) в порядке записи.
+        """
+        start = max(self._flushed, self._head - self.capacity)
+        self.dropped += start - self._flushed
+        count = self._head - start
+        self._flushed = self._head
+        begin = start % self.capacity
+        end = begin + count
+        columns = (
+            self._time,
+            self._kind,
+            self._level,
+            self._first,
+            self._second,
+            self._moves,
+            self._latency,
+        )
+        if end <= self.capacity:
+            return tuple(column[begin:end] for column in columns)
+        end -= self.capacity
+        return tuple(column[begin:] + column[:end] for column in columns)
+
+    @staticmethod
+    def _events(columns):
+        """Превращает столбцы событий в словари формата журнала."""
+        events = []
+        for t, kind, level, first, second, moves, latency in zip(*columns):
+            event = {"t": round(t, 4), "e": KINDS[kind], "l": level}
+            if first >= 0:
+                event["a"] = first
+            if second >= 0:
+                event["b"] = second
+            event["m"] = moves
+            if kind == PRESS and latency >= 0:
+                event["us"] = round(latency * 1e6, 1)
+            events.append(event)
+        return events
+
+    def drain(self):
+        """Забирает несброшенные события из буфера.
+
+        Returns:
+            list[dict]: События в порядке записи.
+        """
+        return self._events(self._take())
+
+    def flush(self):
+        """Передаёт несброшенные события фоновому потоку записи.
+
+        В вызывающем потоке выполняется только копирование срезов
+        массивов, события форматируются и пишутся в фоне.
+        """
+        columns = self._take()
+        if not columns[0]:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="telemetry"
+            )
+        self._executor.submit(self._append, columns)
+
+    def _append(self, columns):
+        """Дописывает события в журнал (в фоновом потоке)."""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(
+                    json.dumps(event, separators=(",", ":")) + "\n"
+                    for event in self._events(columns)
+                )
+        except Exception as e:
+            print(f"Ошибка записи телеметрии: {e}")
+
+    def close(self):
+        """Сбрасывает оставшиеся события и дожидается записи."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def read_log(path):
+    """Читает события из журнала NDJSON, пропуская повреждённые строки.
+
+    Args:
+        path: Путь к журналу.
+
+    Returns:
+        list[dict]: События.
+    """
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    return events
+
+
+def percentile(values, percent):
+    """Возвращает перцентиль отсортированного списка (или 0.0)."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, len(values) * percent // 100)]
+
+
+def summarize(events):
+    """Считает сводку по событиям журнала.
+
+    Args:
+        events: События (словари в формате журнала).
+
+    Returns:
+        dict: levels - список партий {level, board, moves, mismatches,
+        max_streak, result}, max_streak - самая длинная серия промахов,
+        latency_us - {count, p50, p95, p99, max} задержки от нажатия до
+        отрисовки.
+    """
+    games = []
+    game = None
+    streak = max_streak = 0
+    latencies = []
+    for event in events:
+        kind = event.get("e")
+        if kind == "level":
+            game = {
+                "level": event["l"],
+                "board": f"{event.get('a', 0)}x{event.get('b', 0)}",
+                "moves": 0,
+                "mismatches": 0,
+                "max_streak": 0,
+                "result": None,
+            }
+            games.append(game)
+            streak = 0
+        elif kind == "press":
+            if "us" in event:
+                latencies.append(event["us"])
+        elif game is None:
+            continue
+        elif kind in ("match", "mismatch"):
+            game["moves"] += 1
+            if kind == "mismatch":
+                game["mismatches"] += 1
+                streak += 1
+                game["max_streak"] = max(game["max_streak"], streak)
+                max_streak = max(max_streak, streak)
+            else:
+                streak = 0
+        elif kind in ("win", "lose"):
+            game["result"] = kind
+    latencies.sort()
+    return {
+        "levels": games,
+        "max_streak": max_streak,
+        "latency_us": {
+            "count": len(latencies),
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+    }
+
+
+def main(argv):
+    """Печатает сводку по журналу телеметрии."""
+    path = argv[0] if argv else default_log_path()
+    try:
+        summary = summarize(read_log(path))
+    except OSError as e:
+        print(f"Журнал телеметрии не прочитан: {e}")
+        return 1
+    print(f"Партий: {len(summary['levels'])}")
+    for game in summary["levels"]:
+        print(
+            f"  уровень {game['level']:3} ({game['board']}): "
+            f"ходов {game['moves']:4}, промахов {game['mismatches']:4}, "
+            f"серия промахов {game['max_streak']:3}, "
+            f"{game['result'] or 'не завершён'}"
+        )
+    latency = summary["latency_us"]
+    print(f"Самая длинная серия промахов: {summary['max_streak']}")
+    print(
+        f"Задержка до отрисовки ({latency['count']} нажатий): "
+        f"p50 {latency['p50']:.0f} мкс, p95 {latency['p95']:.0f} мкс, "
+        f"p99 {latency['p99']:.0f} мкс, макс. {latency['max']:.0f} мкс"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,131 @@
+import importlib.util
+import os
+
+from myself_moduls.get_absolute_path import find_project_root
+
+_form_classes = {}
+
+
+def default_cache_dir():
+    """Возвращает папку для скомпилированных форм (.cache/ui в корне)."""
+    return os.path.join(find_project_root(), ".cache", "ui")
+
+
+def source_stamp(ui_path):
+    """Возвращает отметку версии .ui файла: st_mtime_ns и размер.
+
+    Args:
+        ui_path: Путь к .ui файлу.
+    """
+    stat = os.stat(ui_path)
+    return f"{stat.st_mtime_ns} {stat.st_size}"
+
+
+def compiled_path(ui_path, cache_dir=None):
+    """Возвращает путь к скомпилированной форме для .ui файла.
+
+    Args:
+        ui_path: Путь к .ui файлу.
+        cache_dir: Папка скомпилированных форм.
+    """
+    name = os.path.splitext(os.path.basename(ui_path))[0]
+    return os.path.join(cache_dir or default_cache_dir(), f"{name}_ui.py")
+
+
+def is_compiled_fresh(ui_path, py_path):
+    """Проверяет, что форма скомпилирована из текущей версии .ui файла.
+
+    Первая строка скомпилированного модуля хранит отметку версии
+    (source_stamp) исходного .ui файла.
+
+    Args:
+        ui_path: Путь к .ui файлу.
+        py_path: Путь к скомпилированному модулю.
+    """
+    try:
+        with open(py_path, encoding="utf-8") as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return False
+    return first_line == f"# source: {source_stamp(ui_path)}"
+
+
+def compile_ui(ui_path, py_path):
+    """Компилирует .ui файл в модуль Python (pyuic5).
+
+    Запись атомарная: модуль сначала пишется во временный файл.
+
+    Args:
+        ui_path: Путь к .ui файлу.
+        py_path: Путь к скомпилированному модулю.
+    """
+    from PyQt5 import uic
+
+    os.makedirs(os.path.dirname(py_path), exist_ok=True)
+    tmp_path = f"{py_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(f"# source: {source_stamp(ui_path)}\n")
+        uic.compileUi(ui_path, f)
+    os.replace(tmp_path, py_path)
+
+
+def load_form_class(ui_path, cache_dir=None):
+    """Возвращает класс формы Ui_* для .ui файла.
+
+    Форма компилируется, если её нет или .ui файл изменился, и
+    импортируется один раз за время работы программы.
+
+    Args:
+        ui_path: Путь к .ui файлу.
+        cache_dir: Папка скомпилированных форм.
+
+    Returns:
+        type: Класс формы с методом setupUi(widget).
+    """
+    py_path = compiled_path(ui_path, cache_dir)
+    stamp = source_stamp(ui_path)
+    cached = _form_classes.get(ui_path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    if not is_compiled_fresh(ui_path, py_path):
+        compile_ui(ui_path, py_path)
+    module_name = f"_compiled_{os.path.basename(py_path)[:-3]}"
+    spec = importlib.util.spec_from_file_location(module_name, py_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    form_class = next(
+        value
+        for name, value in vars(module).items()
+        if name.startswith("Ui_") and isinstance(value, type)
+    )
+    _form_classes[ui_path] = (stamp, form_class)
+    return form_class
+
+
+def setup_ui(widget, ui_path, compiled=True):
+    """Строит интерфейс из .ui файла на виджете, как uic.loadUi.
+
+    По умолчанию используется скомпилированная форма, а все именованные
+    виджеты формы становятся атрибутами widget. Пользовательские .ui
+    файлы (compiled=False) и ошибки компиляции обрабатываются через
+    uic.loadUi.
+
+    Args:
+        widget: Виджет, на котором строится интерфейс.
+        ui_path: Путь к .ui файлу.
+        compiled: False, чтобы разобрать .ui файл во время выполнения.
+    """
+    if compiled:
+        try:
+            form = load_form_class(ui_path)()
+        except Exception as e:
+            print(f"Не удалось скомпилировать {ui_path}: {e}")
+        else:
+            form.setupUi(widget)
+            for name, value in vars(form).items():
+                setattr(widget, name, value)
+            return
+    from PyQt5 import uic
+
+    uic.loadUi(ui_path, widget)
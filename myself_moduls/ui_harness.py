@@ -0,0 +1,330 @@
+"""
+Сквозные прогоны настоящего окна MemoryGame на offscreen-платформе Qt.
+
+UIHarness создаёт окно игры (прогресс и записи партий во временной
+папке, звук - беззвучное устройство null_audio) и нажимает карточки
+card_N настоящими кликами мыши (QTest), поэтому выполняется весь путь
+press_card → flip_card → QTimer → hide_cards, а диалог результата
+закрывается кликом по кнопке «играть». Замеряются:
+- задержка цикла событий: сколько ждёт таймер 0 мс, запущенный сразу
+  после клика (сколько цикл занят работой, вызванной кликом);
+- задержка от клика до первой отрисовки и количество отрисовок;
+- время создания окна и прохождения уровня.
+Бюджеты производительности (BUDGETS) проверяет check_budgets.
+
+Запуск (печатает замеры и нарушенные бюджеты, код выхода 1 при
+нарушении):
+    python -m myself_moduls.ui_harness [--levels N] [--time-show МС]
+        [--sound]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from PyQt5.QtCore import QEvent, QObject, Qt, QTimer  # noqa: E402
+from PyQt5.QtTest import QTest  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QPushButton  # noqa: E402
+
+from myself_moduls import audio_engine, null_audio  # noqa: E402
+from myself_moduls.bots import MemoryBot  # noqa: E402
+from myself_moduls.dialogs import GameResultDialog  # noqa: E402
+from myself_moduls.records import Progress  # noqa: E402
+from myself_moduls.replay import ReplayLog  # noqa: E402
+from myself_moduls.telemetry import Telemetry  # noqa: E402
+
+# Бюджеты производительности (миллисекунды и секунды)
+BUDGETS = {
+    "boot_ms": 3000.0,
+    "loop_p95_ms": 50.0,
+    "paint_p95_ms": 100.0,
+    "level_max_s": 10.0,
+}
+
+
+def percentile(values, percent):
+    """Возвращает перцентиль списка (None для пустого списка)."""
+    if not values:
+        return None
+    values = sorted(values)
+    return values[(len(values) - 1) * percent // 100]
+
+
+class EventProbe(QObject):
+    """Фильтр событий приложения: отрисовки и показ диалога результата.
+
+    Диалог результата закрывается кликом по кнопке «играть» сразу
+    после показа, как это сделал бы игрок.
+
+    Attributes:
+        paints (int): Количество отрисовок виджетов.
+        first_paint_at (float | None): Момент первой отрисовки после
+            mark().
+        result (bool | None): Итог уровня из последнего диалога
+            (None - диалога не было после mark_level()).
+        result_at (float | None): Момент показа диалога.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paints = 0
+        self.first_paint_at = None
+        self.result = self.result_at = None
+
+    def mark(self):
+        """Начинает ожидание первой отрисовки."""
+        self.first_paint_at = None
+
+    def mark_level(self):
+        """Начинает ожидание диалога результата."""
+        self.result = self.result_at = None
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if kind == QEvent.Paint:
+            self.paints += 1
+            if self.first_paint_at is None:
+                self.first_paint_at = time.perf_counter()
+        elif kind == QEvent.Show and isinstance(obj, GameResultDialog):
+            self.result_at = time.perf_counter()
+            self.result = obj.win
+            QTimer.singleShot(
+                0, lambda: QTest.mouseClick(obj.btn_play, Qt.LeftButton)
+            )
+        return False
+
+
+class UIHarness:
+    """Окно MemoryGame под управлением кликов с замерами.
+
+    Attributes:
+        app (QApplication): Приложение Qt.
+        game (MemoryGame): Окно игры.
+        time_show (int | None): Время показа несовпавших карточек в мс
+            вместо времени уровня (None - как в уровне).
+        boot_ms (float): Время создания и показа окна.
+        loop_ms (list): Задержки цикла событий после кликов.
+        paint_ms (list): Задержки от клика до первой отрисовки.
+        levels (list): Кортежи (итог, секунды, клики, отрисовки) по
+            пройденным уровням.
+    """
+
+    def __init__(self, null_sound=True, time_show=0):
+        """Создаёт и показывает окно игры.
+
+        Args:
+            null_sound: True - беззвучное устройство вместо pygame.
+            time_show: Время показа несовпавших карточек в мс
+                (None - как в уровне).
+        """
+        from memory_game import MemoryGame
+
+        self._previous_audio = None
+        self._null_sound = null_sound
+        if null_sound:
+            self._previous_audio = null_audio.install()
+        self.app = QApplication.instance() or QApplication([])
+        self._folder = tempfile.TemporaryDirectory()
+        self.probe = EventProbe()
+        self.app.installEventFilter(self.probe)
+        self.time_show = time_show
+        self.loop_ms = []
+        self.paint_ms = []
+        self.levels = []
+
+        started = time.perf_counter()
+        self.game = MemoryGame(
+            progress=Progress(
+                file_name=os.path.join(self._folder.name, "progress.json"),
+                delay=0,
+            ),
+            replays=ReplayLog(
+                os.path.join(self._folder.name, "replays.ndjson")
+            ),
+            telemetry=Telemetry(
+                os.path.join(self._folder.name, "telemetry.ndjson")
+            ),
+        )
+        self.game.show()
+        self.wait(lambda: self.probe.paints > 0)
+        self.boot_ms = (time.perf_counter() - started) * 1000
+
+    def wait(self, condition, timeout=5.0):
+        """Обрабатывает события, пока condition() не станет истинным.
+
+        Raises:
+            TimeoutError: Если условие не выполнилось за timeout секунд.
+        """
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"Условие не выполнено за {timeout} с")
+            self.app.processEvents()
+
+    def card_widget(self, index_card):
+        """Возвращает кнопку карточки card_<строка>_<столбец> по индексу."""
+        cols = self.game.board_size[1]
+        row, col = divmod(index_card, cols)
+        card = self.game.findChild(QPushButton, f"card_{row + 1}_{col + 1}")
+        if card is None:
+            raise IndexError(f"Карточка {index_card} не найдена")
+        return card
+
+    def click(self, index_card):
+        """Кликает карточку мышью и замеряет задержки.
+
+        Если клик завершил уровень, задержки не записываются: в них
+        входит показ диалога результата.
+
+        Args:
+            index_card: Индекс карточки.
+        """
+        card = self.card_widget(index_card)
+        fired = []
+        self.probe.mark()
+        clicked_at = time.perf_counter()
+        QTest.mouseClick(card, Qt.LeftButton)
+        QTimer.singleShot(0, lambda: fired.append(time.perf_counter()))
+        self.wait(lambda: fired and self.probe.first_paint_at is not None)
+        if self.probe.result is None:
+            self.loop_ms.append((fired[0] - clicked_at) * 1000)
+            self.paint_ms.append(
+                (self.probe.first_paint_at - clicked_at) * 1000
+            )
+
+    def play_level(self, bot=None, timeout=30.0):
+        """Проходит текущий уровень кликами по карточкам.
+
+        Args:
+            bot: Бот, выбирающий карточки (по умолчанию с идеальной
+                памятью).
+            timeout: Максимальное время уровня в секундах.
+
+        Returns:
+            tuple: (итог, секунды, клики, отрисовки); итог True - победа.
+
+        Raises:
+            TimeoutError: Если уровень не закончился за timeout секунд.
+        """
+        bot = bot or MemoryBot()
+        bot.reset()
+        game = self.game
+        if self.time_show is not None:
+            game.time_show = self.time_show
+        engine = game.engine
+        self.probe.mark_level()
+        paints = self.probe.paints
+        clicks = 0
+        started = time.perf_counter()
+        while self.probe.result is None:
+            if time.perf_counter() - started > timeout:
+                raise TimeoutError(f"Уровень не пройден за {timeout} с")
+            if engine.is_checking or len(engine.turned_cards) >= 2:
+                # несовпавшие карточки скрываются по таймеру
+                self.wait(lambda: not engine.is_checking)
+                continue
+            index_card = bot.pick(engine)
+            self.click(index_card)
+            clicks += 1
+            bot.observe(index_card, engine.image_ids[index_card])
+        level = (
+            self.probe.result,
+            self.probe.result_at - started,
+            clicks,
+            self.probe.paints - paints,
+        )
+        self.levels.append(level)
+        # следующий уровень начат кликом по кнопке диалога
+        self.wait(lambda: game.engine is not engine)
+        return level
+
+    def stats(self):
+        """Возвращает сводку замеров.
+
+        Returns:
+            dict: boot_ms, clicks, loop_p50_ms, loop_p95_ms, paint_p50_ms,
+            paint_p95_ms, levels, wins, level_mean_s, level_max_s,
+            paints_per_level.
+        """
+        seconds = [level[1] for level in self.levels]
+        return {
+            "boot_ms": self.boot_ms,
+            "clicks": len(self.loop_ms),
+            "loop_p50_ms": percentile(self.loop_ms, 50),
+            "loop_p95_ms": percentile(self.loop_ms, 95),
+            "paint_p50_ms": percentile(self.paint_ms, 50),
+            "paint_p95_ms": percentile(self.paint_ms, 95),
+            "levels": len(self.levels),
+            "wins": sum(bool(level[0]) for level in self.levels),
+            "level_mean_s": (
+                sum(seconds) / len(seconds) if seconds else None
+            ),
+            "level_max_s": max(seconds, default=None),
+            "paints_per_level": (
+                sum(level[3] for level in self.levels) / len(self.levels)
+                if self.levels
+                else None
+            ),
+        }
+
+    def close(self):
+        """Закрывает окно и возвращает прежний аудиодвижок."""
+        self.app.removeEventFilter(self.probe)
+        self.game.close()
+        self.game.deleteLater()
+        self.app.processEvents()
+        self._folder.cleanup()
+        if self._null_sound:
+            audio_engine.set_engine(self._previous_audio)
+
+
+def check_budgets(stats, budgets=None):
+    """Проверяет замеры по бюджетам производительности.
+
+    Args:
+        stats: Сводка UIHarness.stats().
+        budgets: Словарь {замер: предел} (по умолчанию BUDGETS).
+
+    Returns:
+        list[str]: Описания нарушенных бюджетов (пустой - всё в норме).
+    """
+    violations = []
+    for name, limit in (budgets or BUDGETS).items():
+        value = stats.get(name)
+        if value is not None and value > limit:
+            violations.append(f"{name}: {value:.2f} > {limit}")
+    return violations
+
+
+def main(argv):
+    """Проходит несколько уровней и печатает замеры."""
+    parser = argparse.ArgumentParser(
+        description="Сквозной прогон окна Memory Game"
+    )
+    parser.add_argument("--levels", type=int, default=5)
+    parser.add_argument("--time-show", type=int, default=0)
+    parser.add_argument("--sound", action="store_true")
+    args = parser.parse_args(argv)
+
+    harness = UIHarness(null_sound=not args.sound, time_show=args.time_show)
+    try:
+        for _ in range(args.levels):
+            harness.play_level()
+        stats = harness.stats()
+    finally:
+        harness.close()
+    for name, value in stats.items():
+        print(f"{name}: {value if value is not None else '-'}")
+    violations = check_budgets(stats)
+    for violation in violations:
+        print(f"Бюджет нарушен: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
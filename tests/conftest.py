@@ -0,0 +1,15 @@
+"""Общие настройки тестов"""
+
+import pytest
+
+from myself_moduls import image_catalog
+
+
+@pytest.fixture(autouse=True)
+def temp_catalog(tmp_path):
+    """Подменяет общий каталог изображений временным, чтобы тесты
+    не писали в .cache/image_catalog.json проекта."""
+    catalog = image_catalog.ImageCatalog(str(tmp_path / "catalog.json"))
+    previous = image_catalog.set_catalog(catalog)
+    yield catalog
+    image_catalog.set_catalog(previous)
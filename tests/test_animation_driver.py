@@ -0,0 +1,111 @@
+"""Тесты для драйвера анимаций"""
+
+import unittest
+
+from myself_moduls.animation_driver import AnimationDriver
+
+
+class FakeSignal:
+    """Сигнал timeout таймера."""
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+
+class FakeTimer:
+    """Таймер без Qt: кадры вызываются тестом."""
+
+    def __init__(self):
+        self.timeout = FakeSignal()
+        self.active = False
+        self.interval = None
+
+    def setInterval(self, interval):
+        self.interval = interval
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def isActive(self):
+        return self.active
+
+
+class TestAnimationDriver(unittest.TestCase):
+    """Тесты выполнения анимаций от одного таймера."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.timer = FakeTimer()
+        self.driver = AnimationDriver(
+            clock=lambda: self.now, timer=self.timer
+        )
+
+    def test_many_animations_one_timer(self):
+        """Тест 1: Сотни анимаций выполняются одним таймером."""
+        progress = {}
+        done = []
+        for i in range(300):
+            self.driver.start(
+                i, 200, lambda p, i=i: progress.__setitem__(i, p),
+                lambda i=i: done.append(i),
+            )
+
+        self.assertTrue(self.timer.isActive())
+        self.assertEqual(self.timer.timeout.slots, [self.driver.tick])
+        self.now = 0.1
+        self.driver.tick()
+        self.assertEqual(set(progress.values()), {0.5})
+
+        self.now = 0.25
+        self.driver.tick()
+        self.assertEqual(len(done), 300)
+        self.assertEqual(set(progress.values()), {1.0})
+        self.assertFalse(self.timer.isActive())
+
+    def test_restart_finishes_previous(self):
+        """Тест 2: Новая анимация ключа завершает предыдущую."""
+        events = []
+        for name in "ab":
+            self.driver.start(
+                "card", 200, events.append, lambda n=name: events.append(n)
+            )
+
+        self.assertEqual(events, [0.0, 1.0, "a", 0.0])
+        self.assertEqual(len(self.driver), 1)
+
+    def test_finish_all(self):
+        """Тест 3: finish_all сразу выполняет завершение анимаций."""
+        done = []
+        for key in "abc":
+            self.driver.start(
+                key, 1000, lambda p: None, lambda: done.append(key)
+            )
+
+        self.driver.finish_all()
+
+        self.assertEqual(len(done), 3)
+        self.assertEqual(len(self.driver), 0)
+
+    def test_error_does_not_stop_others(self):
+        """Тест 4: Ошибка в одной анимации не прерывает остальные."""
+        done = []
+
+        def broken(progress):
+            raise RuntimeError("сбой")
+
+        self.driver.start("broken", 100, broken)
+        self.driver.start("ok", 100, lambda p: None, lambda: done.append(1))
+        self.now = 1.0
+        self.driver.tick()
+
+        self.assertEqual(done, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
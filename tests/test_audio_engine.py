@@ -0,0 +1,141 @@
+"""Тесты для AudioEngine с подменённым модулем pygame"""
+
+import sys
+import threading
+import types
+import unittest
+from unittest.mock import patch
+
+from myself_moduls import null_audio
+from myself_moduls.audio_engine import AudioEngine, get_engine, set_engine
+from myself_moduls.music_and_sounds_manager import MusicManager, SoundManager
+
+
+class FakeChannel:
+    """Канал-заглушка: занят после play, пока тест не освободит его."""
+
+    def __init__(self, index):
+        self.index = index
+        self.busy = False
+        self.sounds = []
+
+    def get_busy(self):
+        return self.busy
+
+    def play(self, sound):
+        self.busy = True
+        self.sounds.append(sound)
+
+
+def make_fake_pygame():
+    """Создаёт модуль pygame с микшером-заглушкой."""
+    mixer = types.SimpleNamespace(num_channels=8, reserved=0, init_args=None)
+    channels = {}
+
+    def pre_init(*args):
+        mixer.init_args = args
+
+    def set_num_channels(count):
+        mixer.num_channels = count
+
+    def set_reserved(count):
+        mixer.reserved = count
+
+    mixer.pre_init = pre_init
+    mixer.init = lambda: None
+    mixer.get_num_channels = lambda: mixer.num_channels
+    mixer.set_num_channels = set_num_channels
+    mixer.set_reserved = set_reserved
+    mixer.Channel = lambda i: channels.setdefault(i, FakeChannel(i))
+    return types.SimpleNamespace(mixer=mixer)
+
+
+class TestAudioEngine(unittest.TestCase):
+    """Тесты пулов каналов и замера задержки."""
+
+    def setUp(self):
+        self.pygame = make_fake_pygame()
+        patcher = patch.dict(sys.modules, {"pygame": self.pygame})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_mixer_init(self):
+        """Тест 1: Микшер инициализируется с заданным буфером, каналы
+        эффектов резервируются."""
+        engine = AudioEngine(buffer=256, channels={"flip": 2, "win": 1})
+        mixer = engine.mixer()
+
+        self.assertEqual(mixer.init_args, (44100, -16, 2, 256))
+        self.assertEqual(mixer.reserved, 3)
+        with self.assertRaises(RuntimeError):
+            engine.configure(buffer=128)
+
+    def test_voice_stealing(self):
+        """Тест 2: При занятых каналах крадётся самый старый голос
+        того же типа, каналы других эффектов не трогаются."""
+        engine = AudioEngine(channels={"flip": 2, "win": 1})
+        for sound in ("a", "b", "c"):
+            engine.play_effect("flip", sound)
+
+        flip_1, flip_2 = engine._pools["flip"]
+        (win,) = engine._pools["win"]
+        self.assertEqual(flip_1.sounds, ["a", "c"])
+        self.assertEqual(flip_2.sounds, ["b"])
+        self.assertEqual(win.sounds, [])
+        self.assertEqual(engine.stolen, 1)
+
+        flip_2.busy = False
+        engine.play_effect("flip", "d")
+        self.assertEqual(flip_2.sounds, ["b", "d"])
+
+    def test_latency_stats(self):
+        """Тест 3: Задержка включает длительность буфера микшера."""
+        engine = AudioEngine(frequency=44100, buffer=441)
+        self.assertEqual(engine.latency_stats()["count"], 0)
+
+        engine.play_effect("match", "x")
+        stats = engine.latency_stats()
+        self.assertEqual(stats["count"], 1)
+        self.assertAlmostEqual(stats["buffer_ms"], 10.0)
+        self.assertGreaterEqual(stats["p95_ms"], 10.0)
+
+    def test_null_audio(self):
+        """Тест 4: Беззвучное устройство заменяет общий движок, звуки
+        и музыка работают без открытия микшера pygame."""
+        previous = null_audio.install(buffer=256)
+        self.addCleanup(set_engine, previous)
+
+        sounds = SoundManager()
+        self.assertTrue(sounds.wait_loaded(5))
+        sounds.play_param("flip")
+        sounds.play_param("flip")
+        music = MusicManager()
+        self.assertTrue(music.load("music.ogg"))
+        music.play()
+
+        mixer = get_engine().mixer()
+        self.assertEqual(sum(mixer.played.values()), 2)
+        self.assertTrue(mixer.music.get_busy())
+        self.assertEqual(get_engine().buffer, 256)
+        self.assertIsNone(self.pygame.mixer.init_args)
+
+    def test_play_from_threads(self):
+        """Тест 5: Эффекты из нескольких потоков учитываются полностью."""
+        engine = AudioEngine(channels={"flip": 2}, history=1000)
+
+        def play():
+            for _ in range(100):
+                engine.play_effect("flip", "x")
+
+        threads = [threading.Thread(target=play) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(engine.latency_stats()["count"], 400)
+        self.assertEqual(engine.stolen, 398)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Тесты автоигры в настоящем окне MemoryGame (нужен PyQt5)"""
+
+import importlib.util
+import os
+import random
+import tempfile
+import time
+import unittest
+
+HAS_QT = importlib.util.find_spec("PyQt5") is not None
+
+
+@unittest.skipUnless(HAS_QT, "нужен PyQt5")
+class TestAutoPlayer(unittest.TestCase):
+    """Автоигра на offscreen-платформе без звука."""
+
+    def setUp(self):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt5.QtWidgets import QApplication
+
+        from myself_moduls import audio_engine, null_audio
+        from myself_moduls.autoplay import _make_game
+
+        previous = null_audio.install()
+        self.addCleanup(audio_engine.set_engine, previous)
+        self.app = QApplication.instance() or QApplication([])
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.game = _make_game(folder.name)
+        self.addCleanup(self.game.close)
+        self.game.show()
+
+    def test_plays_full_games(self):
+        """Тест 1: Бот доигрывает несколько партий подряд, закрывая
+        модальный диалог результата."""
+        from myself_moduls.autoplay import AutoPlayer
+        from myself_moduls.bots import make_bot
+
+        done = []
+        player = AutoPlayer(
+            self.game,
+            make_bot("perfect", random.Random(3)),
+            games=3,
+            hide_delay=0,
+            on_finished=lambda: done.append(True),
+        )
+        player.start()
+        deadline = time.perf_counter() + 30
+        while not done and time.perf_counter() < deadline:
+            self.app.processEvents()
+        player.stop()
+
+        self.assertTrue(done)
+        self.assertEqual(player.played, 3)
+        self.assertEqual(player.wins, 3)
+        self.assertGreaterEqual(player.presses, 3 * 16)
+        # после двух закрытых кнопкой диалогов начат третий уровень
+        self.assertEqual(self.game.current_lvl, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Тесты для ботов-игроков"""
+
+import random
+import unittest
+
+from myself_moduls.bots import MemoryBot, RandomBot, make_bot, play_engine
+from myself_moduls.game_engine import GameEngine
+
+
+def make_engine(seed, pairs=8, moves=30):
+    """Создаёт перемешанную доску с заданным зерном."""
+    images = [i // 2 for i in range(pairs * 2)]
+    random.Random(seed).shuffle(images)
+    return GameEngine(images, moves=moves)
+
+
+class TestBots(unittest.TestCase):
+    """Тесты стратегий ботов без Qt."""
+
+    def test_perfect_bot_wins(self):
+        """Тест 1: Бот с идеальной памятью выигрывает доску 4x4."""
+        for seed in range(50):
+            bot = MemoryBot(rng=random.Random(seed))
+            self.assertEqual(play_engine(make_engine(seed), bot), "win")
+
+    def test_random_bot_needs_more_moves(self):
+        """Тест 2: Случайный бот тратит больше ходов, чем бот с памятью."""
+        random_left = memory_left = 0
+        for seed in range(20):
+            engine = make_engine(seed, moves=1000)
+            play_engine(engine, RandomBot(random.Random(seed)))
+            random_left += engine.moves_count
+            engine = make_engine(seed, moves=1000)
+            play_engine(engine, MemoryBot(rng=random.Random(seed)))
+            memory_left += engine.moves_count
+        # moves_count - оставшиеся ходы
+        self.assertLess(random_left, memory_left)
+
+    def test_memory_capacity(self):
+        """Тест 3: Бот с ограниченной памятью забывает давние карточки."""
+        bot = MemoryBot(capacity=2)
+        for index_card in range(5):
+            bot.observe(index_card, index_card)
+        self.assertEqual(list(bot._memory), [3, 4])
+        bot.reset()
+        self.assertEqual(len(bot._memory), 0)
+
+    def test_pick_is_valid(self):
+        """Тест 4: Бот выбирает только неоткрытые карточки."""
+        engine = make_engine(1)
+        bot = make_bot("memory:3", random.Random(1))
+        for _ in range(200):
+            if engine.status() is not None:
+                break
+            index_card = bot.pick(engine)
+            self.assertTrue(engine.can_turn(index_card))
+            engine.turn(index_card)
+            bot.observe(index_card, engine.image_ids[index_card])
+            if len(engine.turned_cards) == 2:
+                index_1, index_2, match = engine.check_match()
+                engine.apply_match(index_1, index_2, match)
+                if not match:
+                    engine.hide_cards(index_1, index_2)
+
+    def test_make_bot(self):
+        """Тест 5: Бот создаётся по описанию, неизвестное - ValueError."""
+        self.assertIsInstance(make_bot("random"), RandomBot)
+        self.assertIsNone(make_bot("perfect").capacity)
+        self.assertEqual(make_bot("memory:4").capacity, 4)
+        self.assertEqual(make_bot("memory:4").name, "memory:4")
+        with self.assertRaises(ValueError):
+            make_bot("genius")
+
+
+if __name__ == "__main__":
+    unittest.main()
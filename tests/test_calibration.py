@@ -0,0 +1,100 @@
+"""Тесты для калибровки сложности методом Монте-Карло"""
+
+import importlib.util
+import random
+import unittest
+
+from myself_moduls.bots import make_bot, play_engine
+from myself_moduls.game_engine import GameEngine
+from myself_moduls.level_manager import LevelManager
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+    from myself_moduls import calibration
+
+
+def mean_misses(counts):
+    """Возвращает среднее количество промахов по распределению."""
+    return float((np.arange(len(counts)) * counts).sum() / counts.sum())
+
+
+@unittest.skipUnless(HAS_NUMPY, "нужен NumPy")
+class TestCalibration(unittest.TestCase):
+    """Тесты векторной симуляции партий."""
+
+    def test_matches_bots(self):
+        """Тест 1: Симуляция совпадает с партиями ботов на GameEngine."""
+        rng = random.Random(0)
+        for spec in ("perfect", "memory:3", "random"):
+            counts = calibration.simulate(4, spec, 20000, 200, seed=1)
+            misses = 0
+            for _ in range(2000):
+                images = [i // 2 for i in range(8)]
+                rng.shuffle(images)
+                engine = GameEngine(images, moves=1000)
+                play_engine(engine, make_bot(spec, rng))
+                misses += 1000 - engine.moves_count
+            expected = misses / 2000
+            self.assertAlmostEqual(
+                mean_misses(counts), expected, delta=0.1 * expected + 0.1
+            )
+
+    def test_seed_is_reproducible(self):
+        """Тест 2: Одно зерно даёт одинаковое распределение."""
+        first = calibration.simulate(8, "memory:4", 5000, 64, seed=7)
+        second = calibration.simulate(8, "memory:4", 5000, 64, seed=7)
+        self.assertTrue((first == second).all())
+        self.assertEqual(first.sum(), 5000)
+
+    def test_limit_counts_unfinished(self):
+        """Тест 3: Партии, не выигранные до предела, попадают в конец."""
+        counts = calibration.simulate(8, "random", 2000, 5, seed=1)
+        self.assertEqual(counts.sum(), 2000)
+        self.assertGreater(counts[-1], 1900)
+
+    def test_win_probability_and_suggestion(self):
+        """Тест 4: Вероятность победы и подбор бюджета по распределению."""
+        # 1 партия без промахов, 2 - с одним, 1 - не выиграна
+        counts = np.array([1, 2, 0, 1])
+        self.assertEqual(calibration.win_probability(counts, 1), 0.25)
+        self.assertEqual(calibration.win_probability(counts, 2), 0.75)
+        self.assertEqual(calibration.suggest_moves(counts, 0.75), 2)
+        self.assertEqual(calibration.suggest_moves(counts, 0.2), 1)
+        self.assertIsNone(calibration.suggest_moves(counts, 0.9))
+
+    def test_calibrate_report(self):
+        """Тест 5: Отчёт по уровням с целевой кривой."""
+        manager = LevelManager(grow_every=2, max_board_side=6)
+        report = calibration.calibrate(
+            manager, range(1, 5), games=2000, target=(0.9, 0.6), seed=1
+        )
+        self.assertEqual([row["level"] for row in report], [1, 2, 3, 4])
+        self.assertEqual(report[0]["board"], "4x4")
+        self.assertEqual(report[3]["board"], "6x6")
+        self.assertAlmostEqual(report[0]["target"], 0.9)
+        self.assertAlmostEqual(report[3]["target"], 0.6)
+        self.assertEqual(report[0]["win_prob"], 1.0)
+        for row in report:
+            self.assertLessEqual(row["suggested"], row["moves"])
+
+    def test_unknown_strategy(self):
+        """Тест 6: Неизвестная стратегия вызывает ValueError."""
+        with self.assertRaises(ValueError):
+            calibration.simulate(8, "genius", 10)
+
+    def test_workers_do_not_change_result(self):
+        """Тест 7: Результат при заданном зерне не зависит от количества
+        процессов (по умолчанию - по числу ядер)."""
+        games = calibration.CHUNK_GAMES + 1000
+        serial = calibration.simulate(8, "perfect", games, 64, 3, 1)
+        parallel = calibration.simulate(8, "perfect", games, 64, 3, 2)
+        default = calibration.simulate(8, "perfect", games, 64, 3)
+        self.assertTrue((serial == parallel).all())
+        self.assertTrue((serial == default).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
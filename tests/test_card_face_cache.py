@@ -0,0 +1,55 @@
+"""Тесты для кеша лицевых сторон карточек (нужен PyQt5)"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+
+HAS_QT = importlib.util.find_spec("PyQt5") is not None
+
+
+@unittest.skipUnless(HAS_QT, "нужен PyQt5")
+class TestCardFaceCache(unittest.TestCase):
+    """Тесты загрузки и кеширования иконок карточек."""
+
+    def setUp(self):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt5.QtCore import QSize
+        from PyQt5.QtGui import QColor, QImage
+        from PyQt5.QtWidgets import QApplication
+
+        from myself_moduls.card_face_cache import CardFaceCache
+
+        self.app = QApplication.instance() or QApplication([])
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "card.png")
+        image = QImage(8, 8, QImage.Format_ARGB32)
+        image.fill(QColor("red"))
+        image.save(self.path)
+        self.size = QSize(4, 4)
+        self.faces = CardFaceCache()
+
+    def test_icon_cached(self):
+        """Тест 1: Иконка читается один раз и берётся из кеша."""
+        icon = self.faces.get_icon(self.path, self.size)
+
+        self.assertFalse(icon.isNull())
+        self.assertEqual(len(self.faces.cache), 1)
+        self.assertIs(self.faces.get_icon(self.path, self.size), icon)
+
+    def test_failed_decode_not_cached(self):
+        """Тест 2: Нечитаемый файл не кешируется и читается повторно."""
+        broken = os.path.join(self.tmp.name, "broken.png")
+        with open(broken, "wb") as f:
+            f.write(b"not a png")
+
+        self.assertTrue(self.faces.get_icon(broken, self.size).isNull())
+        self.assertEqual(len(self.faces.cache), 0)
+
+        os.replace(self.path, broken)
+        self.assertFalse(self.faces.get_icon(broken, self.size).isNull())
+
+
+if __name__ == "__main__":
+    unittest.main()
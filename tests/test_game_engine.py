@@ -0,0 +1,75 @@
+"""Тесты для GameEngine"""
+
+import unittest
+
+from myself_moduls.game_engine import GameEngine
+
+
+class TestGameEngine(unittest.TestCase):
+    """Тесты правил игры без Qt."""
+
+    def setUp(self):
+        """Доска: карточки 0 и 2 - 'cat', 1 и 3 - 'dog'."""
+        self.engine = GameEngine(["cat", "dog", "cat", "dog"], moves=3)
+
+    def test_can_turn(self):
+        """Тест 1: Нельзя перевернуть перевернутую и третью карточку."""
+        self.assertTrue(self.engine.turn(0))
+        self.assertFalse(self.engine.can_turn(0), "Уже перевернута")
+        self.assertTrue(self.engine.turn(1))
+        self.assertFalse(self.engine.can_turn(2), "Нельзя третью карточку")
+
+    def test_wrong_index(self):
+        """Тест 2: Несуществующий индекс вызывает IndexError."""
+        for index in (-1, 4):
+            with self.assertRaises(IndexError):
+                self.engine.can_turn(index)
+
+    def test_match(self):
+        """Тест 3: Совпадение отмечает пару и не тратит ход."""
+        self.engine.turn(0)
+        self.engine.turn(2)
+        index_1, index_2, match = self.engine.check_match()
+        self.assertTrue(match)
+        self.engine.apply_match(index_1, index_2, match)
+
+        self.assertEqual((self.engine.found[0], self.engine.found[2]), (1, 1))
+        self.assertEqual(self.engine.pairs_left, 1)
+        self.assertEqual(self.engine.moves_count, 3)
+        self.assertEqual(self.engine.turned_cards, [])
+        self.assertFalse(self.engine.can_turn(0), "Карточка уже в паре")
+
+    def test_mismatch(self):
+        """Тест 4: Несовпадение тратит ход, карточки скрываются."""
+        self.engine.turn(0)
+        self.engine.turn(1)
+        index_1, index_2, match = self.engine.check_match()
+        self.assertFalse(match)
+        self.engine.apply_match(index_1, index_2, match)
+        self.assertEqual(self.engine.moves_count, 2)
+        self.assertFalse(self.engine.can_turn(3), "Идёт проверка")
+
+        self.engine.hide_cards(index_1, index_2)
+        self.assertTrue(self.engine.can_turn(0))
+        self.assertTrue(self.engine.can_turn(1))
+
+    def test_status(self):
+        """Тест 5: Победа, поражение и продолжение игры."""
+        self.assertIsNone(self.engine.status())
+        for index_1, index_2 in ((0, 2), (1, 3)):
+            self.engine.turn(index_1)
+            self.engine.turn(index_2)
+            self.engine.apply_match(*self.engine.check_match())
+        self.assertEqual(self.engine.status(), "win")
+
+        self.engine.new_board(["cat", "cat"], moves=0)
+        self.assertEqual(self.engine.status(), "lose")
+
+    def test_odd_images_error(self):
+        """Тест 6: Изображение без пары вызывает ошибку."""
+        with self.assertRaises(ValueError):
+            GameEngine(["cat", "dog", "cat"])
+
+
+if __name__ == "__main__":
+    unittest.main()
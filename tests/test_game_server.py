@@ -0,0 +1,181 @@
+"""Тесты для игрового сервера и нагрузочного клиента"""
+
+import asyncio
+import json
+import os
+import threading
+import unittest
+
+from myself_moduls.game_server import Connection, GameServer, TimerWheel
+from myself_moduls.load_client import run_load
+
+
+class FakeClock:
+    """Часы, которые двигает тест."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Тесты колеса таймеров."""
+
+    def test_order_and_rounds(self):
+        """Тест 1: Вызовы выполняются в свой такт, в том числе через
+        несколько оборотов колеса."""
+        clock = FakeClock()
+        wheel = TimerWheel(tick=0.01, size=8, clock=clock)
+        fired = []
+        wheel.schedule(0.05, fired.append, "a")
+        wheel.schedule(0.02, fired.append, "b")
+        wheel.schedule(0.25, fired.append, "c")  # больше оборота
+        self.assertEqual(len(wheel), 3)
+
+        clock.now = 0.045
+        wheel.advance()
+        self.assertEqual(fired, ["b"])
+        clock.now = 0.1
+        wheel.advance()
+        self.assertEqual(fired, ["b", "a"])
+        clock.now = 0.2
+        wheel.advance()
+        self.assertEqual(fired, ["b", "a"])
+        clock.now = 0.26
+        wheel.advance()
+        self.assertEqual(fired, ["b", "a", "c"])
+        self.assertEqual(len(wheel), 0)
+
+    def test_idle_wheel_skips_ticks(self):
+        """Тест 2: После простоя вызов не срабатывает раньше времени."""
+        clock = FakeClock()
+        wheel = TimerWheel(tick=0.01, size=8, clock=clock)
+        fired = []
+        clock.now = 100.0
+        wheel.schedule(0.05, fired.append, 1)
+
+        clock.now = 100.03
+        self.assertEqual(wheel.advance(), 0)
+        clock.now = 100.06
+        self.assertEqual(wheel.advance(), 1)
+
+
+class TestGameServerProtocol(unittest.IsolatedAsyncioTestCase):
+    """Тесты протокола без сети."""
+
+    def setUp(self):
+        self.server = GameServer(time_show=0)
+        self.conn = Connection()
+        self.addAsyncCleanup(self.server.close)
+
+    async def request(self, **request):
+        await self.server.handle_line(self.conn, json.dumps(request))
+        return self.conn.outbox.pop()
+
+    async def test_game_flow(self):
+        """Тест 3: Партия проходится до победы, промахи тратят ходы и
+        ставят таймер скрытия."""
+        board = await self.request(op="new", level=1, seed=7, id="a")
+        self.assertEqual(board["ev"], "new")
+        self.assertEqual(board["id"], "a")
+        self.assertEqual(len(board["images"]), 8)
+        sid = board["s"]
+        ids = self.conn.sessions[sid].engine.image_ids
+        other = next(i for i in range(1, 16) if ids[i] != ids[0])
+
+        await self.request(op="turn", s=sid, card=0)
+        miss = await self.request(op="turn", s=sid, card=other)
+        self.assertFalse(miss["match"])
+        self.assertEqual(miss["moves"], board["moves"] - 1)
+        self.assertEqual(len(self.server.wheel), 1)
+        busy = await self.request(op="turn", s=sid, card=1)
+        self.assertFalse(busy["ok"])
+
+        engine = self.conn.sessions[sid].engine
+        engine.hide_cards(0, other)
+        reply = None
+        for image_id in range(8):
+            pair = [i for i in range(16) if ids[i] == image_id]
+            await self.request(op="turn", s=sid, card=pair[0])
+            reply = await self.request(op="turn", s=sid, card=pair[1])
+            self.assertTrue(reply["match"])
+        self.assertEqual(reply["result"], "win")
+
+        same = await self.request(op="new", s=sid, level=1, seed=7)
+        self.assertEqual(same["s"], sid)
+        self.assertEqual(same["seed"], board["seed"])
+        self.assertEqual(self.server.active, 1)
+
+    async def test_errors(self):
+        """Тест 4: Некорректные запросы дают событие error."""
+        missing = await self.request(op="turn", s=99, card=0)
+        self.assertEqual(missing["ev"], "error")
+        self.assertEqual((await self.request(op="jump"))["ev"], "error")
+        await self.server.handle_line(self.conn, b"{")
+        self.assertEqual(self.conn.outbox.pop()["ev"], "error")
+        sid = (await self.request(op="new"))["s"]
+        wrong = await self.request(op="turn", s=sid, card=99)
+        self.assertEqual(wrong["ev"], "error")
+        closed = await self.request(op="close", s=sid)
+        self.assertEqual(closed["ev"], "close")
+        self.assertEqual(self.server.active, 0)
+
+    async def test_deal_off_loop_by_content(self):
+        """Тест 5: Доска готовится не в потоке цикла событий, движок
+        получает идентификаторы содержимого, а не пути."""
+        prepare_level = self.server.prefetcher.prepare_level
+        threads = []
+
+        def traced(*args):
+            threads.append(threading.current_thread())
+            return prepare_level(*args)
+
+        self.server.prefetcher.prepare_level = traced
+        board = await self.request(op="new", level=1, seed=3)
+
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        prepared = prepare_level(1, seed=3)
+        engine = self.conn.sessions[board["s"]].engine
+        first = {}
+        for key, path in zip(prepared.keys, prepared.images):
+            first.setdefault(key, os.path.basename(path))
+        self.assertEqual(board["images"], list(first.values()))
+        self.assertEqual(
+            [board["images"][i] for i in engine.image_ids],
+            [first[key] for key in prepared.keys],
+        )
+
+
+class TestGameServerNetwork(unittest.IsolatedAsyncioTestCase):
+    """Тест сервера с нагрузочным клиентом по TCP."""
+
+    async def test_load(self):
+        """Тест 6: Боты доигрывают партии, ожидающие партии держатся,
+        после отключения клиентов партии освобождаются."""
+        server = GameServer(time_show=0)
+        port = await server.start("127.0.0.1", 0)
+        try:
+            summary = await run_load(
+                port=port,
+                connections=2,
+                sessions=8,
+                idle=200,
+                duration=1.0,
+                seed=1,
+            )
+            await asyncio.sleep(0.05)
+        finally:
+            await server.close()
+
+        self.assertEqual(summary["errors"], 0)
+        self.assertGreater(summary["games"], 0)
+        self.assertEqual(summary["wins"], summary["games"])
+        self.assertGreaterEqual(server.moves, summary["moves"])
+        self.assertEqual(server.active, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
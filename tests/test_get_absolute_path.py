@@ -1,7 +1,13 @@
 import unittest
 import os
+import tempfile
+from unittest.mock import patch
 
-from myself_moduls.get_absolute_path import get_path, find_project_root
+from myself_moduls.get_absolute_path import (
+    get_path,
+    find_project_root,
+    load_index,
+)
 
 
 class TestGetPath(unittest.TestCase):
@@ -57,5 +63,82 @@ class TestGetPath(unittest.TestCase):
         self.assertTrue(os.path.isabs(path))
 
 
+class TestAssetIndex(unittest.TestCase):
+    """Тесты индекса ресурсов и его манифеста на диске."""
+
+    def setUp(self):
+        """Создаёт временное дерево ресурсов."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        self.manifest = os.path.join(self.root, "__pycache__", "index.json")
+        for rel in ("a/frog.png", "b/frog.png", "b/cat.png", ".git/x.png"):
+            path = os.path.join(self.root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def load(self):
+        """Загружает индекс временного дерева."""
+        with patch("builtins.print"):
+            return load_index(self.root, self.manifest)
+
+    def test_index_names(self):
+        """Тест 6: Индекс содержит все имена, кроме игнорируемых папок."""
+        index = self.load()
+
+        self.assertEqual(
+            index["cat.png"], [os.path.join(self.root, "b", "cat.png")]
+        )
+        self.assertEqual(len(index["frog.png"]), 2)
+        self.assertNotIn("x.png", index)
+        self.assertTrue(os.path.exists(self.manifest))
+
+    def test_manifest_reused(self):
+        """Тест 7: Неизменённое дерево не обходится повторно."""
+        self.load()
+        with patch("os.walk") as mock_walk:
+            index = self.load()
+        mock_walk.assert_not_called()
+        self.assertIn("cat.png", index)
+
+    def test_manifest_invalidated(self):
+        """Тест 8: Новый файл делает манифест устаревшим."""
+        self.load()
+        new_file = os.path.join(self.root, "a", "dog.png")
+        open(new_file, "w").close()
+        os.utime(
+            os.path.dirname(new_file), ns=(0, 1)
+        )  # гарантируем смену mtime на грубых файловых системах
+
+        self.assertEqual(self.load()["dog.png"], [new_file])
+
+    def test_ignored_names_exact(self):
+        """Тест 9: Пропускаются только папки с точно совпадающим именем,
+        служебные файлы не считаются неоднозначными."""
+        for rel in (
+            ".github/ci.yml",
+            "my.cache_assets/dog.png",
+            ".gitignore",
+            "a/.gitignore",
+        ):
+            path = os.path.join(self.root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+
+        with patch("builtins.print") as mock_print, patch(
+            "myself_moduls.get_absolute_path._reported_ambiguous", set()
+        ):
+            index = load_index(self.root, self.manifest)
+
+        self.assertIn("ci.yml", index)
+        self.assertIn("dog.png", index)
+        self.assertNotIn("x.png", index)
+        mock_print.assert_called_once_with(
+            "Имена найдены в нескольких местах: frog.png"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,121 @@
+"""Тесты для каталога изображений по содержимому"""
+
+import os
+import tempfile
+import unittest
+
+from myself_moduls.image_catalog import ImageCatalog
+from myself_moduls.make_list_images import list_files
+
+
+class TestImageCatalog(unittest.TestCase):
+    """Тесты хеширования и кеширования содержимого изображений."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.catalog_path = os.path.join(self.root, "cache", "catalog.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_image(self, folder, name, content):
+        """Создаёт файл изображения с указанным содержимым."""
+        os.makedirs(os.path.join(self.root, folder), exist_ok=True)
+        path = os.path.join(self.root, folder, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_duplicates_share_id(self):
+        """Тест 1: Одинаковые файлы из разных папок получают один ID."""
+        frog_1 = self.make_image("images_1", "frog.png", b"frog")
+        frog_4 = self.make_image("images_4", "frog.png", b"frog")
+        cat = self.make_image("images_4", "cat.png", b"cat")
+        catalog = ImageCatalog(self.catalog_path)
+
+        ids = catalog.content_ids([frog_1, frog_4, cat])
+
+        self.assertEqual(ids[0], ids[1])
+        self.assertNotEqual(ids[0], ids[2])
+        self.assertEqual(
+            catalog.distinct([frog_1, cat, frog_4]), [frog_1, cat]
+        )
+
+    def test_hashes_are_cached_on_disk(self):
+        """Тест 2: Неизменённые файлы не хешируются повторно."""
+        paths = [
+            self.make_image("images_1", f"img_{i}.png", bytes([i]))
+            for i in range(5)
+        ]
+        first = ImageCatalog(self.catalog_path)
+        self.assertEqual(first.update(paths), 5)
+
+        second = ImageCatalog(self.catalog_path)
+
+        self.assertEqual(second.update(paths), 0)
+        self.assertEqual(second.digest(paths[3]), first.digest(paths[3]))
+
+    def test_changed_file_rehashed(self):
+        """Тест 3: Изменённый файл хешируется заново."""
+        path = self.make_image("images_1", "img.png", b"old")
+        catalog = ImageCatalog(self.catalog_path)
+        catalog.update([path])
+        old_digest = catalog.digest(path)
+
+        self.make_image("images_1", "img.png", b"new content")
+        catalog = ImageCatalog(self.catalog_path)
+
+        self.assertEqual(catalog.update([path]), 1)
+        self.assertNotEqual(catalog.digest(path), old_digest)
+
+    def test_parallel_hashing(self):
+        """Тест 4: Хеширование в нескольких процессах даёт те же хеши."""
+        paths = [
+            self.make_image("images_1", f"img_{i}.png", bytes([i % 3]) * 10)
+            for i in range(6)
+        ]
+        serial = ImageCatalog(os.path.join(self.root, "serial.json"))
+        parallel = ImageCatalog(
+            self.catalog_path, parallel_threshold=1, workers=2
+        )
+        serial.update(paths)
+        parallel.update(paths)
+
+        for path in paths:
+            self.assertEqual(parallel.digest(path), serial.digest(path))
+
+    def test_list_files_skips_duplicates(self):
+        """Тест 5: list_files не выбирает два одинаковых изображения."""
+        for i in range(8):
+            self.make_image("images_1", f"img_{i}.png", bytes([i]))
+        self.make_image("images_2", "img_0.png", bytes([0]))
+        catalog = ImageCatalog(self.catalog_path)
+        dirs = tuple(
+            os.path.join(self.root, name) for name in ("images_1", "images_2")
+        )
+
+        cards = list_files(dirs, pairs=9, catalog=catalog)
+
+        digests = [catalog.digest(path) for path in cards]
+        self.assertEqual(len(set(digests)), 8)
+        for digest in set(digests):
+            self.assertEqual(digests.count(digest) % 2, 0)
+
+    def test_save_drops_missing_files(self):
+        """Тест 6: Записи удалённых файлов не сохраняются."""
+        kept = self.make_image("images_1", "kept.png", b"kept")
+        gone = self.make_image("images_1", "gone.png", b"gone")
+        ImageCatalog(self.catalog_path).update([kept, gone])
+        os.remove(gone)
+
+        catalog = ImageCatalog(self.catalog_path)
+        catalog.save()
+
+        reloaded = ImageCatalog(self.catalog_path)
+        self.assertIsNotNone(reloaded.digest(kept))
+        self.assertIsNone(reloaded.digest(gone))
+
+
+if __name__ == "__main__":
+    unittest.main()
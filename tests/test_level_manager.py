@@ -1,6 +1,11 @@
 """Тесты для LevelManager"""
 
+import json
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
+
 from myself_moduls.level_manager import LevelManager
 
 
@@ -89,5 +94,145 @@ class TestLevelManagerSimple(unittest.TestCase):
             manager.get_level(-3)
 
 
+    def test_board_size_default(self):
+        """Тест 9: По умолчанию поле 4x4 на любом уровне."""
+        manager = LevelManager()
+
+        self.assertEqual(manager.get_board_size(1), (4, 4))
+        self.assertEqual(manager.get_board_size(50), (4, 4))
+
+    def test_board_grows_and_caps(self):
+        """Тест 10: Поле растёт каждые grow_every уровней до максимума."""
+        manager = LevelManager(grow_every=2, max_board_side=8)
+
+        sizes = [manager.get_board_size(lvl)[0] for lvl in range(1, 9)]
+
+        self.assertEqual(sizes, [4, 4, 6, 6, 8, 8, 8, 8])
+
+    def test_moves_scale_with_pairs(self):
+        """Тест 11: Ходы растут пропорционально количеству пар."""
+        manager = LevelManager(board_side=8)
+
+        moves, _, _, _ = manager.get_level(1)
+
+        # 32 пары вместо 8: 30 * 32 // 8 = 120 ходов
+        self.assertEqual(moves, 120)
+
+    def test_odd_board_side_error(self):
+        """Тест 12: Нечётная сторона поля вызывает ошибку."""
+        with self.assertRaises(ValueError):
+            LevelManager(board_side=5)
+
+    def test_rules_without_folders(self):
+        """Тест 13: Правила уровня не требуют папок с картинками."""
+        manager = LevelManager(custom_paths={"images": "/нет/такой/папки"})
+
+        self.assertEqual(manager.get_rules(6), (14, 600, "ХАРДКОР!"))
+        self.assertEqual(manager.get_rules(7), (17, 400, "СПРИНТ"))
+        with self.assertRaises(FileNotFoundError):
+            manager.get_level(6)
+
+
+class TestLevelPack(unittest.TestCase):
+    """Тесты набора уровней и скомпилированной таблицы."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        for name, count in (("a", 8), ("b", 3)):
+            os.mkdir(os.path.join(self.root, name))
+            for i in range(count):
+                path = os.path.join(self.root, name, f"{i}.png")
+                with open(path, "w") as f:
+                    f.write(name + str(i))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_pack(self, **changes):
+        """Возвращает набор из двух уровней и круга на папке 'a'."""
+        pack = {
+            "dirs": ["a", "b"],
+            "levels": [
+                {"dirs": [0], "moves": 20, "time": 900},
+                {"dirs": [0], "moves": 15, "time": 800, "type": "ХАРДКОР!"},
+            ],
+            "cycle": {
+                "dirs": [0],
+                "time": 500,
+                "steps": [{"moves": 12}, {"moves": 10, "type": "БОНУС!"}],
+                "special": {"every": 5, "time": 300, "type": "СПРИНТ"},
+            },
+        }
+        pack.update(changes)
+        return pack
+
+    def test_pack_from_file(self):
+        """Тест 1: Набор уровней читается из файла custom_paths['levels']."""
+        pack_path = os.path.join(self.root, "levels.json")
+        with open(pack_path, "w", encoding="utf-8") as f:
+            json.dump(self.make_pack(), f, ensure_ascii=False)
+        manager = LevelManager(
+            custom_paths={"images": self.root, "levels": pack_path}
+        )
+
+        rules = [manager.get_rules(lvl) for lvl in range(1, 7)]
+
+        self.assertEqual(
+            rules,
+            [
+                (20, 900, "normal"),
+                (15, 800, "ХАРДКОР!"),
+                (12, 500, "normal"),
+                (10, 500, "БОНУС!"),
+                (12, 300, "СПРИНТ"),
+                (10, 500, "БОНУС!"),
+            ],
+        )
+        self.assertEqual(
+            manager.get_level(3)[1], [os.path.join(self.root, "a")]
+        )
+
+    def test_no_filesystem_after_load(self):
+        """Тест 2: После load уровни выдаются без обращений к диску."""
+        manager = LevelManager()
+        manager.load()
+
+        with patch("os.path.isdir", side_effect=AssertionError), patch(
+            "os.scandir", side_effect=AssertionError
+        ), patch(
+            "myself_moduls.level_manager.get_path",
+            side_effect=AssertionError,
+        ):
+            levels = manager.get_levels(range(1, 1001))
+
+        self.assertEqual(len(levels), 1000)
+        self.assertEqual(levels[5], manager.get_level(6))
+        self.assertEqual(levels[13][3], "СПРИНТ")
+
+    def test_too_few_images(self):
+        """Тест 3: Уровень на папке с малым количеством картинок."""
+        pack = self.make_pack(cycle=None)
+        pack["levels"][1]["dirs"] = [1]
+        manager = LevelManager(custom_paths={"images": self.root}, pack=pack)
+
+        with self.assertRaises(FileNotFoundError):
+            manager.get_level(1)
+        # без круга последний уровень повторяется
+        self.assertEqual(manager.get_rules(9), (15, 800, "ХАРДКОР!"))
+
+    def test_invalid_pack(self):
+        """Тест 4: Ошибки набора уровней обнаруживаются при создании."""
+        bad_packs = [
+            self.make_pack(levels=[{"dirs": [2], "moves": 10, "time": 500}]),
+            self.make_pack(levels=[{"dirs": [0], "time": 500}]),
+            self.make_pack(levels=[], cycle=None),
+            self.make_pack(dirs=[]),
+        ]
+        for pack in bad_packs:
+            with self.assertRaises(ValueError):
+                LevelManager(pack=pack)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+"""Тесты для LevelPrefetcher"""
+
+import threading
+import unittest
+
+from myself_moduls.level_manager import LevelManager
+from myself_moduls.level_prefetcher import LevelPrefetcher
+
+
+class TestLevelPrefetcher(unittest.TestCase):
+    """Тесты фоновой подготовки уровней."""
+
+    def setUp(self):
+        self.prefetcher = LevelPrefetcher(LevelManager())
+
+    def tearDown(self):
+        self.prefetcher.shutdown()
+
+    def test_take_without_prefetch(self):
+        """Тест 1: Незапрошенный уровень готовится синхронно."""
+        level = self.prefetcher.take(1)
+
+        self.assertEqual(
+            (level.lvl_num, level.moves, level.time), (1, 30, 1000)
+        )
+        self.assertEqual(len(level.images), 16)
+        self.assertEqual(level.faces, {})
+
+    def test_prefetch_in_background(self):
+        """Тест 2: Изображения декодируются в фоновом потоке."""
+        threads = set()
+
+        def decode(path):
+            threads.add(threading.current_thread().name)
+            return path.upper()
+
+        self.prefetcher.prefetch((2, 1), decode)
+        level = self.prefetcher.take(2)
+
+        self.assertEqual(level.moves, 26)
+        self.assertEqual(set(level.faces), set(level.images))
+        self.assertEqual(level.faces[level.images[0]], level.images[0].upper())
+        self.assertNotIn(threading.current_thread().name, threads)
+
+    def test_take_error(self):
+        """Тест 3: Ошибка подготовки передаётся при take."""
+        self.prefetcher.prefetch((0,))
+        with self.assertRaises(ValueError):
+            self.prefetcher.take(0)
+
+    def test_board_size(self):
+        """Тест 4: Количество карточек соответствует размеру поля."""
+        prefetcher = LevelPrefetcher(LevelManager(board_side=6))
+        try:
+            level = prefetcher.take(1)
+        finally:
+            prefetcher.shutdown()
+
+        self.assertEqual(level.board_size, (6, 6))
+        self.assertEqual(len(level.images), 36)
+
+    def test_seed(self):
+        """Тест 5: Уровень с заданным зерном раскладывается так же."""
+        self.prefetcher.prefetch((1,))
+        first = self.prefetcher.take(1, seed=7)
+        second = self.prefetcher.take(1, seed=7)
+
+        self.assertEqual(first.seed, 7)
+        self.assertEqual(first.images, second.images)
+        self.assertIsInstance(self.prefetcher.take(2).seed, int)
+
+
+if __name__ == "__main__":
+    unittest.main()
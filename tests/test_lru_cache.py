@@ -0,0 +1,51 @@
+"""Тесты для SizedLruCache"""
+
+import unittest
+
+from myself_moduls.lru_cache import SizedLruCache
+
+
+class TestSizedLruCache(unittest.TestCase):
+    """Тесты вытеснения и учёта размера в LRU-кеше."""
+
+    def test_get_and_put(self):
+        """Тест 1: Значение возвращается, промахи и попадания считаются."""
+        cache = SizedLruCache(max_cost=10)
+        cache.put("a", 1, cost=4)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_evicts_least_recently_used(self):
+        """Тест 2: При переполнении вытесняется давно не использованное."""
+        cache = SizedLruCache(max_cost=10)
+        cache.put("a", 1, cost=4)
+        cache.put("b", 2, cost=4)
+        cache.get("a")
+        cache.put("c", 3, cost=4)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.total_cost, 8)
+
+    def test_replace_and_too_big(self):
+        """Тест 3: Повторный put заменяет значение, слишком большое
+        значение не кешируется."""
+        cache = SizedLruCache(max_cost=10)
+        cache.put("a", 1, cost=4)
+        cache.put("a", 2, cost=6)
+        self.assertEqual((cache.get("a"), cache.total_cost), (2, 6))
+
+        cache.put("big", 3, cost=11)
+        self.assertNotIn("big", cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_negative_size_error(self):
+        """Тест 4: Отрицательный размер кеша вызывает ошибку."""
+        with self.assertRaises(ValueError):
+            SizedLruCache(max_cost=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
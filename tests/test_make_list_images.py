@@ -1,9 +1,16 @@
 import unittest
 import os
+import random
 import tempfile
 import sys
 
-from myself_moduls.make_list_images import list_files
+from myself_moduls.image_catalog import ImageCatalog
+from myself_moduls.make_list_images import (
+    iter_images,
+    list_files,
+    reservoir_sample,
+    scan_images,
+)
 from unittest.mock import patch, MagicMock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,7 +23,9 @@ class TestListFilesSimple(unittest.TestCase):
         with tempfile.TemporaryDirectory() as temp_dir:
             for i in range(8):
                 file_path = os.path.join(temp_dir, f"img_{i}.png")
-                open(file_path, "w").close()
+                # содержимое разное: одинаковые файлы считаются одним
+                with open(file_path, "w") as f:
+                    f.write(f"img {i}")
 
             result = list_files((temp_dir,))
             self.assertEqual(len(result), 16)
@@ -27,7 +36,8 @@ class TestListFilesSimple(unittest.TestCase):
             files = []
             for i in range(8):
                 path = os.path.join(temp_dir, f"pic_{i}.png")
-                open(path, "w").close()
+                with open(path, "w") as f:
+                    f.write(f"pic {i}")
                 files.append(path)
             result = list_files((temp_dir,))
             for path in files:
@@ -95,7 +105,130 @@ class TestListFilesWithMocksSimple(unittest.TestCase):
 
         error_msg = str(context.exception)
         self.assertIn("Недостаточно", error_msg)
+
+    @patch("os.scandir")
+    @patch("os.path.isdir")
+    def test_images_repeat_for_big_board(self, mock_isdir, mock_scandir):
+        """Тест для большого поля: изображения повторяются парами."""
+        mock_isdir.return_value = True
+        files = []
+        for i in range(8):
+            mock_file = MagicMock()
+            mock_file.is_file.return_value = True
+            mock_file.name = f"img_{i}.png"
+            mock_file.path = f"/test/img_{i}.png"
+            files.append(mock_file)
+        mock_scandir.return_value = files
+
+        result = list_files(("/test",), pairs=50)
+
+        self.assertEqual(len(result), 100)
+        self.assertEqual(len(set(result)), 8)
+        for path in set(result):
+            self.assertEqual(result.count(path) % 2, 0)
+
 # КОНЕЦ ЗАИМСТВОВАННОГО КОДА
 
+class TestScanAndStreamSimple(unittest.TestCase):
+    """Тесты кеша сканирования и потоковой выборки."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        for i in range(10):
+            with open(os.path.join(self.dir, f"img_{i}.png"), "w") as f:
+                f.write(f"img {i}")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_scan_cached_until_dir_changes(self):
+        """Тест кеша: директория не сканируется, пока не изменилась."""
+        first = scan_images(self.dir)
+        with patch("os.scandir") as mock_scandir:
+            self.assertIs(scan_images(self.dir), first)
+            mock_scandir.assert_not_called()
+
+        new_path = os.path.join(self.dir, "new.png")
+        with open(new_path, "w") as f:
+            f.write("new")
+        os.utime(self.dir, ns=(0, os.stat(self.dir).st_mtime_ns + 10**9))
+
+        self.assertIn(new_path, scan_images(self.dir))
+
+    def test_distinct_cached_until_dir_changes(self):
+        """Тест кеша уникальных изображений: повторная выборка не
+        проверяет файлы, пока директория не изменилась."""
+        cache = tempfile.TemporaryDirectory()
+        self.addCleanup(cache.cleanup)
+        catalog = ImageCatalog(os.path.join(cache.name, "c.json"))
+        list_files((self.dir,), catalog=catalog)
+        with patch.object(catalog, "update") as mock_update:
+            list_files((self.dir,), catalog=catalog)
+            mock_update.assert_not_called()
+
+        new_path = os.path.join(self.dir, "new.png")
+        with open(new_path, "w") as f:
+            f.write("new")
+        os.utime(self.dir, ns=(0, os.stat(self.dir).st_mtime_ns + 10**9))
+
+        self.assertIn(new_path, list_files((self.dir,), 11, catalog))
+
+    def test_reservoir_sample(self):
+        """Тест выборки: k разных элементов из генератора."""
+        result = reservoir_sample((i for i in range(1000)), 8)
+
+        self.assertEqual(len(result), 8)
+        self.assertEqual(len(set(result)), 8)
+        self.assertEqual(sorted(reservoir_sample(iter("abc"), 8)), list("abc"))
+
+    def test_stream_mode(self):
+        """Тест потокового режима: 16 карточек из 8 разных пар."""
+        catalog = ImageCatalog(os.path.join(self.dir, "cache", "c.json"))
+
+        result = list_files((self.dir,), catalog=catalog, stream=True)
+
+        self.assertEqual(len(result), 16)
+        self.assertEqual(len(set(result)), 8)
+        # хешируются только выбранные изображения, а не вся папка
+        self.assertEqual(catalog.hashed, 8)
+
+    def test_same_seed_same_cards(self):
+        """Тест зерна: одно зерно даёт одну раскладку в обоих режимах."""
+        catalog = ImageCatalog(os.path.join(self.dir, "cache", "c.json"))
+        for stream in (False, True):
+            first, second = (
+                list_files(
+                    (self.dir,),
+                    catalog=catalog,
+                    stream=stream,
+                    rng=random.Random(42),
+                )
+                for _ in range(2)
+            )
+            self.assertEqual(first, second)
+
+    def test_stream_seed_ignores_dir_order(self):
+        """Тест зерна: потоковая раскладка не зависит от порядка файлов,
+        в котором их отдаёт файловая система."""
+        catalog = ImageCatalog(os.path.join(self.dir, "cache", "c.json"))
+
+        def deal():
+            return list_files(
+                (self.dir,), catalog=catalog, stream=True,
+                rng=random.Random(7),
+            )
+
+        first = deal()
+        reversed_order = list(iter_images(self.dir))[::-1]
+        with patch(
+            "myself_moduls.make_list_images.iter_images",
+            side_effect=lambda d: iter(reversed_order),
+        ):
+            second = deal()
+
+        self.assertEqual(first, second)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import tempfile
 import os
 import json
+from unittest.mock import patch
 
 from myself_moduls.records import Progress
 
@@ -30,6 +31,7 @@ class TestProgress(unittest.TestCase):
             game.new_level(win=False)
             self.assertEqual(game.get_level(), 1)
             self.assertEqual(game.get_record(), 2)
+            game.close()
 
     def test_file_gets_created(self):
         """Проверка, что файл создается в текущей папке."""
@@ -39,6 +41,78 @@ class TestProgress(unittest.TestCase):
             Progress(file_name=test_file)
             self.assertTrue(os.path.exists(test_file))
 
+    def test_writes_are_coalesced(self):
+        """Несколько изменений подряд дают одну запись."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, "progress.json")
+            game = Progress(file_name=test_file, delay=10)
+            writes = game.writes
+
+            for _ in range(5):
+                game.new_level(win=True)
+            game.close()
+
+            self.assertEqual(game.writes - writes, 1)
+            with open(test_file) as f:
+                self.assertEqual(json.load(f), {"record": 6, "current": 6})
+
+    def test_level_change_without_disk_io(self):
+        """Переход на уровень не пишет файл в вызывающем потоке."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, "progress.json")
+            game = Progress(file_name=test_file, delay=10)
+
+            with patch("builtins.open") as mock_open:
+                game.new_level(win=True)
+                mock_open.assert_not_called()
+            game.close()
+
+            self.assertEqual(Progress(file_name=test_file).get_level(), 2)
+
+    def test_atomic_write(self):
+        """Сбой во время записи не портит сохранённый прогресс."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, "progress.json")
+            game = Progress(file_name=test_file)
+
+            with patch("os.replace", side_effect=OSError("сбой")):
+                game.new_level(win=True)
+                game.flush()
+
+            with open(test_file) as f:
+                self.assertEqual(json.load(f), {"record": 1, "current": 1})
+            game.close()
+
+    def test_default_file_in_cache(self):
+        """Файл по умолчанию лежит в .cache, прогресс из прежнего места
+        переносится, а индекс ресурсов после сохранения не устаревает."""
+        from myself_moduls.get_absolute_path import (
+            is_manifest_fresh,
+            scan_assets,
+        )
+
+        with tempfile.TemporaryDirectory() as root:
+            legacy = os.path.join(root, "myself_moduls")
+            os.makedirs(legacy)
+            with open(os.path.join(legacy, "progress.json"), "w") as f:
+                json.dump({"record": 4, "current": 3}, f)
+            with patch("myself_moduls.records.LEGACY_DIR", legacy), patch(
+                "myself_moduls.records.find_project_root", return_value=root
+            ):
+                game = Progress(delay=0)
+                self.assertEqual(
+                    game.progress_file,
+                    os.path.join(root, ".cache", "progress.json"),
+                )
+                self.assertEqual(game.get_level(), 3)
+                _, dirs = scan_assets(root)
+
+                game.new_level(win=True)
+                game.close()
+
+                self.assertTrue(is_manifest_fresh(root, dirs))
+                self.assertEqual(Progress().get_level(), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,112 @@
+"""Тесты для записи и воспроизведения партий"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from myself_moduls.bots import MemoryBot
+from myself_moduls.game_engine import GameEngine
+from myself_moduls.replay import (
+    Replay,
+    ReplayLog,
+    arrange_board,
+    decode_varints,
+    encode_varints,
+    read_replays,
+    run_replay,
+)
+
+
+def record_game(seed, moves=30):
+    """Играет ботом партию на доске 4x4 и записывает её."""
+    rng = random.Random(seed)
+    images = [i // 2 for i in range(16)]
+    rng.shuffle(images)
+    engine = GameEngine(images, moves)
+    replay = Replay(seed, 1, moves, 1000, engine.image_ids)
+    bot = MemoryBot(capacity=3, rng=rng)
+    while engine.status() is None:
+        index_card = bot.pick(engine)
+        engine.turn(index_card)
+        replay.press(index_card)
+        bot.observe(index_card, engine.image_ids[index_card])
+        if len(engine.turned_cards) == 2:
+            index_1, index_2, match = engine.check_match()
+            engine.apply_match(index_1, index_2, match)
+            if not match:
+                engine.hide_cards(index_1, index_2)
+    replay.result = engine.status()
+    return replay
+
+
+class TestReplay(unittest.TestCase):
+    """Тесты формата записи и воспроизведения на движке."""
+
+    def test_varints(self):
+        """Тест 1: Числа кодируются и декодируются без потерь."""
+        values = [0, 1, 127, 128, 300, 2**31, 5]
+        self.assertEqual(decode_varints(encode_varints(values)), values)
+        with self.assertRaises(ValueError):
+            encode_varints([-1])
+        with self.assertRaises(ValueError):
+            # последний байт с флагом продолжения
+            decode_varints("gA==")
+
+    def test_line_roundtrip(self):
+        """Тест 2: Запись переводится в строку журнала и обратно."""
+        replay = Replay(5, 3, 22, 700, [0, 1, 0, 1], [0, 2], [150, 900])
+        replay.result = "win"
+
+        restored = Replay.from_line(replay.to_line())
+
+        for name in ("seed", "level", "moves", "time", "board", "cards"):
+            self.assertEqual(getattr(restored, name), getattr(replay, name))
+        self.assertEqual(restored.times, [150, 900])
+        self.assertEqual(restored.result, "win")
+        with self.assertRaises(ValueError):
+            Replay.from_line('{"v": 1, "seed": 1}')
+
+    def test_run_replay(self):
+        """Тест 3: Воспроизведение на движке даёт записанный итог."""
+        engine = GameEngine()
+        for seed in range(20):
+            replay = record_game(seed, moves=12)
+            restored = Replay.from_line(replay.to_line())
+            self.assertEqual(run_replay(restored, engine), replay.result)
+
+    def test_impossible_move(self):
+        """Тест 4: Невозможный ход в записи вызывает ValueError."""
+        replay = Replay(1, 1, 30, 1000, [0, 0, 1, 1], [0, 0], [10, 20])
+        with self.assertRaises(ValueError):
+            run_replay(replay)
+
+    def test_log(self):
+        """Тест 5: Журнал пишется в фоне, повреждённые строки пропускаются."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "cache", "replays.ndjson")
+            log = ReplayLog(path)
+            for seed in range(3):
+                log.append(record_game(seed))
+            log.close()
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("не запись\n")
+
+            replays = read_replays(path)
+
+        self.assertEqual([r.seed for r in replays], [0, 1, 2])
+
+    def test_arrange_board(self):
+        """Тест 6: Изображения раскладываются по записанной доске."""
+        images = ["b.png", "a.png", "a.png", "b.png"]
+
+        self.assertEqual(
+            arrange_board(images, [0, 0, 1, 1]),
+            ["b.png", "b.png", "a.png", "a.png"],
+        )
+        with self.assertRaises(ValueError):
+            arrange_board(images, [0, 1, 2, 2, 1, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Тесты для SoundManager с подменённым микшером pygame"""
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from myself_moduls.music_and_sounds_manager import SoundManager
+
+
+class FakeEngine:
+    """Аудиодвижок-заглушка: Sound запоминает порядок загрузки
+    и проигрывания.
+
+    Загрузка звуков ждёт события release, чтобы тест мог нажать
+    на карточку до окончания загрузки."""
+
+    def __init__(self):
+        self.loaded, self.played = [], []
+        self.loading = threading.Event()
+        self.release = threading.Event()
+        mixer = self
+
+        class Sound:
+            def __init__(self, path):
+                mixer.loading.set()
+                mixer.release.wait(5)
+                self.path = path
+                mixer.loaded.append(path)
+
+            def play(self):
+                mixer.played.append(self.path)
+
+        self.Sound = Sound
+
+    def mixer(self):
+        return self
+
+    def play_effect(self, kind, sound, requested_at=None):
+        sound.play()
+
+
+class TestSoundManager(unittest.TestCase):
+    """Тесты фоновой загрузки звуков."""
+
+    def setUp(self):
+        self.mixer = FakeEngine()
+        self.custom_paths = {
+            f"sound_{name}": name for name in SoundManager.LOAD_ORDER
+        }
+
+    def make_manager(self):
+        """Создаёт менеджер звуков с движком-заглушкой."""
+        return SoundManager(custom_paths=self.custom_paths, engine=self.mixer)
+
+    def test_load_order(self):
+        """Тест 1: Звуки загружаются по приоритету, конструктор не ждёт."""
+        sounds = self.make_manager()
+        self.assertEqual(sounds.sounds, {})
+
+        self.mixer.release.set()
+        self.assertTrue(sounds.wait_loaded(5))
+        self.assertEqual(self.mixer.loaded, list(SoundManager.LOAD_ORDER))
+
+    def test_play_while_loading(self):
+        """Тест 2: Звук, запрошенный во время загрузки, загружается
+        следующим и проигрывается после загрузки."""
+        sounds = self.make_manager()
+        self.mixer.loading.wait(5)  # идёт загрузка первого звука
+        sounds.play_param("lose")
+        self.mixer.release.set()
+        sounds.wait_loaded(5)
+
+        self.assertEqual(self.mixer.loaded[:2], ["flip", "lose"])
+        self.assertEqual(self.mixer.played, ["lose"])
+
+        sounds.play_param("win")
+        self.assertEqual(self.mixer.played, ["lose", "win"])
+
+    def test_late_sound_skipped(self):
+        """Тест 3: Сильно опоздавший звук пропускается."""
+        sounds = self.make_manager()
+        sounds.LATE_PLAY_LIMIT = -1
+        sounds.play_param("flip")
+        self.mixer.release.set()
+        sounds.wait_loaded(5)
+
+        self.assertEqual(self.mixer.played, [])
+
+    def test_unknown_sound(self):
+        """Тест 4: Неизвестный звук не проигрывается и не ломает очередь."""
+        self.mixer.release.set()
+        sounds = self.make_manager()
+        sounds.wait_loaded(5)
+        with patch("builtins.print") as mock_print:
+            sounds.play_param("boom")
+        mock_print.assert_called_once()
+        self.assertEqual(self.mixer.played, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Тесты для атласов изображений (части без Qt)"""
+
+import os
+import tempfile
+import unittest
+
+from myself_moduls.sprite_atlas import (
+    atlas_dir_for,
+    folder_signature,
+    is_atlas_fresh,
+    pack_shelves,
+)
+
+
+class TestPackShelves(unittest.TestCase):
+    """Тесты раскладки изображений в атласе."""
+
+    def test_no_overlap(self):
+        """Тест 1: Прямоугольники не пересекаются и помещаются в атлас."""
+        sizes = [(256, 256)] * 5 + [(100, 50), (30, 200)]
+        positions, width, height = pack_shelves(sizes, max_width=600)
+
+        rects = [
+            (x, y, x + w, y + h) for (x, y), (w, h) in zip(positions, sizes)
+        ]
+        for i, a in enumerate(rects):
+            self.assertLessEqual(a[2], width)
+            self.assertLessEqual(a[3], height)
+            for b in rects[i + 1:]:
+                overlap = (
+                    a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+                )
+                self.assertFalse(overlap, f"{a} пересекается с {b}")
+        self.assertLessEqual(width, 600)
+
+    def test_too_wide_error(self):
+        """Тест 2: Слишком широкое изображение вызывает ошибку."""
+        with self.assertRaises(ValueError):
+            pack_shelves([(700, 10)], max_width=600)
+
+
+class TestAtlasFreshness(unittest.TestCase):
+    """Тесты определения устаревшего атласа."""
+
+    def test_signature_and_freshness(self):
+        """Тест 3: Подпись учитывает только изображения, атлас без
+        таблицы считается устаревшим."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("b.png", "a.jpg", "notes.txt"):
+                open(os.path.join(temp_dir, name), "w").close()
+
+            names = [name for name, _, _ in folder_signature(temp_dir)]
+            self.assertEqual(names, ["a.jpg", "b.png"])
+
+            atlas_dir = atlas_dir_for(temp_dir, cache_dir=temp_dir)
+            self.assertFalse(is_atlas_fresh(temp_dir, atlas_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Тесты для StartupTimeline"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+from myself_moduls.startup_timeline import StartupTimeline
+
+
+class TestStartupTimeline(unittest.TestCase):
+    """Тесты шкалы запуска."""
+
+    def test_phase_and_mark(self):
+        """Тест 1: Фазы и отметки попадают в шкалу и в отчёт."""
+        timeline = StartupTimeline()
+        with timeline.phase("UI load"):
+            pass
+        timeline.mark("first paint")
+
+        name, start, end = timeline.get("UI load")
+        self.assertLessEqual(start, end)
+        _, start, end = timeline.get("first paint")
+        self.assertEqual(start, end)
+        self.assertIsNone(timeline.get("music load"))
+
+        report = timeline.report()
+        self.assertIn("UI load", report)
+        self.assertIn("first paint", report)
+
+    def test_track_imports(self):
+        """Тест 2: Время импорта отслеживаемого модуля записывается."""
+        timeline = StartupTimeline()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "timed_probe_mod.py"), "w") as f:
+                f.write("VALUE = 42\n")
+            sys.path.insert(0, temp_dir)
+            timeline.track_imports(prefixes=("timed_probe_",))
+            try:
+                import timed_probe_mod
+            finally:
+                timeline.stop_tracking_imports()
+                sys.path.remove(temp_dir)
+                sys.modules.pop("timed_probe_mod", None)
+
+        self.assertEqual(timed_probe_mod.VALUE, 42)
+        self.assertIsNotNone(timeline.get("import timed_probe_mod"))
+        self.assertNotIn(timeline._import_finder, sys.meta_path)
+
+    def test_import_phase_not_duplicated(self):
+        """Тест 3: Импорт, который уже замеряет track_imports, не
+        записывается второй фазой."""
+        timeline = StartupTimeline()
+        with timeline.import_phase("timed_probe_mod"):
+            pass
+        self.assertIsNotNone(timeline.get("import timed_probe_mod"))
+
+        timeline = StartupTimeline()
+        timeline.track_imports(prefixes=("timed_probe_",))
+        try:
+            with timeline.import_phase("timed_probe_mod"):
+                pass
+        finally:
+            timeline.stop_tracking_imports()
+        self.assertIsNone(timeline.get("import timed_probe_mod"))
+
+
+if __name__ == "__main__":
+    unittest.main()
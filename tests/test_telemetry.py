@@ -0,0 +1,107 @@
+"""Тесты для телеметрии ходов"""
+
+import os
+import tempfile
+import unittest
+
+from myself_moduls import telemetry
+from myself_moduls.telemetry import Telemetry, read_log, summarize
+
+
+class TestTelemetry(unittest.TestCase):
+    """Тесты кольцевого буфера и журнала телеметрии."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "log", "telemetry.ndjson")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def play(self, log):
+        """Записывает короткую партию: промах, промах, совпадение, победа."""
+        log.record(telemetry.LEVEL, 3, 4, 4, 20)
+        for first, second, kind, moves in (
+            (0, 1, telemetry.MISMATCH, 19),
+            (2, 3, telemetry.MISMATCH, 18),
+            (0, 2, telemetry.MATCH, 18),
+        ):
+            log.record(telemetry.PRESS, 3, first, moves=moves, latency=1e-4)
+            log.record(telemetry.PRESS, 3, second, moves=moves, latency=3e-4)
+            log.record(kind, 3, first, second, moves)
+        log.record(telemetry.WIN, 3, moves=18)
+
+    def test_flush_to_ndjson(self):
+        """Тест 1: События записываются в журнал в порядке записи."""
+        log = Telemetry(self.path)
+        self.play(log)
+        log.close()
+
+        events = read_log(self.path)
+
+        self.assertEqual(len(events), 11)
+        self.assertEqual(
+            events[0], dict(events[0], e="level", l=3, a=4, b=4, m=20)
+        )
+        self.assertEqual(events[1]["us"], 100.0)
+        self.assertNotIn("b", events[1])
+        self.assertEqual(events[-1]["e"], "win")
+
+    def test_batch_flush(self):
+        """Тест 2: Буфер сбрасывается автоматически пачками."""
+        log = Telemetry(self.path, capacity=8, batch=4)
+
+        for i in range(10):
+            log.record(telemetry.PRESS, 1, i)
+
+        self.assertEqual(len(log), 2)
+        log.close()
+        self.assertEqual(len(read_log(self.path)), 10)
+        self.assertEqual(log.dropped, 0)
+
+    def test_ring_overwrites_oldest(self):
+        """Тест 3: При переполнении старые события перезаписываются."""
+        log = Telemetry(self.path, capacity=4, batch=4)
+        log.batch = 100  # автоматический сброс выключен
+
+        for i in range(6):
+            log.record(telemetry.PRESS, 1, i)
+
+        self.assertEqual([e["a"] for e in log.drain()], [2, 3, 4, 5])
+        self.assertEqual(log.dropped, 2)
+
+    def test_summary(self):
+        """Тест 4: Сводка считает ходы, серии промахов и задержку."""
+        log = Telemetry(self.path)
+        self.play(log)
+        log.close()
+
+        summary = summarize(read_log(self.path))
+
+        game = summary["levels"][0]
+        self.assertEqual(
+            (game["level"], game["board"], game["moves"], game["result"]),
+            (3, "4x4", 3, "win"),
+        )
+        self.assertEqual(summary["max_streak"], 2)
+        self.assertEqual(summary["latency_us"]["count"], 6)
+        self.assertEqual(summary["latency_us"]["p50"], 300.0)
+
+    def test_latency_set_after_record(self):
+        """Тест 5: Задержку можно указать до сброса события; нажатия без
+        задержки не попадают в перцентили."""
+        log = Telemetry(self.path)
+        measured = log.record(telemetry.PRESS, 1, 0)
+        log.record(telemetry.PRESS, 1, 1)
+
+        self.assertTrue(log.set_latency(measured, 2e-3))
+        events = log.drain()
+        self.assertFalse(log.set_latency(measured, 1.0))
+
+        self.assertEqual(events[0]["us"], 2000.0)
+        self.assertNotIn("us", events[1])
+        self.assertEqual(summarize(events)["latency_us"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Тесты для ui_compiler (части без Qt)"""
+
+import os
+import tempfile
+import unittest
+
+from myself_moduls.ui_compiler import (
+    compiled_path,
+    is_compiled_fresh,
+    source_stamp,
+)
+
+
+class TestUiCompilerFreshness(unittest.TestCase):
+    """Тесты проверки актуальности скомпилированной формы."""
+
+    def test_compiled_path(self):
+        """Тест 1: Имя модуля строится из имени .ui файла."""
+        path = compiled_path("/x/ui_files/game.ui", cache_dir="/cache")
+        self.assertEqual(path, os.path.join("/cache", "game_ui.py"))
+
+    def test_fresh_and_stale(self):
+        """Тест 2: Форма устаревает при изменении .ui файла."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ui_path = os.path.join(temp_dir, "game.ui")
+            py_path = compiled_path(ui_path, cache_dir=temp_dir)
+            with open(ui_path, "w") as f:
+                f.write("<ui/>")
+            self.assertFalse(is_compiled_fresh(ui_path, py_path))
+
+            with open(py_path, "w", encoding="utf-8") as f:
+                f.write(f"# source: {source_stamp(ui_path)}\n")
+            self.assertTrue(is_compiled_fresh(ui_path, py_path))
+
+            with open(ui_path, "w") as f:
+                f.write("<ui version='4.0'/>")
+            self.assertFalse(is_compiled_fresh(ui_path, py_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
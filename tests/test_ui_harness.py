@@ -0,0 +1,135 @@
+"""Сквозные тесты настоящего окна MemoryGame (нужен PyQt5)"""
+
+import importlib.util
+import unittest
+
+HAS_QT = importlib.util.find_spec("PyQt5") is not None
+
+
+@unittest.skipUnless(HAS_QT, "нужен PyQt5")
+class TestUIHarness(unittest.TestCase):
+    """Клики по карточкам на offscreen-платформе и бюджеты."""
+
+    @classmethod
+    def setUpClass(cls):
+        from myself_moduls.ui_harness import UIHarness
+
+        cls.harness = UIHarness(null_sound=True, time_show=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.harness.close()
+
+    def test_click_flips_card(self):
+        """Тест 1: Клик мышью по card_N переворачивает карточку."""
+        harness = self.harness
+        harness.game.reset_level()
+        engine = harness.game.engine
+
+        harness.click(0)
+        harness.game.animator.finish_all()
+
+        self.assertTrue(engine.turned[0])
+        self.assertFalse(harness.card_widget(0).icon().isNull())
+        self.assertTrue(harness.paint_ms)
+        harness.game.hide_cards(0, 0)
+
+    def test_mismatch_hidden_by_timer(self):
+        """Тест 2: Несовпавшие карточки скрываются по QTimer."""
+        harness = self.harness
+        harness.game.reset_level()
+        engine = harness.game.engine
+        ids = engine.image_ids
+        other = next(i for i in range(1, len(ids)) if ids[i] != ids[0])
+        moves = engine.moves_count
+
+        harness.click(0)
+        harness.click(other)
+        harness.wait(lambda: not engine.is_checking)
+
+        self.assertEqual(engine.moves_count, moves - 1)
+        self.assertFalse(engine.turned[0] or engine.turned[other])
+        self.assertEqual(engine.turned_cards, [])
+
+    def test_levels_within_budgets(self):
+        """Тест 3: Уровни проходятся кликами в пределах бюджетов."""
+        from myself_moduls.ui_harness import check_budgets
+
+        harness = self.harness
+        harness.game.reset_level()
+        level = harness.game.current_lvl
+        played = len(harness.levels)
+
+        for _ in range(2):
+            won, seconds, clicks, paints = harness.play_level()
+            self.assertTrue(won)
+            self.assertGreaterEqual(clicks, 16)
+            self.assertGreater(paints, 0)
+
+        self.assertEqual(harness.game.current_lvl, level + 2)
+        stats = harness.stats()
+        self.assertEqual(stats["levels"], played + 2)
+        self.assertEqual(check_budgets(stats), [])
+
+    def test_press_latency_until_paint(self):
+        """Тест 4: Задержка нажатия в телеметрии измеряется до первой
+        отрисовки после клика."""
+        harness = self.harness
+        harness.game.reset_level()
+        harness.game.telemetry.drain()
+
+        harness.click(0)
+        harness.wait(lambda: not len(harness.game.press_probe))
+        harness.game.animator.finish_all()
+
+        presses = [
+            event
+            for event in harness.game.telemetry.drain()
+            if event["e"] == "press"
+        ]
+        self.assertEqual(len(presses), 1)
+        self.assertGreater(presses[0]["us"], 0)
+        harness.game.hide_cards(0, 0)
+
+    def test_card_clickable_during_flip(self):
+        """Тест 5: Во время переворота карточка видна (с тенью) и
+        получает клики; после анимации прозрачность снимается."""
+        harness = self.harness
+        harness.game.reset_level()
+        card = harness.card_widget(0)
+
+        harness.game.flip_card(0, harness.game.images[0], duration=10000)
+        parent = card.parentWidget()
+
+        self.assertTrue(card.isVisible())
+        self.assertTrue(card.graphicsEffect().isEnabled())
+        self.assertIs(parent.childAt(card.geometry().center()), card)
+        harness.click(0)
+        self.assertTrue(harness.game.engine.turned[0])
+
+        harness.game.animator.finish_all()
+        self.assertFalse(card.graphicsEffect().isEnabled())
+        harness.game.hide_cards(0, 0)
+        harness.game.animator.finish_all()
+
+    def test_last_press_of_level_has_latency(self):
+        """Тест 6: Журнал уровня сбрасывается после отрисовки, так что
+        у последнего нажатия уровня есть задержка."""
+        from myself_moduls.telemetry import read_log
+
+        harness = self.harness
+        harness.game.reset_level()
+        won, _, _, _ = harness.play_level()
+        self.assertTrue(won)
+        harness.game.telemetry.close()  # дождаться фоновой записи
+
+        events = read_log(harness.game.telemetry.path)
+        end = max(i for i, event in enumerate(events) if event["e"] == "win")
+        last = next(
+            event for event in reversed(events[:end]) if event["e"] == "press"
+        )
+        self.assertIn("us", last)
+
+
+if __name__ == "__main__":
+    unittest.main()